@@ -0,0 +1,250 @@
+"""Deck generator benchmark suite.
+
+Usage:
+    python scripts/bench-deck.py                      # run all, compare to baseline
+    python scripts/bench-deck.py --only suistody
+    python scripts/bench-deck.py --update-baseline
+    python scripts/bench-deck.py --only audit-5k-stream --update-baseline
+    python scripts/bench-deck.py --only suistody-1k-split --jobs 8
+
+Each scenario runs in a fresh interpreter so peak RSS belongs to that deck
+alone. Recorded per scenario: build time per slide layout, total build and
+write time, peak RSS, shape count, slide XML bytes and .pptx size. Metrics
+that regress more than ``--threshold`` over the stored baseline fail the run
+(exit 1). Everything runs offline. ``*-stream`` scenarios go through
+``stream_deck`` into a temporary file, and ``*-split`` scenarios through
+``render_split`` with ``--jobs`` workers; their build time includes writing.
+
+Timings are machine-specific: refresh the baseline with ``--update-baseline``
+on the machine that runs the gate.
+"""
+import argparse
+import io
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+from collections import defaultdict
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+BASELINE = SCRIPTS_DIR / "bench-baseline.json"
+
+SCENARIOS = ("suistody", "suistody-1k-slides", "grid-10k-shapes", "audit-log-5k-rows",
+             "audit-charts-300k-points", "audit-5k-stream", "suistody-1k-split")
+
+# Metrics compared against the baseline; lower is better for all of them.
+GATED = ("build_ms", "write_ms", "peak_rss_mb", "xml_bytes", "pptx_bytes")
+
+
+def chart_deck(events):
+    from array import array
+
+    from pptgen.audit import audit_charts, record_history
+    from pptgen.spec import DeckSpec
+    from pptgen.synthetic import audit_events
+
+    history = array("q")
+    for _ in record_history(audit_events(events), history):
+        pass
+    return DeckSpec("audit_charts", audit_charts(history))
+
+
+def scenario_spec(name):
+    from pptgen.audit import audit_log
+    from pptgen.spec import DEFAULT_SPEC, DeckSpec, load_spec
+    from pptgen.synthetic import audit_events, grid_deck, scaled_deck
+
+    return {
+        "suistody": lambda: load_spec(DEFAULT_SPEC),
+        "suistody-1k-slides": lambda: scaled_deck(1000),
+        "suistody-1k-split": lambda: scaled_deck(1000),
+        "grid-10k-shapes": lambda: grid_deck(10_000),
+        "audit-log-5k-rows": lambda: DeckSpec("audit_log", [audit_log(audit_events(5000))]),
+        "audit-charts-300k-points": lambda: chart_deck(300_000),
+    }[name]()
+
+
+def stream_slides(name):
+    from pptgen.audit import audit_slides
+    from pptgen.synthetic import audit_events
+
+    return {
+        "audit-5k-stream": lambda: audit_slides(audit_events(5000)),
+    }[name]()
+
+
+def package_metrics(path, slides, build_ms):
+    """Metrics of a package written straight to ``path`` (build time includes the write)."""
+    shapes = 0
+    xml_bytes = []
+    with zipfile.ZipFile(path) as zf:
+        for info in zf.infolist():
+            if info.filename.startswith("ppt/slides/slide"):
+                shapes += zf.read(info).count(b"<p:sp>")
+                xml_bytes.append(info.file_size)
+
+    return {
+        "slides": slides,
+        "shapes": shapes,
+        "build_ms": round(build_ms, 1),
+        "write_ms": 0.0,
+        "per_layout_ms": {},
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "xml_bytes": sum(xml_bytes),
+        "xml_bytes_per_slide_max": max(xml_bytes),
+        "pptx_bytes": path.stat().st_size,
+    }
+
+
+def run_stream_scenario(name):
+    """Stream one scenario to a temporary file and return its metrics."""
+    from pptgen.render import stream_deck, warm_up
+
+    warm_up()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "deck.pptx"
+        start = time.perf_counter()
+        slides = stream_deck(stream_slides(name), path)
+        return package_metrics(path, slides, (time.perf_counter() - start) * 1000)
+
+
+def run_split_scenario(name, workers):
+    """Render one scenario's slide ranges across ``workers`` and merge them."""
+    from pptgen.batch import render_split
+
+    spec = scenario_spec(name)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "deck.pptx"
+        start = time.perf_counter()
+        render_split(spec, path, workers)
+        build_ms = (time.perf_counter() - start) * 1000
+        with zipfile.ZipFile(path) as zf:
+            slides = sum(n.startswith("ppt/slides/slide") for n in zf.namelist())
+        return package_metrics(path, slides, build_ms)
+
+
+def run_scenario(name):
+    """Build one scenario in this process and return its metrics."""
+    from pptgen.render import new_presentation, warm_up
+    from pptgen.slides import build_slide
+    from pptgen.writer import write_package
+
+    spec = scenario_spec(name)
+    warm_up()
+    prs = new_presentation()
+    per_layout = defaultdict(lambda: [0, 0.0])
+
+    start = time.perf_counter()
+    for slide_spec in spec.slides:
+        t = time.perf_counter()
+        build_slide(prs, slide_spec)
+        stats = per_layout[slide_spec.layout]
+        stats[0] += 1
+        stats[1] += time.perf_counter() - t
+    build_ms = (time.perf_counter() - start) * 1000
+
+    shapes = 0
+    xml_bytes = []
+    for slide in prs.slides:
+        shapes += len(slide.shapes._spTree.xpath("./p:sp|./p:pic|./p:graphicFrame|./p:grpSp"))
+        xml_bytes.append(len(slide.part.blob))
+
+    out = io.BytesIO()
+    start = time.perf_counter()
+    write_package(prs, out)
+    write_ms = (time.perf_counter() - start) * 1000
+
+    return {
+        "slides": len(prs.slides),
+        "shapes": shapes,
+        "build_ms": round(build_ms, 1),
+        "write_ms": round(write_ms, 1),
+        "per_layout_ms": {k: round(v[1] * 1000 / v[0], 3) for k, v in sorted(per_layout.items())},
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "xml_bytes": sum(xml_bytes),
+        "xml_bytes_per_slide_max": max(xml_bytes),
+        "pptx_bytes": len(out.getvalue()),
+    }
+
+
+def measure(name, jobs=None):
+    extra = ["--jobs", str(jobs)] if jobs else []
+    proc = subprocess.run([sys.executable, __file__, "--run-scenario", name, *extra],
+                          cwd=SCRIPTS_DIR, check=True, capture_output=True, text=True)
+    return json.loads(proc.stdout)
+
+
+def compare(name, result, baseline, threshold):
+    failures = []
+    for metric in GATED:
+        if metric not in baseline:
+            continue
+        limit = baseline[metric] * (1 + threshold)
+        if result[metric] > limit:
+            failures.append(f"{name}: {metric} {result[metric]} > {limit:.1f} "
+                            f"(baseline {baseline[metric]})")
+    return failures
+
+
+def report(name, r):
+    print(f"\n== {name}: {r['slides']} slides, {r['shapes']} shapes")
+    print(f"  build {r['build_ms']:.0f} ms   write {r['write_ms']:.0f} ms   "
+          f"peak RSS {r['peak_rss_mb']:.0f} MB")
+    print(f"  slide XML {r['xml_bytes'] / 1024:.0f} KB "
+          f"(max {r['xml_bytes_per_slide_max'] / 1024:.1f} KB/slide)   "
+          f".pptx {r['pptx_bytes'] / 1024:.0f} KB")
+    for layout, ms in r["per_layout_ms"].items():
+        print(f"    {layout:14s} {ms:8.2f} ms/slide")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", action="append", choices=SCENARIOS,
+                        help="run just this scenario (repeatable)")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed regression over baseline (default: 0.25 = 25%%)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="store these results as the new baseline")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="workers for *-split scenarios (default: CPU count)")
+    parser.add_argument("--run-scenario", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_scenario:
+        name = args.run_scenario
+        if name.endswith("-split"):
+            result = run_split_scenario(name, args.jobs)
+        elif name.endswith("-stream"):
+            result = run_stream_scenario(name)
+        else:
+            result = run_scenario(name)
+        json.dump(result, sys.stdout)
+        return 0
+
+    baselines = json.loads(BASELINE.read_text()) if BASELINE.exists() else {}
+    failures = []
+    for name in args.only or SCENARIOS:
+        result = measure(name, args.jobs)
+        report(name, result)
+        if args.update_baseline:
+            baselines[name] = result
+        elif name in baselines:
+            failures += compare(name, result, baselines[name], args.threshold)
+
+    if args.update_baseline:
+        BASELINE.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+        print(f"\n[OK] Baseline written to {BASELINE}")
+    elif failures:
+        print("\n[FAIL] Regressions:")
+        for line in failures:
+            print(f"  {line}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""Cold-start check for the deck generator CLI.
+
+Usage:
+    python scripts/bench-startup.py [--runs 7]
+
+Times fresh interpreter processes for each scenario and compares the best
+run, minus a bare ``python -c pass``, to its target. Exits 1 if any scenario
+is over target, so it can gate CI.
+"""
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+CLI = str(SCRIPTS_DIR / "create-ppt.py")
+
+# name -> (argv after the interpreter, target overhead in ms)
+SCENARIOS = {
+    "import pptgen": (["-c", "import pptgen"], 60),
+    "create-ppt --help": ([CLI, "--help"], 100),
+    "render 1 slide": ([CLI, "--slides", "1", "--no-cache", "-j", "1", "-o", "{out}"], 600),
+}
+
+
+def best_of(argv, runs):
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *argv], cwd=SCRIPTS_DIR, check=True,
+                       stdout=subprocess.DEVNULL)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7)
+    args = parser.parse_args()
+
+    baseline = best_of(["-c", "pass"], args.runs)
+    print(f"{'python -c pass':20s} {baseline:7.0f} ms")
+    failed = False
+    with tempfile.TemporaryDirectory() as tmp:
+        out = str(Path(tmp) / "deck.pptx")
+        for name, (argv, target) in SCENARIOS.items():
+            overhead = best_of([a.format(out=out) for a in argv], args.runs) - baseline
+            status = "ok" if overhead <= target else "OVER"
+            failed |= overhead > target
+            print(f"{name:20s} {overhead:+7.0f} ms  (target +{target} ms)  {status}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""Micro-benchmark: compiled paragraph styles vs per-property font setters.
+
+Usage:
+    python scripts/bench-text-styles.py [--paragraphs 5000] [--repeat 5]
+
+Both variants add the same text frames and paragraphs with the style
+combinations the Suistody deck uses most; only the way formatting is applied
+differs. Reports the best-of-N time per paragraph.
+"""
+import argparse
+import time
+
+from pptx.enum.text import PP_ALIGN
+from pptx.util import Inches, Pt
+
+from pptgen.helpers import add_para, add_text
+from pptgen.render import new_presentation
+from pptgen.theme import ACCENT, GRAY, LIGHT_GRAY, MONO_FONT, WHITE
+
+# (size, color, bold, alignment, font)
+COMBOS = [
+    (16, LIGHT_GRAY, False, PP_ALIGN.LEFT, MONO_FONT),
+    (40, WHITE, True, PP_ALIGN.LEFT, "Segoe UI"),
+    (18, LIGHT_GRAY, False, PP_ALIGN.CENTER, "Segoe UI"),
+    (14, GRAY, False, PP_ALIGN.CENTER, "Segoe UI"),
+    (22, ACCENT, True, PP_ALIGN.LEFT, "Segoe UI"),
+]
+PARAS_PER_BOX = 10
+
+
+def legacy_add_text(slide, left, top, width, height, text, font_size=18,
+                    color=WHITE, bold=False, alignment=PP_ALIGN.LEFT,
+                    font_name="Segoe UI"):
+    txBox = slide.shapes.add_textbox(left, top, width, height)
+    tf = txBox.text_frame
+    tf.word_wrap = True
+    p = tf.paragraphs[0]
+    p.text = text
+    p.font.size = Pt(font_size)
+    p.font.color.rgb = color
+    p.font.bold = bold
+    p.font.name = font_name
+    p.alignment = alignment
+    return tf
+
+
+def legacy_add_para(tf, text, font_size=18, color=WHITE, bold=False,
+                    alignment=PP_ALIGN.LEFT, font_name="Segoe UI", space_before=Pt(6)):
+    p = tf.add_paragraph()
+    p.text = text
+    p.font.size = Pt(font_size)
+    p.font.color.rgb = color
+    p.font.bold = bold
+    p.font.name = font_name
+    p.alignment = alignment
+    p.space_before = space_before
+    return p
+
+
+def run(add_text_fn, add_para_fn, paragraphs):
+    prs = new_presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    start = time.perf_counter()
+    done = 0
+    while done < paragraphs:
+        size, color, bold, align, font = COMBOS[done // PARAS_PER_BOX % len(COMBOS)]
+        tf = add_text_fn(slide, Inches(1), Inches(1), Inches(4), Inches(1),
+                         "benchmark line", size, color, bold, align, font)
+        for _ in range(PARAS_PER_BOX - 1):
+            add_para_fn(tf, "benchmark line", size, color, bold, align, font)
+        done += PARAS_PER_BOX
+    return (time.perf_counter() - start) / done
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paragraphs", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    legacy = min(run(legacy_add_text, legacy_add_para, args.paragraphs)
+                 for _ in range(args.repeat))
+    compiled = min(run(add_text, add_para, args.paragraphs)
+                   for _ in range(args.repeat))
+    print(f"per-property setters: {legacy * 1e6:8.1f} us/paragraph")
+    print(f"compiled styles:      {compiled * 1e6:8.1f} us/paragraph")
+    print(f"speedup:              {legacy / compiled:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
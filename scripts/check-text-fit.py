@@ -0,0 +1,88 @@
+"""Report text boxes whose text does not fit.
+
+Usage:
+    python scripts/check-text-fit.py                     # default deck spec
+    python scripts/check-text-fit.py deck.json Suistody_Presentation.pptx
+    python scripts/check-text-fit.py --font-dir ~/fonts/segoe
+
+Each input is a deck spec (rendered in-process, without the slide cache) or a
+built .pptx. Every text box is measured with the cached font metrics in
+``pptgen/metrics.py``; boxes whose text runs past the bottom or, for
+non-wrapping boxes, the right edge are listed with the font size at which they
+would fit. Boxes that grow with their text (as ``add_text`` makes them) are
+checked against the room below them: down to the bottom of the card they sit
+on, the top of the next shape below or the bottom of the slide. Overflows
+within ``--tolerance`` are ignored; exits 1 on any other.
+
+Without the deck's fonts installed, metrically similar stand-ins scaled to the
+deck font's widths are used (see ``FONT_FILES``); add the real font files with
+``--font-dir`` for exact results.
+"""
+import argparse
+import math
+import sys
+import time
+from pathlib import Path
+
+from pptgen import DEFAULT_SPEC
+
+EMU_PER_INCH = 914400
+DEFAULT_TOLERANCE = 0.02  # inches; stand-in metrics are not exact
+
+
+def load_presentation(path):
+    if path.suffix == ".pptx":
+        from pptx import Presentation
+
+        return Presentation(str(path))
+    from pptgen import load_spec, render_deck
+
+    return render_deck(load_spec(path))
+
+
+def describe(box, over_y, over_x, scale):
+    para = box.paragraphs[0]
+    where = []
+    if over_y > 0:
+        where.append(f"grows {over_y / EMU_PER_INCH:.2f}in past {box.bound}" if box.grows
+                     else f"{over_y / EMU_PER_INCH:.2f}in past the bottom")
+    if over_x > 0:
+        where.append(f"{over_x / EMU_PER_INCH:.2f}in past the right edge")
+    fix = (f"fits at {math.floor(para.size * scale * 2) / 2:g}pt" if scale is not None
+           else "does not fit at any size")
+    text = para.text if len(para.text) <= 40 else para.text[:37] + "..."
+    return f"slide {box.slide} {box.name!r} ({text!r}, {para.size:g}pt): {', '.join(where)}; {fix}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("inputs", nargs="*", type=Path, default=[DEFAULT_SPEC],
+                        help="deck spec JSON or .pptx files (default: the Suistody deck)")
+    parser.add_argument("--font-dir", action="append", type=Path, default=[],
+                        help="extra directory to search for font files (repeatable)")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, metavar="IN",
+                        help=f"ignore overflows up to this many inches "
+                             f"(default: {DEFAULT_TOLERANCE})")
+    args = parser.parse_args()
+
+    from pptgen import metrics
+
+    metrics.FONT_DIRS[:0] = [d.expanduser() for d in args.font_dir]
+    failed = False
+    for path in args.inputs:
+        prs = load_presentation(path)
+        start = time.perf_counter()
+        boxes = list(metrics.text_boxes(prs))
+        report = metrics.check_overflow(boxes, round(args.tolerance * EMU_PER_INCH))
+        elapsed = time.perf_counter() - start
+        for row in report:
+            print(f"[WARN] {describe(*row)}")
+        status = "[ERROR]" if report else "[OK]"
+        print(f"{status} {path.name}: {len(report)} of {len(boxes)} text boxes overflow "
+              f"({elapsed * 1000:.0f} ms)")
+        failed |= bool(report)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""Report slides and shapes added, removed, moved or restyled between two decks.
+
+Usage:
+    python scripts/diff-deck.py old.pptx Suistody_Presentation.pptx
+    python scripts/diff-deck.py main.pptx branch.pptx --summary     # CI: counts only
+
+Shapes are compared by normalized content, style and geometry hashes, so
+renumbered shape ids, part names and relationship ids do not count as
+changes (see ``pptgen/diff.py``). Exits 1 when the decks differ, like
+diff(1), and 2 when one cannot be read.
+"""
+import argparse
+import sys
+import time
+import zipfile
+from collections import Counter
+from pathlib import Path
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("old", type=Path, help="the .pptx to compare against")
+    parser.add_argument("new", type=Path, help="the changed .pptx")
+    parser.add_argument("-s", "--summary", action="store_true",
+                        help="print only the summary line")
+    return parser.parse_args(argv)
+
+
+def _slide(change):
+    if change.kind == "added":
+        return f"slide {change.new} added"
+    if change.kind == "removed":
+        return f"slide {change.old} removed"
+    was = f" (was {change.old})" if change.old != change.new else ""
+    return f"slide {change.new}{was} {'moved' if change.kind == 'moved' else 'changed'}"
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    from pptgen.diff import diff_decks, read_deck
+
+    start = time.perf_counter()
+    try:
+        old, new = read_deck(args.old), read_deck(args.new)
+    except (OSError, KeyError, StopIteration, zipfile.BadZipFile) as e:
+        print(f"[ERROR] {e or type(e).__name__}", file=sys.stderr)
+        return 2
+    changes = diff_decks(old, new)
+    elapsed = time.perf_counter() - start
+
+    if not args.summary:
+        for change in changes:
+            print(f"[WARN] {_slide(change)}: {change.title!r}")
+            for shape in change.shapes:
+                detail = f": {shape.detail}" if shape.detail else ""
+                print(f"         {shape.kind} {shape.label}{detail}")
+    counts = Counter(change.kind for change in changes)
+    status = "[WARN]" if changes else "[OK]"
+    print(f"{status} {args.old} -> {args.new}: {len(old)} -> {len(new)} slides; "
+          f"{counts['changed']} changed, {counts['added']} added, {counts['removed']} removed, "
+          f"{counts['moved']} moved ({elapsed * 1000:.0f} ms)")
+    return 1 if changes else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""Export a vault's on-chain audit trail as a deck, one slide per withdrawal.
+
+Usage:
+    python scripts/export-audit.py events.jsonl -o audit.pptx
+    python scripts/export-audit.py - -o - --network mainnet < events.jsonl > audit.pptx
+    python scripts/export-audit.py --synthetic 20000 -o audit-20k.pptx
+    python scripts/export-audit.py events.jsonl --log -o transactions.pptx
+    python scripts/export-audit.py events.jsonl --charts --cooldown-ms 60000 -o audit.pptx
+
+Events are ``VaultEvent`` objects (see ``lib/vault/types.ts``), one JSON object
+per line. Slides are streamed into the package as they are built and then
+released, so memory stays flat for exports of tens of thousands of slides.
+``--log`` lists the events in one native table instead, continued across as
+many slides as it needs. ``--charts`` appends budget-burn and spend-per-cooldown
+charts, downsampled to ``--points`` so their size does not grow with the history.
+"""
+import argparse
+import resource
+import sys
+import time
+from array import array
+
+from pptgen.writer import COMPRESSION_PRESETS, DEFAULT_COMPRESSION, is_file_target
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("events", nargs="?",
+                        help="JSON Lines file of VaultEvent objects, or '-' for stdin")
+    parser.add_argument("-o", "--output", required=True,
+                        help="output path, '-', tcp://host:port or unix:/path")
+    parser.add_argument("--network", default="testnet",
+                        help="Sui network for SuiScan links (default: testnet)")
+    parser.add_argument("--title", default="AUDIT TRAIL",
+                        help="title slide heading ('' for no title slide)")
+    parser.add_argument("--log", action="store_true",
+                        help="one transaction table instead of a slide per event")
+    parser.add_argument("--charts", action="store_true",
+                        help="append budget burn and spend per cooldown window charts")
+    parser.add_argument("--cooldown-ms", type=int, default=60_000,
+                        help="vault cooldown, the chart's spend window (default: 60000)")
+    parser.add_argument("--points", type=int, default=500,
+                        help="max points per chart series (default: 500)")
+    parser.add_argument("--compression", choices=sorted(COMPRESSION_PRESETS),
+                        default=DEFAULT_COMPRESSION, help="ZIP compression preset")
+    parser.add_argument("--synthetic", type=int, metavar="N",
+                        help="export N generated events instead (for load testing)")
+    args = parser.parse_args()
+    if (args.events is None) == (args.synthetic is None):
+        parser.error("give an events file or --synthetic N")
+
+    from pptgen.audit import audit_log, audit_slides, read_events, record_history, with_charts
+    from pptgen.render import stream_deck
+
+    if args.synthetic is not None:
+        from pptgen.synthetic import audit_events
+
+        events = audit_events(args.synthetic)
+    else:
+        events = read_events(args.events)
+    if args.charts:
+        history = array("q")
+        events = record_history(events, history)
+    log = sys.stderr if args.output == "-" else sys.stdout
+
+    start = time.perf_counter()
+    try:
+        if args.log:
+            slides = [audit_log(events, args.network, args.title or "TRANSACTION LOG")]
+        else:
+            slides = audit_slides(events, args.network, args.title)
+        if args.charts:
+            slides = with_charts(slides, history, args.cooldown_ms, args.points)
+        count = stream_deck(slides, args.output, compression=args.compression)
+    except (KeyError, ValueError) as e:
+        print(f"[ERROR] Bad event: {e}", file=sys.stderr)
+        if is_file_target(args.output):
+            print(f"[ERROR] {args.output} is incomplete", file=sys.stderr)
+        return 1
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"[OK] Saved {count} slides to {args.output} in {time.perf_counter() - start:.1f}s "
+          f"(peak RSS {peak_mb:.0f} MB)", file=log)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
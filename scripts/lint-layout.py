@@ -0,0 +1,64 @@
+"""Report shapes that overlap unintentionally or leave the slide.
+
+Usage:
+    python scripts/lint-layout.py                        # default deck spec
+    python scripts/lint-layout.py deck.json Suistody_Presentation.pptx
+    python scripts/lint-layout.py --margin 0.3           # also flag the outer 0.3in
+
+Each input is a deck spec (rendered in-process, without the slide cache) or a
+built .pptx. ``pptgen/lint.py`` indexes every shape's bounding box per slide
+and reports partial overlaps (nesting a shape entirely inside another is
+fine), text-bearing shapes that overlap at all, and shapes past the slide
+edges or inside ``--margin``. Exits 1 when anything is reported.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from pptgen import DEFAULT_SPEC
+
+EMU_PER_INCH = 914400
+EMU_PER_PT = 12700
+
+
+def load_presentation(path):
+    if path.suffix == ".pptx":
+        from pptx import Presentation
+
+        return Presentation(str(path))
+    from pptgen import load_spec, render_deck
+
+    return render_deck(load_spec(path))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("inputs", nargs="*", type=Path, default=[DEFAULT_SPEC],
+                        help="deck spec JSON or .pptx files (default: the Suistody deck)")
+    parser.add_argument("--margin", type=float, default=0.0,
+                        help="inches along each slide edge to keep clear (default: 0)")
+    parser.add_argument("--tolerance", type=float, default=0.5,
+                        help="overlap in points to ignore (default: 0.5)")
+    args = parser.parse_args()
+
+    from pptgen.lint import lint
+
+    failed = False
+    for path in args.inputs:
+        prs = load_presentation(path)
+        start = time.perf_counter()
+        issues = lint(prs, round(args.tolerance * EMU_PER_PT), round(args.margin * EMU_PER_INCH))
+        elapsed = time.perf_counter() - start
+        for issue in issues:
+            shapes = " / ".join(repr(name) for name in issue.shapes)
+            print(f"[WARN] slide {issue.slide} {issue.kind}: {shapes} ({issue.detail})")
+        status = "[ERROR]" if issues else "[OK]"
+        print(f"{status} {path.name}: {len(issues)} layout issues on {len(prs.slides)} slides "
+              f"({elapsed * 1000:.0f} ms)")
+        failed |= bool(issues)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""Shrink built decks by dropping unused parts and markup that restates inherited defaults.
+
+Usage:
+    python scripts/optimize-deck.py Suistody_Presentation.pptx          # in place
+    python scripts/optimize-deck.py deck.pptx -o deck.min.pptx
+    python scripts/optimize-deck.py build/*.pptx --quiet --deterministic
+
+See ``pptgen/optimize.py`` for what is removed. The slides look the same in
+``preview-deck.py`` and measure the same in ``check-text-fit.py`` before and
+after. Prints the uncompressed bytes saved per part (``--quiet``: totals only)
+and each deck's size on disk before and after.
+"""
+import argparse
+import io
+import os
+import sys
+import time
+import zipfile
+from pathlib import Path
+
+from pptgen.writer import COMPRESSION_PRESETS, DEFAULT_COMPRESSION
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("inputs", nargs="+", type=Path, help=".pptx files")
+    parser.add_argument("-o", "--output", type=Path,
+                        help="write here instead of replacing the input (one input only)")
+    parser.add_argument("--compression", choices=sorted(COMPRESSION_PRESETS),
+                        default=DEFAULT_COMPRESSION, help="ZIP compression preset")
+    parser.add_argument("--deterministic", action="store_true",
+                        help="byte-identical output for identical inputs; prints a SHA-256")
+    parser.add_argument("-q", "--quiet", action="store_true",
+                        help="print one line per deck instead of one per part")
+    args = parser.parse_args(argv)
+    if args.output and len(args.inputs) != 1:
+        parser.error("--output needs exactly one input")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    from pptgen.optimize import optimize_package
+
+    for path in args.inputs:
+        src = path.read_bytes()
+        out = io.BytesIO()
+        start = time.perf_counter()
+        try:
+            savings, etag = optimize_package(src, out, args.compression, args.deterministic)
+        except (KeyError, ValueError, zipfile.BadZipFile) as e:
+            print(f"[ERROR] {path}: {e}", file=sys.stderr)
+            return 1
+        elapsed = time.perf_counter() - start
+
+        target = args.output or path
+        tmp = target.with_name(target.name + ".tmp")
+        tmp.write_bytes(out.getvalue())
+        os.replace(tmp, target)
+
+        if not args.quiet:
+            for part in savings:
+                if part.after:
+                    print(f"[OK] {part.name}: {part.before} -> {part.after} bytes "
+                          f"(-{part.saved / part.before:.1%})")
+                else:
+                    print(f"[OK] {part.name}: dropped ({part.before} bytes)")
+        before, after = len(src), out.tell()
+        dropped = sum(1 for part in savings if not part.after)
+        digest = f", sha256 {etag}" if etag else ""
+        print(f"[OK] {target}: {before / 1024:.1f} KB -> {after / 1024:.1f} KB "
+              f"(-{1 - after / before:.1%}); {len(savings) - dropped} parts rewritten, "
+              f"{dropped} dropped, {sum(part.saved for part in savings)} bytes uncompressed "
+              f"({elapsed * 1000:.0f} ms{digest})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
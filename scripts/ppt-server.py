@@ -0,0 +1,53 @@
+"""Run the warm deck render server.
+
+Usage:
+    python scripts/ppt-server.py                          # 127.0.0.1:8765
+    python scripts/ppt-server.py --listen unix:/tmp/pptgen.sock --concurrency 4
+
+    curl --data-binary @scripts/pptgen/decks/suistody.json \
+         -o deck.pptx http://127.0.0.1:8765/render
+"""
+import argparse
+import sys
+
+from pptgen.server import RenderService, make_server
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--listen", default="127.0.0.1:8765",
+                        help="host:port or unix:/path (default: 127.0.0.1:8765)")
+    parser.add_argument("--concurrency", type=int, default=None,
+                        help="renders running at once (default: CPU count)")
+    parser.add_argument("--queue-depth", type=int, default=16,
+                        help="renders allowed to wait before requests get 503")
+    parser.add_argument("--cache-dir",
+                        help="slide cache directory shared by all renders")
+    parser.add_argument("--asset-root",
+                        help="directory spec image paths are relative to "
+                             "(default: specs with images are rejected)")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="log every request")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    service = RenderService(args.concurrency, args.queue_depth, args.cache_dir,
+                            args.asset_root)
+    service.start()
+    server = make_server(service, args.listen, args.verbose)
+    print(f"[OK] Listening on {args.listen} "
+          f"({service.concurrency} workers, queue {service.queue_depth})", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
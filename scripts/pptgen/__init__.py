@@ -0,0 +1,25 @@
+"""Spec-driven PowerPoint deck generator for Suistody.
+
+Importing the package is cheap: python-pptx, lxml and NumPy are only loaded
+when a render starts (first use of ``render_deck``/``build_deck`` or of the
+builder modules).
+"""
+from .spec import DEFAULT_SPEC, DeckSpec, SlideSpec, load_spec
+
+_LAZY = {"build_deck": "render", "render_deck": "render"}
+
+__all__ = [
+    "DEFAULT_SPEC",
+    "DeckSpec",
+    "SlideSpec",
+    "build_deck",
+    "load_spec",
+    "render_deck",
+]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        from importlib import import_module
+        return getattr(import_module(f".{_LAZY[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,175 @@
+"""Audit-trail decks: one slide per on-chain ``AgentWithdrawal`` event.
+
+Events have the ``VaultEvent`` shape from ``lib/vault/types.ts`` (camelCase,
+amounts in MIST, timestamps in milliseconds), the same data the dashboard's
+On-Chain Audit Trail shows. ``read_events`` takes JSON Lines, one event per
+line, so exports of any length are read lazily; feed ``audit_slides`` to
+``stream_deck`` to render them in constant memory. ``audit_log`` instead puts
+every event in one paginated transaction table.
+
+``record_history`` keeps four integers per event while the events stream past,
+and ``audit_charts`` turns that history into budget-burn and spend-per-cooldown
+charts at the end (``with_charts`` appends them to a stream of slides).
+"""
+import json
+import math
+import sys
+from datetime import datetime, timezone
+
+from .spec import SlideSpec
+
+# lib/constants.ts
+ACTION_LABELS = {0: "Swap", 1: "Stable Mint", 2: "Stable Burn", 3: "Stable Claim"}
+MIST_PER_SUI = 1_000_000_000
+HISTORY_FIELDS = ("timestamp", "amount", "totalSpent", "remainingBudget")
+
+
+def read_events(path):
+    """Yield events from a JSON Lines file (``-`` for stdin)."""
+    f = sys.stdin if str(path) == "-" else open(path, encoding="utf-8")
+    with f:
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{number}: {e.msg}") from None
+
+
+def truncate_digest(digest):
+    return digest if len(digest) <= 16 else f"{digest[:8]}...{digest[-6:]}"
+
+
+def _sui(mist):
+    return f"{int(mist) / MIST_PER_SUI:.4f} SUI"
+
+
+def _when(event):
+    timestamp = int(event.get("timestamp", 0))
+    return (datetime.fromtimestamp(timestamp / 1000, timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+            if timestamp > 0 else "--")
+
+
+def _action(event):
+    action = int(event["actionType"])
+    return ACTION_LABELS.get(action, f"Action {action}")
+
+
+def audit_slide(event, network="testnet"):
+    return SlideSpec(
+        layout="audit",
+        title=f"WITHDRAWAL #{event['txCount']}",
+        subtitle=_when(event),
+        items=[
+            ["Action", _action(event), "WHITE"],
+            ["Amount", _sui(event["amount"]), "ACCENT"],
+            ["Total spent", _sui(event["totalSpent"]), "AMBER"],
+            ["Remaining budget", _sui(event["remainingBudget"]), "GREEN"],
+            ["Transaction", truncate_digest(event["txDigest"]), "LIGHT_GRAY"],
+        ],
+        note=f"https://suiscan.xyz/{network}/tx/{event['txDigest']}",
+    )
+
+
+def audit_slides(events, network="testnet", title=None):
+    """Slide specs for ``events``: an optional title slide, then one per event."""
+    if title:
+        yield SlideSpec(layout="hero", title=title, subtitle="On-Chain Audit Trail",
+                        options={"tagline": f"AgentWithdrawal events on Sui {network}",
+                                 "badge": "Every withdrawal, verifiable on SuiScan"})
+    for event in events:
+        yield audit_slide(event, network)
+
+
+LOG_COLUMNS = [
+    {"header": "#", "width": 0.8, "align": "right", "color": "GRAY"},
+    {"header": "Time", "width": 2.6, "font": "Consolas", "color": "GRAY"},
+    {"header": "Action", "width": 1.6},
+    {"header": "Amount", "width": 2.0, "align": "right", "font": "Consolas"},
+    {"header": "Remaining", "width": 2.4, "align": "right", "font": "Consolas"},
+    {"header": "Transaction", "width": 2.9, "font": "Consolas", "color": "LIGHT_GRAY"},
+]
+
+
+def audit_log(events, network="testnet", title="TRANSACTION LOG"):
+    """One ``table`` slide spec listing every event; it paginates when built."""
+    rows = [[str(event["txCount"]), _when(event), _action(event), _sui(event["amount"]),
+             _sui(event["remainingBudget"]), truncate_digest(event["txDigest"]),
+             "ACCENT" if int(event["actionType"]) == 0 else "WHITE"]
+            for event in events]
+    return SlideSpec(layout="table", title=title, subtitle=f"AgentWithdrawal events on Sui {network}",
+                     items=rows, options={"columns": LOG_COLUMNS, "row_height": 0.3, "size": 11})
+
+
+# ============================================================
+# Charts
+# ============================================================
+def record_history(events, history):
+    """Pass ``events`` through, appending their ``HISTORY_FIELDS`` to ``history``.
+
+    ``history`` is an ``array("q")``; it grows by 32 bytes per event.
+    """
+    for event in events:
+        history.extend(int(event.get(name, 0)) for name in HISTORY_FIELDS)
+        yield event
+
+
+def audit_charts(history, cooldown_ms=60_000, points=500):
+    """Budget-burn and spend-per-cooldown-window chart slides for a recorded history.
+
+    Windows are ``cooldown_ms`` long, counted from the first event; when there
+    are more than ``points`` of them, runs of adjacent windows are merged so
+    the column chart keeps at most ``points`` columns.
+    """
+    import numpy as np
+
+    from .charts import excel_date
+
+    data = np.frombuffer(history, dtype=np.int64).reshape(-1, len(HISTORY_FIELDS))
+    if not len(data):
+        return []
+    data = data[np.argsort(data[:, 0], kind="stable")]
+    when, amount, spent, remaining = data.T
+    days = excel_date(when).tolist()
+    burn = SlideSpec(
+        layout="chart",
+        title="BUDGET BURN",
+        subtitle=f"{len(data):,} withdrawals, {_sui(spent[-1])} spent",
+        options={
+            "series": [
+                {"name": "Remaining budget", "x": days, "y": (remaining / MIST_PER_SUI).tolist(),
+                 "color": "GREEN"},
+                {"name": "Total spent", "x": days, "y": (spent / MIST_PER_SUI).tolist(),
+                 "color": "AMBER"},
+            ],
+            "points": points,
+            "x_format": "mm-dd hh:mm",
+        },
+    )
+
+    windows = (when - when[0]) // cooldown_ms
+    merge = max(1, math.ceil((int(windows[-1]) + 1) / points))
+    totals = np.bincount(windows // merge, weights=amount / MIST_PER_SUI)
+    starts = when[0] + np.arange(len(totals)) * merge * cooldown_ms
+    window_s = merge * cooldown_ms / 1000
+    spend = SlideSpec(
+        layout="chart",
+        title="SPEND PER COOLDOWN WINDOW",
+        subtitle=f"SUI withdrawn per {window_s:g}s window"
+                 + (f" ({merge} cooldowns each)" if merge > 1 else ""),
+        options={
+            "type": "column",
+            "categories": [datetime.fromtimestamp(t / 1000, timezone.utc).strftime("%m-%d %H:%M")
+                           for t in starts.tolist()],
+            "series": [{"name": "Spend (SUI)", "values": totals.tolist(), "color": "ACCENT"}],
+            "y_format": "#,##0.0",
+        },
+    )
+    return [burn, spend]
+
+
+def with_charts(slides, history, cooldown_ms=60_000, points=500):
+    """``slides``, then ``audit_charts`` of ``history`` once they are exhausted."""
+    yield from slides
+    yield from audit_charts(history, cooldown_ms, points)
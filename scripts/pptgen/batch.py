@@ -0,0 +1,120 @@
+"""Render many deck specs, or the slide ranges of one large deck, across a process pool.
+
+Workers are long-lived: each one imports python-pptx and the builders once
+(in ``_init_worker``) and then renders every deck it is handed, so the
+per-deck cost is only the build and the save.
+
+``render_split`` parallelizes a single deck instead: consecutive ranges of its
+slides are rendered as separate uncompressed packages and merged in order
+(see ``merge.py``) while later ranges are still rendering.
+"""
+import io
+import os
+import time
+from functools import partial
+from pathlib import Path
+
+from .cache import SlideCache
+from .spec import DeckSpec, load_spec
+from .writer import DEFAULT_COMPRESSION, open_sink
+
+MIN_RANGE = 20  # slides; smaller ranges cost more in per-package overhead than they save
+
+
+def _init_worker():
+    # Warm the template and prototypes so the first deck in each worker isn't slower.
+    from .render import warm_up
+    warm_up()
+
+
+def _render_job(job, cache_dir=None, compression=DEFAULT_COMPRESSION, deterministic=False):
+    from .render import build_deck
+
+    spec, output_path = job
+    if not isinstance(spec, DeckSpec):
+        spec = load_spec(spec)
+    cache = SlideCache(cache_dir) if cache_dir else None
+    start = time.perf_counter()
+    etag = build_deck(spec, output_path, cache, compression, deterministic)
+    return str(output_path), time.perf_counter() - start, etag
+
+
+def plan_jobs(specs, out_dir):
+    """Pair each spec (a ``DeckSpec`` or a JSON path) with ``out_dir/<name>.pptx``."""
+    out_dir = Path(out_dir)
+    jobs = []
+    for spec in specs:
+        if not isinstance(spec, DeckSpec):
+            spec = load_spec(spec)
+        jobs.append((spec, out_dir / f"{spec.name}.pptx"))
+    return jobs
+
+
+def render_batch(jobs, workers=None, cache_dir=None, compression=DEFAULT_COMPRESSION,
+                 deterministic=False):
+    """Render ``(spec, output_path)`` jobs; yields ``(path, seconds, etag)`` in order.
+
+    ``workers=1`` renders in-process, which is faster for a handful of decks.
+    With ``cache_dir``, unchanged slides are restored from the slide cache.
+    ``etag`` is the package's SHA-256 with ``deterministic``, else None.
+    """
+    jobs = list(jobs)
+    render_job = partial(_render_job, cache_dir=cache_dir, compression=compression,
+                         deterministic=deterministic)
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, len(jobs)) or 1
+    if workers == 1:
+        for job in jobs:
+            yield render_job(job)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        yield from pool.map(render_job, jobs, chunksize=chunksize)
+
+
+def _render_range(spec, cache_dir=None):
+    from .render import render_deck
+    from .writer import write_package
+
+    cache = SlideCache(cache_dir) if cache_dir else None
+    buf = io.BytesIO()
+    write_package(render_deck(spec, cache), buf, "store")
+    return buf.getvalue()
+
+
+def slide_ranges(count, parts):
+    """Split ``count`` slides into ``parts`` consecutive ``(start, stop)`` ranges."""
+    bounds = [count * i // parts for i in range(parts + 1)]
+    return [(start, stop) for start, stop in zip(bounds, bounds[1:]) if stop > start]
+
+
+def render_split(spec, output, workers=None, cache_dir=None, compression=DEFAULT_COMPRESSION,
+                 deterministic=False, min_range=MIN_RANGE):
+    """Render one deck's slide ranges across workers and merge them into ``output``.
+
+    The deck is cut into up to two ranges per worker of at least ``min_range``
+    slides, so a slow range does not hold up the rest. Returns
+    ``(output, seconds, etag)`` like the jobs of ``render_batch``.
+    """
+    from .merge import PackageMerger
+
+    if not isinstance(spec, DeckSpec):
+        spec = load_spec(spec)
+    workers = workers or os.cpu_count() or 1
+    parts = max(1, min(workers * 2, len(spec.slides) // min_range))
+    if workers == 1 or parts == 1:
+        return _render_job((spec, output), cache_dir, compression, deterministic)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    ranges = [DeckSpec(spec.name, spec.slides[start:stop])
+              for start, stop in slide_ranges(len(spec.slides), parts)]
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=min(workers, parts), initializer=_init_worker) as pool, \
+            open_sink(output) as sink, PackageMerger(sink, compression, deterministic) as merger:
+        for package in pool.map(partial(_render_range, cache_dir=cache_dir), ranges):
+            merger.add(package)
+    return str(output), time.perf_counter() - start, merger.etag
@@ -0,0 +1,78 @@
+"""On-disk cache of rendered slide XML, keyed by a hash of each slide's inputs.
+
+The key covers the ``SlideSpec``, the slide size and a fingerprint of the
+pptgen sources, so editing a builder invalidates every slide it could have
+produced. A hit restores the slide by moving the cached ``p:sld`` children into
+a fresh slide on the same layout, whose name is stored on the first line of
+the cache file; lxml re-serializes them to the same bytes.
+
+Only slides whose sole relationship is their layout are cached; anything that
+references media or other parts is always rebuilt.
+"""
+import hashlib
+import json
+import os
+from dataclasses import asdict
+from pathlib import Path
+
+_PACKAGE_DIR = Path(__file__).resolve().parent
+_fingerprint = None
+
+
+def source_fingerprint():
+    """Hash of every pptgen module, computed once per process."""
+    global _fingerprint
+    if _fingerprint is None:
+        h = hashlib.sha256()
+        for path in sorted(_PACKAGE_DIR.glob("*.py")):
+            h.update(path.name.encode())
+            h.update(path.read_bytes())
+        _fingerprint = h.hexdigest()
+    return _fingerprint
+
+
+def slide_key(slide_spec, slide_size):
+    payload = json.dumps([asdict(slide_spec), list(slide_size), source_fingerprint()],
+                         sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class SlideCache:
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key):
+        return self.directory / f"{key}.xml"
+
+    def restore(self, prs, key):
+        """Add the cached slide for ``key`` to ``prs``; returns it, or None on a miss."""
+        try:
+            blob = self._path(key).read_bytes()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+
+        from pptx.oxml import parse_xml
+
+        from .master import get_layout
+
+        layout, blob = blob.split(b"\n", 1)
+        slide = prs.slides.add_slide(get_layout(prs, layout.decode()))
+        cached = parse_xml(blob)
+        root = slide._element
+        for child in list(root):
+            root.remove(child)
+        root.extend(list(cached))
+        self.hits += 1
+        return slide
+
+    def store(self, slide, key):
+        if len(slide.part.rels) != 1:
+            return
+        path = self._path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(slide.slide_layout.name.encode() + b"\n" + slide.part.blob)
+        os.replace(tmp, path)
@@ -0,0 +1,123 @@
+"""Native charts from long series, downsampled to a fixed point budget.
+
+python-pptx writes every data point twice, into the chart XML caches and into
+the embedded workbook, so a raw history of a few hundred thousand
+transactions makes multi-megabyte parts that are slow to build and to open.
+Line series pass through ``lttb`` first, which keeps at most ``points``
+samples per series, chosen to preserve the visible shape (peaks, dips and
+steps survive where plain striding would drop them). Chart size and build
+time therefore depend on the budget, not on the length of the history.
+
+Column charts are drawn as given: their values are usually totals per
+bucket, which the caller should merge into wider buckets rather than sample.
+"""
+import numpy as np
+from pptx.chart.data import CategoryChartData, XyChartData
+from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION
+from pptx.util import Pt
+
+from .profiling import traced
+from .theme import BODY_FONT, DARK_BORDER, GRAY, color
+
+POINT_BUDGET = 500
+
+
+def lttb(x, y, points=POINT_BUDGET):
+    """Indices of the ``points`` samples of ``(x, y)`` that best keep its shape.
+
+    Largest-Triangle-Three-Buckets: the first and last samples are kept and
+    the rest are split into ``points - 2`` equal buckets. From each bucket the
+    sample forming the largest triangle with the previously kept sample and
+    the mean of the next bucket is kept. Bucket edges and means are computed
+    for all buckets at once; the per-bucket pick is a vectorized argmax, so the
+    Python loop runs ``points`` times whatever the input length.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if points >= n or points < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, points - 1).astype(np.int64)
+    counts = np.diff(edges)
+    mean_x = np.add.reduceat(x[1:n - 1], edges[:-1] - 1) / counts
+    mean_y = np.add.reduceat(y[1:n - 1], edges[:-1] - 1) / counts
+    next_x = np.append(mean_x[1:], x[-1])
+    next_y = np.append(mean_y[1:], y[-1])
+
+    keep = np.empty(points, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for b in range(points - 2):
+        lo, hi = edges[b], edges[b + 1]
+        ax, ay = x[a], y[a]
+        area = np.abs((ax - next_x[b]) * (y[lo:hi] - ay) - (ax - x[lo:hi]) * (next_y[b] - ay))
+        a = lo + int(area.argmax())
+        keep[b + 1] = a
+    return keep
+
+
+def _style_chart(chart, font_size):
+    chart.font.size = Pt(font_size)
+    chart.font.name = BODY_FONT
+    chart.font.color.rgb = GRAY
+    chart.has_legend = True
+    chart.legend.position = XL_LEGEND_POSITION.BOTTOM
+    chart.legend.include_in_layout = False
+    for axis in (chart.category_axis, chart.value_axis):
+        axis.format.line.color.rgb = DARK_BORDER
+    gridlines = chart.value_axis.major_gridlines.format.line
+    gridlines.color.rgb = DARK_BORDER
+    gridlines.width = Pt(0.75)
+
+
+@traced("helper")
+def add_line_chart(slide, series, left, top, width, height, points=POINT_BUDGET,
+                   x_format="General", y_format="#,##0", font_size=12):
+    """Scatter-line chart of ``(name, x, y, color)`` series, each downsampled to ``points``.
+
+    ``x`` and ``y`` are any array-likes of numbers; use Excel serial dates for
+    ``x`` (see ``excel_date``) with a date ``x_format`` for time axes.
+    """
+    data = XyChartData()
+    for name, x, y, _ in series:
+        x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+        keep = lttb(x, y, points)
+        chart_series = data.add_series(name, number_format=y_format)
+        for xi, yi in zip(x[keep].tolist(), y[keep].tolist()):
+            chart_series.add_data_point(xi, yi)
+
+    chart = slide.shapes.add_chart(XL_CHART_TYPE.XY_SCATTER_LINES_NO_MARKERS,
+                                   left, top, width, height, data).chart
+    _style_chart(chart, font_size)
+    chart.category_axis.tick_labels.number_format = x_format
+    chart.category_axis.tick_labels.number_format_is_linked = False
+    for plot_series, (_, _, _, c) in zip(chart.plots[0].series, series):
+        plot_series.smooth = False
+        plot_series.format.line.color.rgb = color(c)
+        plot_series.format.line.width = Pt(2)
+    return chart
+
+
+@traced("helper")
+def add_column_chart(slide, categories, series, left, top, width, height,
+                     y_format="#,##0", font_size=12):
+    """Clustered column chart of ``(name, values, color)`` series over ``categories``."""
+    data = CategoryChartData(number_format=y_format)
+    data.categories = categories
+    for name, values, _ in series:
+        data.add_series(name, np.asarray(values, dtype=np.float64).tolist())
+
+    chart = slide.shapes.add_chart(XL_CHART_TYPE.COLUMN_CLUSTERED,
+                                   left, top, width, height, data).chart
+    _style_chart(chart, font_size)
+    chart.plots[0].gap_width = 40
+    for plot_series, (_, _, c) in zip(chart.plots[0].series, series):
+        plot_series.format.fill.solid()
+        plot_series.format.fill.fore_color.rgb = color(c)
+    return chart
+
+
+def excel_date(ms):
+    """Excel serial dates (days since 1899-12-30) for Unix timestamps in milliseconds."""
+    return np.asarray(ms, dtype=np.float64) / 86_400_000 + 25569
@@ -0,0 +1,516 @@
+"""Structural diff of two .pptx decks by normalized per-shape content hashes.
+
+Every slide is indexed once. Each top-level shape gets a set of hashes:
+
+- ``content``: the kind of shape (element, placeholder type, preset
+  geometry), its text and what it shows. Relationship ids are replaced by a
+  hash of the part they point to (image, chart), so renumbered parts compare
+  equal;
+- ``style``: one hash per component, being ``fill`` (fill and effects),
+  ``line``, ``text style`` (body, paragraph and run properties), ``theme
+  style`` (``p:style``), ``child geometry`` (shapes inside a group) and
+  ``layout`` (table grid, everything else);
+- ``geometry``: offset and extent in EMU plus rotation, flips and child
+  offsets.
+
+Text style is hashed by its effective value: level-1 paragraph properties
+of non-placeholder text are rewritten in full, merging the master's
+inherited defaults, the body's ``a:lstStyle/a:lvl1pPr`` and the paragraph's
+own ``a:pPr``. So a deck and its ``optimize.py`` copy, which strips defaults
+and hoists repeated ones, compare equal.
+
+Shape ids and names are ignored; they shift whenever a shape is added
+before them. A slide's key hashes its layout name, background and shape
+keys in z-order. Generated decks repeat the same markup with other text on
+every slide, so a shape is only taken apart once per distinct markup (text,
+position and ids aside); the rest of a 1000-slide deck costs one
+serialization per shape.
+
+``diff_decks`` then matches in near-linear time:
+
+1. slides with equal keys are paired in order. The pairs that are not on a
+   longest increasing subsequence of new positions (O(n log n)) are reported
+   as moved; the rest only shifted because of slides added or removed around
+   them;
+2. each remaining new slide is paired with the remaining old slide sharing
+   the most shape contents (and title), through an inverted index that skips
+   contents common to many slides. At least half the shapes must match;
+   slides left over are then paired by equal title;
+3. within a pair, shapes are matched the same way: equal keys, then equal
+   content (moved or restyled), then equal kind and position (edited). The
+   rest were added or removed.
+"""
+import bisect
+import hashlib
+import re
+from collections import defaultdict, deque
+from copy import deepcopy
+from dataclasses import dataclass
+
+from lxml import etree
+
+from .merge import _OFFICE_RELS, _Package
+from .optimize import RT_SLIDE_MASTER, _flag, inherited_text
+
+_A = "http://schemas.openxmlformats.org/drawingml/2006/main"
+_P = "http://schemas.openxmlformats.org/presentationml/2006/main"
+_NS = {"a": _A, "p": _P}
+_RID = f"{{{_OFFICE_RELS}}}id"
+_LAYOUT_REL = f"{_OFFICE_RELS}/slideLayout"
+_SHAPE_TAGS = {f"{{{_P}}}{tag}" for tag in ("sp", "pic", "graphicFrame", "grpSp", "cxnSp")}
+_TITLE_TYPES = {"title", "ctrTitle"}
+_EMU_PER_INCH = 914400
+
+# Tag (local name) -> component of the top-most such element and everything beneath it.
+_COMPONENTS = {
+    "xfrm": "child geometry", "ln": "line", "style": "theme style",
+    "bodyPr": "text style", "lstStyle": "text style", "pPr": "text style",
+    "rPr": "text style", "endParaRPr": "text style", "defRPr": "text style",
+    "solidFill": "fill", "gradFill": "fill", "pattFill": "fill", "blipFill": "fill",
+    "noFill": "fill", "grpFill": "fill", "effectLst": "fill", "tcPr": "fill",
+    "prstGeom": "content", "custGeom": "content", "cNvSpPr": "content", "nvPr": "content",
+}
+_rel_ids = etree.XPath(" | ".join(f".//@r:{name}" for name in ("id", "embed", "link", "pict")),
+                       namespaces={"r": _OFFICE_RELS})
+_T, _BR, _PARA = f"{{{_A}}}t", f"{{{_A}}}br", f"{{{_A}}}p"
+_EXT_LST = (f"{{{_A}}}extLst", f"{{{_P}}}extLst")  # creation ids
+_EMPTY = (f"{{{_A}}}avLst", f"{{{_A}}}lstStyle")  # the same as leaving them out
+_BODY_PR = f"{{{_A}}}bodyPr"
+_PPR, _DEF_RPR, _LATIN = f"{{{_A}}}pPr", f"{{{_A}}}defRPr", f"{{{_A}}}latin"
+_FLAGS = ("b", "i")
+_XMLNS = re.compile(r' xmlns(?::\w+)?="[^"]*"')
+_XFRM, _OFF, _EXT = f"{{{_A}}}xfrm", f"{{{_A}}}off", f"{{{_A}}}ext"
+_FRAME_XFRM = f"{{{_P}}}xfrm"  # graphicFrame
+_XFRM_PARENTS = {f"{{{_P}}}spPr", f"{{{_P}}}grpSpPr", _FRAME_XFRM}
+_CNV_PR = f"{{{_P}}}cNvPr"
+# For _cache_key: every cNvPr and text, and the first a:off / a:ext pair (the shape's own).
+_CNV_PR_IDS = re.compile(r'(<p:cNvPr) id="\d+" name="[^"]*"')
+_OFF_EXT = re.compile(r'<a:off x="-?\d+" y="-?\d+"/><a:ext cx="\d+" cy="\d+"/>')
+_TEXT_VALUES = re.compile(r"(<a:t(?: [^>]*)?>)[^<]*")
+_REL_ATTRS = re.compile(r' (r:(?:id|embed|link|pict))="([^"]*)"')
+_NUMBERED = re.compile(r"\s+\d+$")
+_COMMON = 8  # features shared by more items than this are not used for pairing
+
+
+@dataclass(frozen=True)
+class Shape:
+    label: str  # e.g. "TextBox 'Max Budget'"
+    text: str
+    content: str
+    style: tuple  # ((component, hash), ...)
+    geometry: tuple  # (x, y, cx, cy, rotation, flips and child offsets), or () when inherited
+
+    @property
+    def key(self):
+        return self.content, self.style, self.geometry
+
+
+@dataclass
+class Slide:
+    number: int
+    title: str
+    layout: str
+    background: str
+    shapes: list
+    key: str = ""
+
+
+@dataclass(frozen=True)
+class ShapeChange:
+    kind: str  # "added", "removed", "moved", "restyled" or "edited"
+    label: str
+    detail: str = ""
+
+
+@dataclass(frozen=True)
+class SlideChange:
+    kind: str  # "added", "removed", "moved" or "changed"
+    old: int  # 1-based slide numbers; None when added / removed
+    new: int
+    title: str
+    shapes: tuple = ()  # ShapeChange
+
+
+# ============================================================
+# Indexing
+# ============================================================
+def _digest(text):
+    return hashlib.sha1(text.encode()).hexdigest()[:16]
+
+
+def _effective_rpr(inherited, *rprs):
+    """``a:defRPr`` with the values of ``inherited``, then each of ``rprs``, applied in turn."""
+    attrs = {key: inherited[key] for key in ("sz", *_FLAGS) if key in inherited}
+    children = {}
+    if "latin" in inherited:
+        children[_LATIN] = etree.Element(_LATIN, typeface=inherited["latin"])
+    for rpr in rprs:
+        if rpr is not None:
+            attrs.update((k, _flag(v) if k in _FLAGS else v) for k, v in rpr.attrib.items())
+            children.update((child.tag, child) for child in rpr)
+    out = etree.Element(_DEF_RPR, {k: attrs[k] for k in sorted(attrs)})
+    out.extend(deepcopy(children[tag]) for tag in sorted(children))
+    return out
+
+
+def _effective_text(root, inherited):
+    """Write level-1 paragraph properties of non-placeholder text out in full, in place.
+
+    ``inherited`` holds what such text inherits under the slide's master (see
+    ``optimize.inherited_text``). The body's ``a:lvl1pPr`` algn and
+    ``a:defRPr`` are folded into every paragraph and removed.
+    """
+    for body in root.iterfind("p:cSld/p:spTree//p:sp/p:txBody", _NS):
+        if body.getparent().find("p:nvSpPr/p:nvPr/p:ph", _NS) is not None:
+            continue  # placeholders inherit from their layout
+        lvl1 = body.find("a:lstStyle/a:lvl1pPr", _NS)
+        base = lvl1.find("a:defRPr", _NS) if lvl1 is not None else None
+        for p in body.iterfind("a:p", _NS):
+            ppr = p.find("a:pPr", _NS)
+            if ppr is None:
+                ppr = etree.Element(_PPR)
+                p.insert(0, ppr)
+            elif ppr.get("lvl") not in (None, "0"):
+                continue
+            algn = next((el.get("algn") for el in (ppr, lvl1) if el is not None
+                         and el.get("algn")), inherited.get("algn"))
+            if algn is not None:
+                ppr.set("algn", algn)
+            rpr = ppr.find("a:defRPr", _NS)
+            if rpr is not None:
+                ppr.remove(rpr)
+            ppr.append(_effective_rpr(inherited, base, rpr))
+        if lvl1 is not None:
+            lvl1.attrib.pop("algn", None)
+            if base is not None:
+                lvl1.remove(base)
+            if not len(lvl1) and not lvl1.attrib:
+                lvl1.getparent().remove(lvl1)
+
+
+def _normalize(root, inherited=None):
+    """Drop creation ids and markup that restates defaults from a slide, in place.
+
+    With ``inherited`` (see ``_effective_text``), text style is written out in full.
+    """
+    if inherited is not None:
+        _effective_text(root, inherited)
+    for el in list(root.iter(*_EXT_LST, *_EMPTY)):
+        if el.tag in _EXT_LST or not len(el):
+            el.getparent().remove(el)
+    for el in root.iter(_BODY_PR):
+        if el.get("rtlCol") == "0":
+            del el.attrib["rtlCol"]
+
+
+def _xml(el):
+    return _XMLNS.sub("", etree.tostring(el, with_tail=False).decode())
+
+
+def _own_xfrm(sp):
+    for child in sp:
+        if child.tag in _XFRM_PARENTS:
+            return child if child.tag == _FRAME_XFRM else child.find(_XFRM)
+    return None
+
+
+def _geometry(xfrm):
+    off = xfrm.find(_OFF) if xfrm is not None else None
+    ext = xfrm.find(_EXT) if xfrm is not None else None
+    if off is None or ext is None:
+        return ()
+    rest = [sorted(xfrm.attrib.items())] + [(el.tag, sorted(el.attrib.items()))
+                                            for el in xfrm if el is not off and el is not ext]
+    return int(off.get("x")), int(off.get("y")), int(ext.get("cx")), int(ext.get("cy")), repr(rest)
+
+
+def _decompose(sp, xfrm, part_hash):
+    """``(content tokens but the text, style)`` of ``sp``; removes its relationship ids."""
+    tokens = defaultdict(list)
+    tokens["content"].append(etree.QName(sp).localname)
+    for rid in _rel_ids(sp):
+        tokens["content"].append(part_hash(str(rid)))
+        del rid.getparent().attrib[rid.attrname]
+    stack = [sp]
+    while stack:
+        el = stack.pop()
+        children = []
+        for child in el:
+            if not isinstance(child.tag, str) or child is xfrm or child.tag == _CNV_PR:
+                continue  # geometry is kept apart; ids and names are ignored
+            component = _COMPONENTS.get(child.tag.rpartition("}")[2])
+            if component is None:
+                children.append(child)
+            else:
+                tokens[component].append(_xml(child))
+        tokens["layout"].append(f"{el.tag}{sorted(el.attrib.items())}{len(children)}")
+        stack.extend(children)
+    content = " ".join(tokens.pop("content"))
+    return content, tuple(sorted((component, _digest(" ".join(parts)))
+                                 for component, parts in tokens.items()))
+
+
+def _cache_key(sp, xfrm, part_hash):
+    """The markup of ``sp`` with ids, text, own position and relationship ids normalized."""
+    xml = _CNV_PR_IDS.sub(r"\1", etree.tostring(sp).decode())
+    xml = _TEXT_VALUES.sub(r"\1", xml)
+    if xfrm is not None:
+        xml = _OFF_EXT.sub("", xml, count=1)
+    return _REL_ATTRS.sub(lambda m: f' {m[1]}="{part_hash(m[2])}"', xml)
+
+
+def index_shape(sp, part_hash, cache=None):
+    """``Shape`` for the shape element ``sp`` of a slide passed through ``_normalize``.
+
+    ``part_hash(rid)`` is the hash of the part a relationship id points to.
+    Relationship ids are removed from ``sp``. Shapes differing only in text,
+    position and ids are decomposed once per ``cache`` (a dict), which makes
+    generated decks fast to index; only pass one for slides whose
+    relationship namespace has the usual ``r`` prefix.
+    """
+    tag = etree.QName(sp).localname
+    name = sp[0].find(_CNV_PR) if len(sp) else None
+    kind = (_NUMBERED.sub("", name.get("name", "")) if name is not None else "") or tag
+    xfrm = _own_xfrm(sp)
+    geometry = _geometry(xfrm)
+    text = "\n".join("".join("\n" if el.tag == _BR else el.text or "" for el in p.iter(_T, _BR))
+                     for p in sp.iter(_PARA)).strip()
+    texts = [el.text or "" for el in sp.iter(_T)]
+
+    if cache is None:
+        content, style = _decompose(sp, xfrm, part_hash)
+    else:
+        key = _cache_key(sp, xfrm, part_hash)
+        if key not in cache:
+            cache[key] = _decompose(sp, xfrm, part_hash)
+        content, style = cache[key]
+
+    snippet = text.replace("\n", " ")
+    label = f"{kind} {snippet[:40]!r}" if snippet else kind
+    return Shape(label, text, _digest(" ".join([content] + texts)), style, geometry)
+
+
+def read_deck(src):
+    """``[Slide]`` for the .pptx ``src`` (path, bytes or binary file), in deck order."""
+    if not isinstance(src, bytes) and not hasattr(src, "read"):
+        with open(src, "rb") as f:
+            src = f.read()
+    pkg = _Package(src)
+    part_hashes = {}
+
+    def part_hash(name):
+        if name not in part_hashes:
+            part_hashes[name] = hashlib.sha1(pkg.zip.read(name)).hexdigest()[:16]
+        return part_hashes[name]
+
+    layouts = {}
+    masters = {}  # layout -> what text inherits under its master
+    shape_cache = {}
+    slides = []
+    pres_rels = {rel.get("Id"): target for rel, target in pkg.rels(pkg.main)}
+    pres = etree.fromstring(pkg.zip.read(pkg.main))
+    for number, sld_id in enumerate(pres.iterfind("p:sldIdLst/p:sldId", _NS), 1):
+        part = pres_rels[sld_id.get(_RID)]
+        rels = pkg.rels(part)
+        targets = {rel.get("Id"): target for rel, target in rels}
+        layout = next((target for rel, target in rels if rel.get("Type") == _LAYOUT_REL), None)
+        if layout is not None and layout not in layouts:
+            c_sld = etree.fromstring(pkg.zip.read(layout)).find("p:cSld", _NS)
+            layouts[layout] = c_sld.get("name", layout) if c_sld is not None else layout
+            master = next((target for rel, target in pkg.rels(layout)
+                           if rel.get("Type") == RT_SLIDE_MASTER), None)
+            masters[layout] = (inherited_text(pkg, master, pres)
+                               if master in pkg.members else None)
+        root = etree.fromstring(pkg.zip.read(part))
+        _normalize(root, masters.get(layout))
+        cache = shape_cache if root.nsmap.get("r") == _OFFICE_RELS else None
+
+        def rid_hash(rid):
+            target = targets.get(rid)
+            return part_hash(target) if target in pkg.members else rid
+
+        elements = [el for el in root.find("p:cSld/p:spTree", _NS) if el.tag in _SHAPE_TAGS]
+        shapes = [index_shape(el, rid_hash, cache) for el in elements]
+        bg = root.find("p:cSld/p:bg", _NS)
+        background = _digest(etree.tostring(bg, method="c14n").decode()) if bg is not None else ""
+        titles = [shape.text for shape, el in zip(shapes, elements)
+                  if set(el.xpath("*/p:nvPr/p:ph/@type", namespaces=_NS)) & _TITLE_TYPES]
+        title = next((text for text in titles + [shape.text for shape in shapes] if text), "")
+        slide = Slide(number, title.split("\n")[0], layouts.get(layout, ""), background, shapes)
+        slide.key = _digest(" ".join([slide.layout, background]
+                                     + [repr(shape.key) for shape in shapes]))
+        slides.append(slide)
+    return slides
+
+
+# ============================================================
+# Matching
+# ============================================================
+def longest_increasing(values):
+    """Indices into ``values`` of one longest strictly increasing subsequence."""
+    tails, tail_at, prev = [], [], [None] * len(values)
+    for i, value in enumerate(values):
+        k = bisect.bisect_left(tails, value)
+        if k == len(tails):
+            tails.append(value)
+            tail_at.append(i)
+        else:
+            tails[k] = value
+            tail_at[k] = i
+        prev[i] = tail_at[k - 1] if k else None
+    out, i = [], tail_at[-1] if tail_at else None
+    while i is not None:
+        out.append(i)
+        i = prev[i]
+    return out[::-1]
+
+
+def _pair_equal(old, new):
+    """In-order pairs ``(i, j)`` of ``{index: key}`` dicts with equal keys; pairs are removed."""
+    waiting = defaultdict(deque)
+    for j in sorted(new):
+        waiting[new[j]].append(j)
+    pairs = []
+    for i in sorted(old):
+        queue = waiting.get(old[i])
+        if queue:
+            pairs.append((i, queue.popleft()))
+    for i, j in pairs:
+        del old[i], new[j]
+    return pairs
+
+
+def _pair_similar(old, new, threshold=0.5):
+    """Pair each ``new`` item with the ``old`` one sharing most features; pairs are removed.
+
+    ``old`` and ``new`` map indices to feature sets. Features found in more
+    than ``_COMMON`` old items are not indexed, which keeps this linear.
+    """
+    postings = defaultdict(list)
+    for i in sorted(old):
+        for feature in old[i]:
+            postings[feature].append(i)
+    pairs = []
+    for j in sorted(new):
+        votes = defaultdict(int)
+        for feature in new[j]:
+            found = postings.get(feature, ())
+            if len(found) <= _COMMON:
+                for i in found:
+                    if i in old:
+                        votes[i] += 1
+        score = lambda i: votes[i] / max(len(new[j]), len(old[i]), 1)
+        best = max(votes, key=lambda i: (score(i), -abs(i - j)), default=None)
+        if best is not None and score(best) >= threshold:
+            pairs.append((best, j))
+            del old[best]
+    for _, j in pairs:
+        del new[j]
+    return pairs
+
+
+def _inches(emu):
+    return f"{emu / _EMU_PER_INCH:+.2f}in" if abs(emu) >= _EMU_PER_INCH // 200 else f"{emu:+d} EMU"
+
+
+def _size(g):
+    return f"{g[2] / _EMU_PER_INCH:.2f}x{g[3] / _EMU_PER_INCH:.2f}in"
+
+
+def _moved(a, b):
+    if not a or not b:
+        return "position now inherited" if a else "position now explicit"
+    moved = [f"{axis} {_inches(new - old)}"
+             for axis, old, new in (("x", a[0], b[0]), ("y", a[1], b[1])) if new != old]
+    parts = [", ".join(moved)] if moved else []
+    if (a[2], a[3]) != (b[2], b[3]):
+        parts.append(f"size {_size(a)} -> {_size(b)}")
+    if a[4] != b[4]:
+        parts.append("rotation or flip")
+    return "; ".join(parts)
+
+
+def _restyled(a, b):
+    old, new = dict(a.style), dict(b.style)
+    return ", ".join(sorted(c for c in old.keys() | new.keys() if old.get(c) != new.get(c)))
+
+
+def _snippet(text):
+    return repr(text.replace("\n", " ")[:40])
+
+
+def diff_shapes(old, new):
+    """``[ShapeChange]`` turning the shapes ``old`` into ``new`` (lists of ``Shape``)."""
+    left = {i: shape.key for i, shape in enumerate(old)}
+    right = {j: shape.key for j, shape in enumerate(new)}
+    _pair_equal(left, right)
+    left = {i: old[i].content for i in left}
+    right = {j: new[j].content for j in right}
+    changes = []
+    for i, j in _pair_equal(left, right):
+        a, b = old[i], new[j]
+        if a.geometry != b.geometry:
+            changes.append((j, ShapeChange("moved", b.label, _moved(a.geometry, b.geometry))))
+        if a.style != b.style:
+            changes.append((j, ShapeChange("restyled", b.label, _restyled(a, b))))
+    left = {i: (_kind(old[i]), old[i].geometry) for i in left}
+    right = {j: (_kind(new[j]), new[j].geometry) for j in right}
+    for i, j in _pair_equal(left, right):
+        a, b = old[i], new[j]
+        detail = (f"text {_snippet(a.text)} -> {_snippet(b.text)}" if a.text != b.text
+                  else "content (image, chart or shape type)")
+        changes.append((j, ShapeChange("edited", b.label, detail)))
+        if a.style != b.style:
+            changes.append((j, ShapeChange("restyled", b.label, _restyled(a, b))))
+    changes.extend((j, ShapeChange("added", new[j].label)) for j in right)
+    changes.extend((i, ShapeChange("removed", old[i].label)) for i in left)
+    return [change for _, change in sorted(changes, key=lambda c: c[0])]
+
+
+def _kind(shape):
+    return shape.label.split(" '")[0]
+
+
+def _features(slide):
+    return {shape.content for shape in slide.shapes} | {("title", slide.title)}
+
+
+def diff_decks(old, new):
+    """``[SlideChange]`` turning the slides ``old`` into ``new`` (from ``read_deck``).
+
+    Sorted by position in the new deck; removed slides come after the slide
+    that preceded them.
+    """
+    left = {i: slide.key for i, slide in enumerate(old)}
+    right = {j: slide.key for j, slide in enumerate(new)}
+    same = _pair_equal(left, right)
+    in_order = {same[k] for k in longest_increasing([j for _, j in same])}
+    changes = [(j, SlideChange("moved", old[i].number, new[j].number, new[j].title))
+               for i, j in same if (i, j) not in in_order]
+
+    rewritten = _pair_similar({i: _features(old[i]) for i in left},
+                              {j: _features(new[j]) for j in right})
+    left = set(left) - {i for i, _ in rewritten}
+    right = set(right) - {j for _, j in rewritten}
+    rewritten += _pair_equal({i: old[i].title for i in left if old[i].title},
+                             {j: new[j].title for j in right if new[j].title})
+    left -= {i for i, _ in rewritten}
+    right -= {j for _, j in rewritten}
+    for i, j in rewritten:
+        a, b = old[i], new[j]
+        shapes = diff_shapes(a.shapes, b.shapes)
+        if a.layout != b.layout:
+            shapes.insert(0, ShapeChange("restyled", "slide", f"layout {a.layout!r} -> {b.layout!r}"))
+        if a.background != b.background:
+            shapes.insert(0, ShapeChange("restyled", "slide", "background"))
+        changes.append((j, SlideChange("changed", a.number, b.number, b.title, tuple(shapes))))
+    changes.extend((j, SlideChange("added", None, new[j].number, new[j].title)) for j in right)
+
+    paired = dict(same + rewritten)
+    after = -1  # new position of the last kept slide before each removed one
+    for i in range(len(old)):
+        if i in left:
+            changes.append((after + 0.5, SlideChange("removed", old[i].number, None, old[i].title)))
+        else:
+            after = max(after, paired[i])
+    return [change for _, change in sorted(changes, key=lambda c: c[0])]
@@ -0,0 +1,118 @@
+"""Bulk card-grid emitter.
+
+``add_card_grid`` lays out one bordered card per item and fills it from a list
+of slots (text boxes, colored rules, nested boxes) positioned relative to the
+card. Card positions are computed for the whole grid at once, shape ids come
+from a single counter seeded from the slide, and every ``p:sp`` is appended to
+the spTree in one batch. python-pptx's ``add_shape`` instead rescans the slide
+for the max id on every call, which is quadratic in shapes per slide.
+
+All geometry is in EMU (use ``Inches``/``Pt``), like the python-pptx API.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+from pptx.enum.text import PP_ALIGN
+
+from .profiling import traced
+from .prototypes import clone, set_fill, set_line, set_text
+from .styles import paragraph_style
+from .theme import BODY_FONT, DEEP, color
+
+
+@dataclass(frozen=True)
+class GridLayout:
+    columns: int
+    card_width: int
+    card_height: int
+    left: int = 0
+    top: int = 0
+    col_gap: int = 0
+    row_gap: int = 0
+
+    def positions(self, count):
+        """Card offsets ``(xs, ys)`` for ``count`` cards, filled row by row."""
+        idx = np.arange(count, dtype=np.int64)
+        xs = self.left + (idx % self.columns) * (self.card_width + self.col_gap)
+        ys = self.top + (idx // self.columns) * (self.card_height + self.row_gap)
+        return xs.tolist(), ys.tolist()
+
+
+@dataclass(frozen=True)
+class TextSlot:
+    """Text box; ``text`` is formatted with the item's fields (``"{0}"``)."""
+    text: str
+    left: int
+    top: int
+    width: int
+    height: int
+    font_size: int = 18
+    color: object = None  # None: the item's color
+    bold: bool = False
+    alignment: PP_ALIGN = PP_ALIGN.LEFT
+    font_name: str = BODY_FONT
+
+
+@dataclass(frozen=True)
+class RuleSlot:
+    """Borderless bar filled with the item's color."""
+    left: int
+    top: int
+    width: int
+    height: int
+
+
+@dataclass(frozen=True)
+class BoxSlot:
+    """Nested rounded box with fixed colors."""
+    left: int
+    top: int
+    width: int
+    height: int
+    fill_color: object
+    border_color: object = None
+
+
+@traced("helper")
+def add_card_grid(slide, items, layout, slots=(), fill_color=DEEP,
+                  border_color=None, color_field=-1):
+    """Add one card per item and return the new ``p:sp`` elements.
+
+    The card border and any slot without an explicit color use the item's
+    color (``item[color_field]``), unless ``border_color`` is given.
+    """
+    sp_tree = slide.shapes._spTree
+    shape_id = sp_tree.max_shape_id + 1
+    xs, ys = layout.positions(len(items))
+    elements = []
+
+    for item, x, y in zip(items, xs, ys):
+        item_color = (color(item[color_field]) if color_field is not None
+                      else border_color)
+        card = clone("card", shape_id, x, y, layout.card_width, layout.card_height)
+        set_fill(card, fill_color)
+        set_line(card, border_color or item_color)
+        elements.append(card)
+        shape_id += 1
+
+        for slot in slots:
+            left, top = x + slot.left, y + slot.top
+            if isinstance(slot, TextSlot):
+                sp = clone("title", shape_id, left, top, slot.width, slot.height)
+                style = paragraph_style(slot.font_size, slot.color or item_color,
+                                        slot.bold, slot.alignment, slot.font_name)
+                set_text(sp, slot.text.format(*item), style)
+            elif isinstance(slot, RuleSlot):
+                sp = clone("accent", shape_id, left, top, slot.width, slot.height)
+                set_fill(sp, item_color)
+            else:
+                name = "card" if slot.border_color else "plain_card"
+                sp = clone(name, shape_id, left, top, slot.width, slot.height)
+                set_fill(sp, slot.fill_color)
+                if slot.border_color:
+                    set_line(sp, slot.border_color)
+            elements.append(sp)
+            shape_id += 1
+
+    sp_tree.extend(elements)
+    return elements
@@ -0,0 +1,79 @@
+"""Shape helpers shared by every slide builder."""
+import io
+
+from pptx.enum.shapes import MSO_SHAPE
+from pptx.enum.text import PP_ALIGN
+from pptx.util import Inches, Pt
+
+from . import images
+from .profiling import traced
+from .styles import apply_style, paragraph_style
+from .theme import ACCENT, BODY_FONT, WHITE
+
+
+def set_bg(slide, color):
+    bg = slide.background
+    fill = bg.fill
+    fill.solid()
+    fill.fore_color.rgb = color
+
+
+@traced("helper")
+def add_text(slide, left, top, width, height, text, font_size=18,
+             color=WHITE, bold=False, alignment=PP_ALIGN.LEFT,
+             font_name=BODY_FONT):
+    txBox = slide.shapes.add_textbox(left, top, width, height)
+    tf = txBox.text_frame
+    tf.word_wrap = True
+    p = tf.paragraphs[0]
+    p.text = text
+    apply_style(p._p, paragraph_style(font_size, color, bold, alignment, font_name))
+    return tf
+
+
+@traced("helper")
+def add_para(tf, text, font_size=18, color=WHITE, bold=False,
+             alignment=PP_ALIGN.LEFT, font_name=BODY_FONT, space_before=Pt(6)):
+    p = tf.add_paragraph()
+    p.text = text
+    apply_style(p._p, paragraph_style(font_size, color, bold, alignment, font_name,
+                                      space_before))
+    return p
+
+
+@traced("helper")
+def add_shape_rect(slide, left, top, width, height, fill_color, border_color=None):
+    shape = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, left, top, width, height)
+    shape.fill.solid()
+    shape.fill.fore_color.rgb = fill_color
+    if border_color:
+        shape.line.color.rgb = border_color
+        shape.line.width = Pt(1.5)
+    else:
+        shape.line.fill.background()
+    return shape
+
+
+@traced("helper")
+def add_image(slide, src, left, top, width, height):
+    """Picture of ``src`` (a path or bytes) fitted and centered in the frame.
+
+    The image is resized to the frame first (see ``images``), and python-pptx
+    stores identical bytes once, so a logo repeated on every slide costs one
+    media part.
+    """
+    pic = slide.shapes.add_picture(io.BytesIO(images.get(src, width, height)), left, top)
+    scale = min(width / pic.width, height / pic.height)
+    w, h = round(pic.width * scale), round(pic.height * scale)
+    pic.left, pic.top = left + (width - w) // 2, top + (height - h) // 2
+    pic.width, pic.height = w, h
+    return pic
+
+
+def add_accent_line(slide, top):
+    shape = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE,
+                                    Inches(0.8), top, Inches(2), Pt(3))
+    shape.fill.solid()
+    shape.fill.fore_color.rgb = ACCENT
+    shape.line.fill.background()
+
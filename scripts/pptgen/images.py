@@ -0,0 +1,161 @@
+"""Image assets for slides.
+
+Sources are identified by the SHA-256 of their bytes, and each (source, pixel
+size) pair is resized and recompressed once per process: the same logo on
+every slide is processed once and, since python-pptx stores identical image
+bytes as a single media part, embedded once. Images are downscaled to their
+rendered size at ``DPI`` (never upscaled) and re-encoded; whichever of the
+result and the original is smaller gets embedded. Images with an EXIF
+orientation are turned upright first, so their frame gets the right aspect.
+
+Source and processed bytes are kept in least-recently-used caches of up to
+``CACHE_BYTES`` each, so a long-lived server does not grow without bound.
+
+``prepare`` processes all distinct images of a deck across a process pool
+before any slide is built; ``get`` falls back to processing inline.
+"""
+import hashlib
+import io
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import parent_process
+
+EMU_PER_INCH = 914400
+DPI = 150
+JPEG_QUALITY = 85
+CACHE_BYTES = 128 * 1024 * 1024
+MAX_DIGESTS = 4096
+_ORIENTATION = 0x0112  # EXIF tag; 2-8 mean the pixels are stored mirrored or rotated
+
+
+class LRUCache:
+    """Dict-like cache evicting least recently used entries past ``max_size``.
+
+    ``size`` weighs each value (default: one per entry).
+    """
+
+    def __init__(self, max_size, size=lambda value: 1):
+        self.max_size = max_size
+        self.total = 0
+        self._size = size
+        self._items = OrderedDict()
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key):
+        value = self._items.get(key)
+        if value is not None:
+            self._items.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.total -= self._size(old)
+        self._items[key] = value
+        self.total += self._size(value)
+        while self.total > self.max_size and len(self._items) > 1:
+            _, evicted = self._items.popitem(last=False)
+            self.total -= self._size(evicted)
+
+    def update(self, pairs):
+        for key, value in pairs:
+            self.put(key, value)
+
+
+_digests = LRUCache(MAX_DIGESTS)  # (path, mtime_ns, size) -> sha256
+_sources = LRUCache(CACHE_BYTES, len)  # sha256 -> original bytes
+_processed = LRUCache(CACHE_BYTES, len)  # (sha256, width_px, height_px) -> bytes
+
+
+def pixel_size(width, height, dpi=DPI):
+    """Pixel box for a ``width`` x ``height`` EMU frame at ``dpi``."""
+    return (max(1, round(width * dpi / EMU_PER_INCH)),
+            max(1, round(height * dpi / EMU_PER_INCH)))
+
+
+def _load(src):
+    """Register ``src`` (a path or bytes) and return its content hash and bytes."""
+    if isinstance(src, (bytes, bytearray)):
+        blob = bytes(src)
+        digest = hashlib.sha256(blob).hexdigest()
+    else:
+        st = os.stat(src)
+        stamp = (os.fspath(src), st.st_mtime_ns, st.st_size)
+        digest = _digests.get(stamp)
+        blob = _sources.get(digest) if digest is not None else None
+        if blob is not None:
+            return digest, blob
+        with open(src, "rb") as f:
+            blob = f.read()
+        digest = hashlib.sha256(blob).hexdigest()
+        _digests.put(stamp, digest)
+    if digest not in _sources:
+        _sources.put(digest, blob)
+    return digest, blob
+
+
+def process_image(blob, box):
+    """Return ``blob`` turned upright, downscaled to fit ``box`` (pixels) and recompressed."""
+    from PIL import Image, ImageOps
+
+    with Image.open(io.BytesIO(blob)) as original:
+        fmt = original.format
+        rotated = original.getexif().get(_ORIENTATION, 1) in range(2, 9)
+        im = ImageOps.exif_transpose(original) if rotated else original
+        if im.width <= box[0] and im.height <= box[1] and fmt in ("PNG", "JPEG"):
+            resized = im
+        else:
+            resized = im if rotated else im.copy()
+            resized.thumbnail(box, Image.LANCZOS)
+        out = io.BytesIO()
+        if fmt == "JPEG" or (fmt != "PNG" and resized.mode in ("RGB", "L", "CMYK")):
+            resized.convert("RGB").save(out, "JPEG", quality=JPEG_QUALITY, optimize=True)
+        else:
+            resized.save(out, "PNG", optimize=True)
+    data = out.getvalue()
+    return data if rotated or len(data) < len(blob) else blob
+
+
+def _process_job(job):
+    blob, box = job
+    return process_image(blob, box)
+
+
+def prepare(requests, workers=None):
+    """Process ``(src, width, height)`` requests ahead of use, in parallel.
+
+    Pools are only started from the main process; batch and server workers
+    process their deck's images inline.
+    """
+    pending = {}
+    for src, width, height in requests:
+        digest, blob = _load(src)
+        key = (digest, *pixel_size(width, height))
+        if key not in _processed:
+            pending[key] = (blob, key[1:])
+    if not pending:
+        return
+    workers = min(workers or os.cpu_count() or 1, len(pending))
+    if workers <= 1 or parent_process() is not None:
+        results = map(_process_job, pending.values())
+        _processed.update(zip(pending, results))
+        return
+    with ProcessPoolExecutor(workers) as pool:
+        _processed.update(zip(pending, pool.map(_process_job, pending.values())))
+
+
+def get(src, width, height):
+    """Processed bytes of ``src`` for a ``width`` x ``height`` EMU frame."""
+    digest, source = _load(src)
+    key = (digest, *pixel_size(width, height))
+    blob = _processed.get(key)
+    if blob is None:
+        blob = process_image(source, key[1:])
+        _processed.put(key, blob)
+    return blob
@@ -0,0 +1,112 @@
+"""Layout lint: shapes off the slide, unintended overlaps and text collisions.
+
+Every top-level shape of a slide (groups count as one) is reduced to its
+bounding box, together with the shapes its layout draws (the accent line);
+placeholders are placed as on their layout (see ``metrics.slide_shapes``). Candidate pairs come from a sort-and-sweep index: boxes are
+sorted by their left (or top) edge, and each box is only paired with those
+that start before it ends on that axis, found by binary search. The sweep runs
+along whichever axis gives fewer candidates, so a column of full-width rows
+sweeps vertically and a row of cards horizontally. Building the index is
+O(n log n); the remaining work is proportional to the candidates, and the
+pair tests are vectorized with NumPy.
+
+A pair that overlaps by more than ``tolerance`` on both axes is reported as:
+
+- ``text`` when both shapes hold text, nested or not: the texts draw over
+  each other;
+- ``overlap`` when neither box contains the other. A box entirely inside
+  another (text on a card, a badge in a row) is intended nesting.
+
+Shapes reaching past the slide edges, or into ``margin`` of them, are
+reported as ``bounds``.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+from .metrics import qn, shape_name, slide_shapes
+
+EMU_PER_INCH = 914400
+TOLERANCE = 6350  # 0.5pt: touching edges and rounding are not overlaps
+
+_T = qn("a:t")
+
+
+@dataclass(frozen=True)
+class Issue:
+    slide: int
+    kind: str  # "bounds", "overlap" or "text"
+    shapes: tuple  # shape names
+    detail: str
+
+
+def shape_boxes(slide):
+    """``(names, boxes, has_text)`` for the shapes drawn on ``slide``.
+
+    ``boxes`` is an ``(n, 4)`` int64 array of left, top, right, bottom in EMU.
+    """
+    names, rows, texts = [], [], []
+    for el, rect in slide_shapes(slide):
+        rows.append(rect)
+        names.append(shape_name(el))
+        texts.append(any(t.text for t in el.iter(_T)))
+    boxes = np.array(rows, dtype=np.int64).reshape(-1, 4)
+    return names, boxes, np.array(texts, dtype=bool)
+
+
+def candidate_pairs(boxes):
+    """Index pairs ``(i, j)`` whose boxes overlap on the sweep axis."""
+    n = len(boxes)
+    best = None
+    for axis in (0, 1):
+        order = np.argsort(boxes[:, axis], kind="stable")
+        starts = boxes[order, axis]
+        ends = np.searchsorted(starts, boxes[order, axis + 2], side="left")
+        counts = np.maximum(ends - np.arange(1, n + 1), 0)
+        if best is None or counts.sum() < best[2].sum():
+            best = (order, ends, counts)
+    order, ends, counts = best
+    total = int(counts.sum())
+    first = np.repeat(np.arange(n), counts)
+    offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    return order[first], order[first + 1 + offsets]
+
+
+def slide_issues(number, names, boxes, has_text, size, tolerance=TOLERANCE, margin=0):
+    """Issues on one slide; ``size`` is the slide's ``(width, height)`` in EMU."""
+    issues = []
+    width, height = size
+    limits = np.array([margin, margin, width - margin, height - margin])
+    outside = (boxes[:, :2] < limits[:2] - tolerance).any(1) | \
+              (boxes[:, 2:] > limits[2:] + tolerance).any(1)
+    for i in np.flatnonzero(outside).tolist():
+        left, top, right, bottom = (boxes[i] / EMU_PER_INCH).tolist()
+        issues.append(Issue(number, "bounds", (names[i],),
+                            f"spans {left:.2f},{top:.2f} to {right:.2f},{bottom:.2f}in"))
+
+    i, j = candidate_pairs(boxes)
+    a, b = boxes[i], boxes[j]
+    overlap_w = np.minimum(a[:, 2], b[:, 2]) - np.maximum(a[:, 0], b[:, 0])
+    overlap_h = np.minimum(a[:, 3], b[:, 3]) - np.maximum(a[:, 1], b[:, 1])
+    hit = (overlap_w > tolerance) & (overlap_h > tolerance)
+    a_in_b = ((a[:, :2] >= b[:, :2] - tolerance) & (a[:, 2:] <= b[:, 2:] + tolerance)).all(1)
+    b_in_a = ((b[:, :2] >= a[:, :2] - tolerance) & (b[:, 2:] <= a[:, 2:] + tolerance)).all(1)
+    text = hit & has_text[i] & has_text[j]
+    overlap = hit & ~text & ~a_in_b & ~b_in_a
+    for kind, mask in (("text", text), ("overlap", overlap)):
+        for k in np.flatnonzero(mask).tolist():
+            first, second = sorted((int(i[k]), int(j[k])))
+            issues.append(Issue(number, kind, (names[first], names[second]),
+                                f"{overlap_w[k] / EMU_PER_INCH:.2f} x "
+                                f"{overlap_h[k] / EMU_PER_INCH:.2f}in"))
+    return issues
+
+
+def lint(prs, tolerance=TOLERANCE, margin=0):
+    """Every layout issue in ``prs``, slide by slide."""
+    size = (prs.slide_width, prs.slide_height)
+    issues = []
+    for number, slide in enumerate(prs.slides, 1):
+        names, boxes, has_text = shape_boxes(slide)
+        issues.extend(slide_issues(number, names, boxes, has_text, size, tolerance, margin))
+    return issues
@@ -0,0 +1,161 @@
+"""Slide master, layouts and theme built from the constants in ``theme.py``.
+
+python-pptx's default template is 4:3 Office theme with eleven layouts, and
+the deck used to repaint it on every slide: a background fill and an accent
+line per slide, the title as a fully styled text box. ``themed_template``
+rewrites the template once per process instead:
+
+- the theme part gets the deck's colors (``dk1`` VOID, ``lt1`` WHITE,
+  ``accent1``-``6`` ACCENT, AMBER, GREEN, PURPLE, RED, GRAY) and Segoe UI as
+  the major and minor font;
+- the master is dark (``bg1`` maps to ``dk1``), has a solid VOID background
+  and a single title placeholder, 40pt bold, at the deck's title position;
+- only two layouts remain: ``Content`` adds the accent line and the title
+  placeholder, ``Blank`` has neither.
+
+Slides inherit all of that, so their XML only holds what differs between
+them. Consolas has no slot in a DrawingML font scheme and stays per run.
+"""
+from functools import lru_cache
+
+from lxml import etree
+from pptx.oxml import parse_xml
+from pptx.util import Inches, Pt
+
+from .theme import (ACCENT, AMBER, BODY_FONT, DEEP, GRAY, GREEN, LIGHT_GRAY,
+                    PURPLE, RED, SLIDE_HEIGHT, SLIDE_WIDTH, VOID, WHITE)
+
+CONTENT_LAYOUT = "Content"
+BLANK_LAYOUT = "Blank"
+
+TITLE_FRAME = (Inches(0.8), Inches(0.9), Inches(11), Inches(0.8))
+TITLE_SIZE = 40
+ACCENT_FRAME = (Inches(0.8), Inches(0.8), Inches(2), Pt(3))
+
+_A = "http://schemas.openxmlformats.org/drawingml/2006/main"
+_P = "http://schemas.openxmlformats.org/presentationml/2006/main"
+_NS = {"a": _A, "p": _P}
+
+_SCHEME = {
+    "dk1": VOID, "lt1": WHITE, "dk2": DEEP, "lt2": LIGHT_GRAY,
+    "accent1": ACCENT, "accent2": AMBER, "accent3": GREEN,
+    "accent4": PURPLE, "accent5": RED, "accent6": GRAY,
+    "hlink": ACCENT, "folHlink": PURPLE,
+}
+_DARK_CLR_MAP = {"bg1": "dk1", "tx1": "lt1", "bg2": "dk2", "tx2": "lt2"}
+
+_BG = (f'<p:bg xmlns:p="{_P}" xmlns:a="{_A}"><p:bgPr><a:solidFill><a:srgbClr val="{VOID}"/>'
+       "</a:solidFill><a:effectLst/></p:bgPr></p:bg>")
+
+
+def _xfrm(left, top, width, height):
+    return (f'<a:xfrm><a:off x="{int(left)}" y="{int(top)}"/>'
+            f'<a:ext cx="{int(width)}" cy="{int(height)}"/></a:xfrm>')
+
+
+_TITLE_RPR = (f'sz="{TITLE_SIZE * 100}" b="1"><a:solidFill><a:srgbClr val="{WHITE}"/></a:solidFill>'
+              f'<a:latin typeface="{BODY_FONT}"/>')
+
+_TITLE_PH = (
+    f'<p:sp xmlns:p="{_P}" xmlns:a="{_A}"><p:nvSpPr><p:cNvPr id="2" name="Title 1"/>'
+    '<p:cNvSpPr><a:spLocks noGrp="1"/></p:cNvSpPr><p:nvPr><p:ph type="title"/></p:nvPr>'
+    f'</p:nvSpPr><p:spPr>{_xfrm(*TITLE_FRAME)}<a:prstGeom prst="rect"><a:avLst/></a:prstGeom>'
+    '</p:spPr><p:txBody><a:bodyPr wrap="square" anchor="t"><a:normAutofit/></a:bodyPr>'
+    f'<a:lstStyle><a:lvl1pPr algn="l"><a:defRPr {_TITLE_RPR}</a:defRPr></a:lvl1pPr></a:lstStyle>'
+    '<a:p><a:endParaRPr lang="en-US"/></a:p></p:txBody></p:sp>'
+)
+
+_ACCENT_SP = (
+    f'<p:sp xmlns:p="{_P}" xmlns:a="{_A}"><p:nvSpPr><p:cNvPr id="3" name="Accent Line"/>'
+    '<p:cNvSpPr/><p:nvPr userDrawn="1"/></p:nvSpPr>'
+    f'<p:spPr>{_xfrm(*ACCENT_FRAME)}<a:prstGeom prst="rect"><a:avLst/></a:prstGeom>'
+    f'<a:solidFill><a:srgbClr val="{ACCENT}"/></a:solidFill><a:ln><a:noFill/></a:ln></p:spPr>'
+    "</p:sp>"
+)
+
+
+def _theme_xml(blob):
+    theme = etree.fromstring(blob)
+    theme.set("name", "Suistody")
+    scheme = theme.find("a:themeElements/a:clrScheme", _NS)
+    scheme.set("name", "Suistody")
+    for slot in scheme:
+        name = etree.QName(slot).localname
+        for child in list(slot):
+            slot.remove(child)
+        etree.SubElement(slot, f"{{{_A}}}srgbClr", val=str(_SCHEME[name]))
+    fonts = theme.find("a:themeElements/a:fontScheme", _NS)
+    fonts.set("name", "Suistody")
+    for latin in fonts.iterfind("*/a:latin", _NS):
+        latin.set("typeface", BODY_FONT)
+    return etree.tostring(theme, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+
+def _replace_bg(c_sld):
+    bg = c_sld.find("p:bg", _NS)
+    if bg is not None:
+        c_sld.remove(bg)
+    c_sld.insert(0, parse_xml(_BG))
+
+
+def _strip_shapes(sp_tree):
+    for sp in sp_tree.findall("p:sp", _NS):
+        sp_tree.remove(sp)
+
+
+def apply_theme(prs):
+    """Rebuild ``prs``'s theme, master and layouts in place (before adding slides)."""
+    from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+
+    master = prs.slide_master
+    theme = master.part.part_related_by(RT.THEME)
+    theme._blob = _theme_xml(theme.blob)
+
+    m = master._element
+    _replace_bg(m.find("p:cSld", _NS))
+    sp_tree = m.find("p:cSld/p:spTree", _NS)
+    _strip_shapes(sp_tree)
+    sp_tree.append(parse_xml(_TITLE_PH))
+    m.find("p:clrMap", _NS).attrib.update(_DARK_CLR_MAP)
+    title_ppr = m.find("p:txStyles/p:titleStyle/a:lvl1pPr", _NS)
+    title_ppr.set("algn", "l")
+    title_ppr.replace(title_ppr.find("a:defRPr", _NS), parse_xml(
+        f'<a:defRPr xmlns:a="{_A}" {_TITLE_RPR}</a:defRPr>'))
+
+    keep = {"Title Only": CONTENT_LAYOUT, "Blank": BLANK_LAYOUT}
+    for layout in list(prs.slide_layouts):
+        if layout.name not in keep:
+            prs.slide_layouts.remove(layout)
+            continue
+        c_sld = layout._element.find("p:cSld", _NS)
+        c_sld.set("name", keep[layout.name])
+        sp_tree = c_sld.find("p:spTree", _NS)
+        _strip_shapes(sp_tree)
+        if c_sld.get("name") == CONTENT_LAYOUT:
+            sp_tree.append(parse_xml(_ACCENT_SP))
+            sp_tree.append(parse_xml(_TITLE_PH))
+    return prs
+
+
+@lru_cache(maxsize=None)
+def themed_template():
+    """The themed, widescreen template as .pptx bytes, built once per process."""
+    import io
+
+    from pptx import Presentation
+
+    prs = Presentation()
+    prs.slide_width = SLIDE_WIDTH
+    prs.slide_height = SLIDE_HEIGHT
+    apply_theme(prs)
+    buf = io.BytesIO()
+    prs.save(buf)
+    return buf.getvalue()
+
+
+def get_layout(prs, name):
+    """The slide layout called ``name`` (``CONTENT_LAYOUT`` or ``BLANK_LAYOUT``)."""
+    found = prs.slide_layouts.get_by_name(name)
+    if found is None:
+        raise ValueError(f"Unknown slide layout: {name!r}")
+    return found
@@ -0,0 +1,242 @@
+"""Merge .pptx packages built from consecutive slide ranges into one deck.
+
+``batch.render_split`` renders ranges of one deck's slides in worker
+processes; each worker saves its range as a complete, uncompressed package and
+the parent appends them in order to a ``PackageMerger``. Merging works on the
+ZIP entries and never parses slide XML:
+
+- the shared parts (master, layouts, theme, properties) are written once,
+  from the first package. A later package's slides are pointed at the first
+  package's part with the same content (and rels), so layouts are
+  deduplicated rather than copied per range;
+- parts owned by slides (the slides themselves, charts and their workbooks,
+  notes, media) are renumbered in deck order, and media is deduplicated by
+  SHA-1;
+- relationship ids are local to their source part, so only the ``.rels``
+  entries are rewritten, with targets pointing at the renumbered parts.
+  ``presentation.xml`` gets a new ``sldIdLst`` (ids from 256), its rels are
+  renumbered after the shared ones, and ``[Content_Types].xml`` is
+  regenerated from the parts actually written, sorted like python-pptx's.
+
+Part names and entry order follow the deck order, not the range boundaries,
+so a deterministic merge gives the same bytes whatever the worker count.
+
+Shape ids are scoped to their slide in PresentationML, so slides keep the ids
+they were built with.
+"""
+import hashlib
+import io
+import posixpath
+import re
+import zipfile
+
+from lxml import etree
+
+from .writer import DEFAULT_COMPRESSION, PackageStreamWriter, content_kind
+
+_PKG_RELS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_OFFICE_RELS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_NS = {
+    "rel": _PKG_RELS,
+    "ct": "http://schemas.openxmlformats.org/package/2006/content-types",
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+}
+_RID = f"{{{_OFFICE_RELS}}}id"
+RT_SLIDE = f"{_OFFICE_RELS}/slide"
+RT_OFFICE_DOCUMENT = f"{_OFFICE_RELS}/officeDocument"
+_XML_HEADER = b"<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+_NUMBERED = re.compile(r"^(.*?)(\d*)(\.[^./]+)$")
+_SLD_ID_LST = re.compile(rb"<p:sldIdLst>.*?</p:sldIdLst>|<p:sldIdLst/>", re.S)
+
+
+def _rels_member(name):
+    """``.rels`` member of the part ``name``; ``""`` is the package itself."""
+    folder, base = posixpath.split(name)
+    return posixpath.join(folder, "_rels", base + ".rels")
+
+
+class _Package:
+    """Index of one input package: content types, relationships and shared parts."""
+
+    def __init__(self, blob):
+        self.zip = zipfile.ZipFile(io.BytesIO(blob) if isinstance(blob, bytes) else blob)
+        self.members = set(self.zip.namelist())
+        types = etree.fromstring(self.zip.read("[Content_Types].xml"))
+        self.defaults = {d.get("Extension").lower(): d.get("ContentType")
+                         for d in types.iterfind("ct:Default", _NS)}
+        self.overrides = {o.get("PartName").lstrip("/"): o.get("ContentType")
+                          for o in types.iterfind("ct:Override", _NS)}
+        self.main = next(target for rel, target in self.rels("")
+                         if rel.get("Type") == RT_OFFICE_DOCUMENT)
+        self.shared = self._shared_parts()
+
+    def content_type(self, name):
+        ext = posixpath.splitext(name)[1][1:].lower()
+        return self.overrides.get(name) or self.defaults[ext]
+
+    def rels(self, name):
+        """``[(Relationship element, target member name or None if external)]``."""
+        member = _rels_member(name)
+        if member not in self.members:
+            return []
+        folder = posixpath.dirname(name)
+        return [(rel, None if rel.get("TargetMode") == "External" else
+                 posixpath.normpath(posixpath.join(folder, rel.get("Target"))).lstrip("/"))
+                for rel in etree.fromstring(self.zip.read(member)).iterfind("rel:Relationship", _NS)]
+
+    def _shared_parts(self):
+        """``{name: content hash}`` of every part reachable without going through a slide."""
+        shared, todo = {}, ["", self.main]
+        while todo:
+            name = todo.pop()
+            for rel, target in self.rels(name):
+                if target is None or target in shared or target == self.main or (
+                        name == self.main and rel.get("Type") == RT_SLIDE):
+                    continue
+                h = hashlib.sha1(self.zip.read(target))
+                if _rels_member(target) in self.members:
+                    h.update(self.zip.read(_rels_member(target)))
+                shared[target] = h.hexdigest()
+                todo.append(target)
+        return shared
+
+
+class PackageMerger:
+    """Append the slides of whole .pptx packages, in order, to one output package.
+
+    Every package must be built from the same template (see ``master.py``);
+    ``add`` raises ValueError when a slide uses a layout the first package
+    does not have.
+    """
+
+    def __init__(self, sink, compression=DEFAULT_COMPRESSION, deterministic=False):
+        self._writer = PackageStreamWriter(sink, compression, deterministic)
+        self._first = None
+        self._shared = {}  # content hash -> shared part name (first package)
+        self._media = {}  # sha1 -> media part name
+        self._types = {}  # every part written -> content type
+        self._numbers = {}  # (stem, ext) -> last number used
+        self._slides = []  # slide part names in deck order
+
+    @property
+    def count(self):
+        return len(self._slides)
+
+    @property
+    def etag(self):
+        return self._writer.etag
+
+    def add(self, blob):
+        """Append every slide of ``blob`` (package bytes or a binary file)."""
+        pkg = _Package(blob)
+        if self._first is None:
+            self._first = pkg
+            self._write_shared(pkg)
+        by_rid = {rel.get("Id"): target for rel, target in pkg.rels(pkg.main)}
+        renamed = {}  # this package's part names -> output part names
+        pres = etree.fromstring(pkg.zip.read(pkg.main))
+        for sld_id in pres.iterfind("p:sldIdLst/p:sldId", _NS):
+            self._slides.append(self._place(pkg, by_rid[sld_id.get(_RID)], renamed))
+
+    def _write_shared(self, pkg):
+        self._writer.write(_rels_member(""), pkg.zip.read(_rels_member("")))
+        for name, digest in pkg.shared.items():
+            self._shared.setdefault(digest, name)
+            self._copy_entry(pkg, name)
+
+    def _copy_entry(self, pkg, name):
+        ctype = self._types[name] = pkg.content_type(name)
+        self._writer.write(name, pkg.zip.read(name), content_kind(ctype))
+        if _rels_member(name) in pkg.members:
+            self._writer.write(_rels_member(name), pkg.zip.read(_rels_member(name)))
+
+    def _next_name(self, name):
+        stem, _, ext = _NUMBERED.match(name).groups()
+        n = self._numbers.get((stem, ext), 0)
+        while True:
+            n += 1
+            new = f"{stem}{n}{ext}"
+            if new not in self._types:
+                self._numbers[stem, ext] = n
+                return new
+
+    def _place(self, pkg, name, renamed):
+        """Output name of ``pkg``'s part ``name``, writing the part on first use."""
+        if name in renamed:
+            return renamed[name]
+        if name in pkg.shared:
+            try:
+                renamed[name] = self._shared[pkg.shared[name]]
+            except KeyError:
+                raise ValueError(f"{name} differs from every part of the first package; "
+                                 "merge only decks built from the same template") from None
+            return renamed[name]
+
+        blob = pkg.zip.read(name)
+        ctype = pkg.content_type(name)
+        if ctype.startswith("image/"):
+            digest = hashlib.sha1(blob).hexdigest()
+            if digest in self._media:
+                renamed[name] = self._media[digest]
+                return renamed[name]
+            new = self._media[digest] = self._next_name(name)
+        else:
+            new = self._next_name(name)
+        renamed[name] = new
+        self._types[new] = ctype
+        rels = pkg.rels(name)
+        for rel, target in rels:
+            if target is not None:
+                rel.set("Target", posixpath.relpath(self._place(pkg, target, renamed),
+                                                    posixpath.dirname(new)))
+        self._writer.write(new, blob, content_kind(ctype))
+        if rels:
+            self._writer.write(_rels_member(new), _XML_HEADER + etree.tostring(rels[0][0].getparent()))
+        return new
+
+    def close(self):
+        first = self._first
+        if first is None:
+            raise ValueError("no packages to merge")
+        rels = [rel for rel, _ in first.rels(first.main) if rel.get("Type") != RT_SLIDE]
+        next_rid = 1 + max((int(rel.get("Id")[3:]) for rel in rels
+                            if rel.get("Id")[3:].isdigit()), default=0)
+        folder = posixpath.dirname(first.main)
+        slide_rels = [(f"rId{next_rid + i}", posixpath.relpath(name, folder))
+                      for i, name in enumerate(self._slides)]
+
+        sld_ids = "".join(f'<p:sldId id="{256 + i}" r:id="{rid}"/>'
+                          for i, (rid, _) in enumerate(slide_rels))
+        pres = _SLD_ID_LST.sub(lambda m: f"<p:sldIdLst>{sld_ids}</p:sldIdLst>".encode(),
+                               first.zip.read(first.main), count=1)
+        self._types[first.main] = first.content_type(first.main)
+        self._writer.write(first.main, pres)
+        self._writer.write(_rels_member(first.main), _XML_HEADER + (
+            f'<Relationships xmlns="{_PKG_RELS}">'
+            + "".join(etree.tostring(rel, encoding=str).replace(f' xmlns="{_PKG_RELS}"', "")
+                      for rel in rels)
+            + "".join(f'<Relationship Id="{rid}" Type="{RT_SLIDE}" Target="{target}"/>'
+                      for rid, target in slide_rels)
+            + "</Relationships>").encode())
+
+        defaults = dict(first.defaults)
+        overrides = []
+        for name, ctype in sorted(self._types.items()):
+            ext = posixpath.splitext(name)[1][1:].lower()
+            if defaults.setdefault(ext, ctype) != ctype:
+                overrides.append(f'<Override PartName="/{name}" ContentType="{ctype}"/>')
+        self._writer.write("[Content_Types].xml", _XML_HEADER + (
+            f'<Types xmlns="{_NS["ct"]}">'
+            + "".join(f'<Default Extension="{ext}" ContentType="{ctype}"/>'
+                      for ext, ctype in sorted(defaults.items()))
+            + "".join(overrides) + "</Types>").encode())
+        self._writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.close()
+        else:  # leave an obviously broken package rather than a silently short one
+            self._writer.close()
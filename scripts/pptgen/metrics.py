@@ -0,0 +1,478 @@
+"""Font metrics for text fitting and overflow checks.
+
+Glyph advances are read once per font file into a NumPy table indexed by code
+point (at a 1000 px reference size, in em) and scaled linearly to any point
+size, so measuring text never touches the font file again. Strings are
+measured in bulk: their code points are concatenated into one array, looked up
+in the table and summed per string with a cumulative sum.
+
+Wrapping follows PowerPoint's rules closely enough for layout checks: lines
+break at spaces, a word wider than the box breaks mid-word, single line
+spacing is 1.2x the font size and the first paragraph's space-before is
+ignored. Kerning and ligatures are not modelled.
+
+Fonts are looked up by file name in ``FONT_DIRS``; when a family is not
+installed (Segoe UI and Consolas on Linux) a stand-in from ``FONT_FILES`` is
+used: Selawik, which is metric-compatible with Segoe UI, or else DejaVu with
+its advances scaled by the average width ratio to the real family. Scaled
+stand-ins are close on average but not per glyph, so checks allow a small
+tolerance.
+"""
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from .theme import BODY_FONT
+
+EMU_PER_PT = 12700
+LINE_HEIGHT = 1.2  # single spacing, as a multiple of the font size
+INSET_X = 91440  # a:bodyPr defaults: 0.1" left/right, 0.05" top/bottom
+INSET_Y = 45720
+TABLE_SIZE = 0x0800  # Latin, Greek, Cyrillic; other code points are looked up once each
+_REF_PX = 1000
+
+FONT_DIRS = [
+    Path.home() / ".fonts",
+    Path.home() / ".local/share/fonts",
+    Path("/usr/share/fonts"),
+    Path("/usr/local/share/fonts"),
+    Path("/Library/Fonts"),
+    Path("/System/Library/Fonts"),
+    Path("C:/Windows/Fonts"),
+]
+
+# family -> candidate (regular, bold, width scale) file names, preferred first
+FONT_FILES = {
+    "Segoe UI": [("segoeui.ttf", "segoeuib.ttf", 1.0),
+                 ("selawk.ttf", "selawkb.ttf", 1.0),
+                 ("DejaVuSans.ttf", "DejaVuSans-Bold.ttf", 0.88)],
+    "Consolas": [("consola.ttf", "consolab.ttf", 1.0),
+                 ("DejaVuSansMono.ttf", "DejaVuSansMono-Bold.ttf", 0.913)],  # 1126 / 1233 units
+}
+
+
+@lru_cache(maxsize=None)
+def _font_index():
+    index = {}
+    for directory in FONT_DIRS:
+        if directory.is_dir():
+            for path in directory.rglob("*.[ot]tf"):
+                index.setdefault(path.name.lower(), path)
+    return index
+
+
+def _find(font_name, bold):
+    index = _font_index()
+    for candidates in FONT_FILES.get(font_name, FONT_FILES[BODY_FONT]):
+        path = index.get(candidates[bold].lower())
+        if path is not None:
+            return path, candidates[2]
+    raise ValueError(f"No font file for {font_name!r} in {[str(d) for d in FONT_DIRS]}")
+
+
+def find_font(font_name, bold=False):
+    """Path of the font file used to measure ``font_name``."""
+    return _find(font_name, bold)[0]
+
+
+class FontFace:
+    """Advance widths of one font file, in em, times ``scale``."""
+
+    def __init__(self, path, scale=1.0):
+        from PIL import ImageFont
+
+        self.path = path
+        self._font = ImageFont.truetype(str(path), _REF_PX,
+                                        layout_engine=ImageFont.Layout.BASIC)
+        self._scale = scale / _REF_PX
+        self.table = np.array([self._font.getlength(chr(c)) for c in range(TABLE_SIZE)],
+                              dtype=np.float64) * self._scale
+        self._extra = {}
+        self.space = float(self.table[ord(" ")])
+
+    def advances(self, codepoints):
+        widths = self.table[np.minimum(codepoints, TABLE_SIZE - 1)]
+        outside = codepoints >= TABLE_SIZE
+        if outside.any():
+            for cp in np.unique(codepoints[outside]).tolist():
+                if cp not in self._extra:
+                    self._extra[cp] = self._font.getlength(chr(cp)) * self._scale
+            widths[outside] = [self._extra[cp] for cp in codepoints[outside].tolist()]
+        return widths
+
+    def widths(self, texts):
+        """Width in em of each string in ``texts``, in one vectorized pass."""
+        codepoints = np.frombuffer("".join(texts).encode("utf-32-le"), dtype=np.uint32)
+        lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+        ends = np.cumsum(lengths)
+        totals = np.concatenate(([0.0], np.cumsum(self.advances(codepoints))))
+        return totals[ends] - totals[ends - lengths]
+
+
+@lru_cache(maxsize=None)
+def font_face(font_name, bold=False):
+    """The cached ``FontFace`` for a family; its table is built on first use."""
+    return _face_for_path(*_find(font_name, bold))
+
+
+@lru_cache(maxsize=None)
+def _face_for_path(path, scale):
+    return FontFace(path, scale)
+
+
+def text_widths(texts, font_name=BODY_FONT, size=18, bold=False):
+    """Single-line widths in EMU of ``texts`` at ``size`` points."""
+    return font_face(font_name, bold).widths(list(texts)) * (size * EMU_PER_PT)
+
+
+# ============================================================
+# Text boxes
+# ============================================================
+@dataclass(frozen=True)
+class Para:
+    text: str
+    font_name: str = BODY_FONT
+    size: float = 18  # points
+    bold: bool = False
+    space_before: float = 0  # points
+
+
+@dataclass
+class TextBox:
+    paragraphs: list
+    width: int  # EMU, including insets
+    height: int  # for boxes that grow, the room they can grow into
+    wrap: bool = True
+    grows: bool = False  # a:spAutoFit: the box's height follows its text
+    bound: str = ""  # what a growing box runs past beyond ``height``
+    insets: tuple = (INSET_X, INSET_Y, INSET_X, INSET_Y)  # left, top, right, bottom
+    name: str = ""
+    slide: int = 0
+    _words: list = field(default=None, init=False, repr=False)
+
+    def words(self):
+        """Per paragraph: (word widths in em for each line, space width in em)."""
+        if self._words is None:
+            measure([self])
+        return self._words
+
+    def layout(self, scale=1.0):
+        """(lines, text height, widest line) in EMU with font sizes scaled."""
+        avail = self.width - self.insets[0] - self.insets[2]
+        lines = 0
+        height = 0.0
+        widest = 0.0
+        for i, (para, (measured, space)) in enumerate(zip(self.paragraphs, self.words())):
+            em = para.size * scale * EMU_PER_PT
+            count = 0
+            for word_widths in measured:
+                n, w = _wrap(word_widths, em, space * em, avail if self.wrap else None)
+                count += n
+                widest = max(widest, w)
+            lines += count
+            height += count * em * LINE_HEIGHT
+            if i:
+                height += para.space_before * scale * EMU_PER_PT
+        return lines, height + self.insets[1] + self.insets[3], widest
+
+    def overflow(self):
+        """EMU by which the text runs past the bottom of the box (<= 0 fits)."""
+        return self.layout()[1] - self.height
+
+    def fit_scale(self, min_scale=0.25, step=0.025):
+        """Largest font scale <= 1 at which the text fits, or None."""
+        if self.overflow() <= 0:
+            return 1.0
+        lo, hi = 0, int((1 - min_scale) / step)
+        if self.layout(min_scale)[1] > self.height:
+            return None
+        while lo < hi:  # smallest number of steps down that fits
+            mid = (lo + hi) // 2
+            if self.layout(1 - mid * step)[1] <= self.height:
+                hi = mid
+            else:
+                lo = mid + 1
+        return round(1 - lo * step, 4)
+
+
+def measure(boxes):
+    """Measure every word in ``boxes`` with one vectorized pass per font face."""
+    groups = defaultdict(lambda: ([], []))  # face -> (words, (line list, word count))
+    for box in boxes:
+        box._words = []
+        for para in box.paragraphs:
+            face = font_face(para.font_name, para.bold)
+            words, slots = groups[face]
+            lines = []
+            box._words.append((lines, face.space))
+            for line in para.text.replace("\v", "\n").split("\n"):
+                line_words = line.split(" ")
+                words.extend(line_words)
+                slots.append((lines, len(line_words)))
+    for face, (words, slots) in groups.items():
+        widths = face.widths(words).tolist()
+        start = 0
+        for lines, count in slots:
+            lines.append(widths[start:start + count])
+            start += count
+    return boxes
+
+
+def _wrap(word_widths, em, space, avail):
+    """Greedy line count and widest line (EMU) for one hard line of words."""
+    if avail is None:
+        return 1, sum(word_widths) * em + space * (len(word_widths) - 1)
+    lines = 1
+    current = -space
+    widest = 0.0
+    for w in word_widths:
+        w *= em
+        if current + space + w <= avail or current < 0:
+            current += space + w
+        else:
+            widest = max(widest, current)
+            lines += 1
+            current = w
+        if current > avail:  # a single word wider than the box breaks mid-word
+            extra = int(current // avail)
+            lines += extra
+            current -= extra * avail
+            widest = avail
+    return lines, max(widest, current)
+
+
+def fit_font_size(text, width, height, font_name=BODY_FONT, bold=False,
+                  max_size=40, min_size=8, step=0.5):
+    """Largest size in points, on a ``step`` grid, at which ``text`` fits the box."""
+    box = TextBox([Para(text, font_name, max_size, bold)], width, height)
+    scale = box.fit_scale(min_scale=min_size / max_size, step=step / max_size)
+    return None if scale is None else round(max_size * scale / step) * step
+
+
+# ============================================================
+# Deck checks
+# ============================================================
+_NSMAP = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+}
+
+
+def qn(tag):
+    """Clark-notation name for ``a:``/``p:`` tags, without importing python-pptx."""
+    prefix, name = tag.split(":")
+    return f"{{{_NSMAP[prefix]}}}{name}"
+
+
+_BR = qn("a:br")
+_T = qn("a:t")
+_TEXT_TAGS = {qn("a:r"), qn("a:fld"), _BR}
+_DEF_RPR = f"{qn('a:pPr')}/{qn('a:defRPr')}"
+_RUN_RPR = f"{qn('a:r')}/{qn('a:rPr')}"
+_LATIN = qn("a:latin")
+_SPC_BEF = f"{qn('a:pPr')}/{qn('a:spcBef')}/{qn('a:spcPts')}"
+_SP, _P, _TX_BODY, _BODY_PR = qn("p:sp"), qn("a:p"), qn("p:txBody"), qn("a:bodyPr")
+_SP_AUTO_FIT = qn("a:spAutoFit")
+_EXT = f"{qn('p:spPr')}/{qn('a:xfrm')}/{qn('a:ext')}"
+_XFRMS = {
+    _SP: f"{qn('p:spPr')}/{qn('a:xfrm')}",
+    qn("p:pic"): f"{qn('p:spPr')}/{qn('a:xfrm')}",
+    qn("p:cxnSp"): f"{qn('p:spPr')}/{qn('a:xfrm')}",
+    qn("p:grpSp"): f"{qn('p:grpSpPr')}/{qn('a:xfrm')}",
+    qn("p:graphicFrame"): qn("p:xfrm"),
+}
+_OFF = qn("a:off")
+SLIDE_EDGE = "the bottom of the slide"
+_NAME = f"{qn('p:nvSpPr')}/{qn('p:cNvPr')}"
+_INSETS = (("lIns", INSET_X), ("tIns", INSET_Y), ("rIns", INSET_X), ("bIns", INSET_Y))
+
+
+_PH = f"{qn('p:nvSpPr')}/{qn('p:nvPr')}/{qn('p:ph')}"
+_LVL1_RPR = f"{_TX_BODY}/{qn('a:lstStyle')}/{qn('a:lvl1pPr')}/{qn('a:defRPr')}"
+
+
+def para_from_xml(p, inherited=None):
+    """``Para`` for ``p``; ``inherited`` is the ``a:lvl1pPr/a:defRPr`` its body or
+    placeholder defines, if any.
+
+    Each property comes from the first of the paragraph's ``a:defRPr``, its
+    first run's ``a:rPr`` and ``inherited`` that sets it.
+    """
+    chain = [rPr for rPr in (p.find(_DEF_RPR), p.find(_RUN_RPR), inherited) if rPr is not None]
+    size = next((rPr.get("sz") for rPr in chain if rPr.get("sz") is not None), "1800")
+    bold = next((rPr.get("b") for rPr in chain if rPr.get("b") is not None), None)
+    latin = next((el for rPr in chain if (el := rPr.find(_LATIN)) is not None), None)
+    size, bold = int(size) / 100, bold in ("1", "true")
+    font_name = latin.get("typeface") if latin is not None else BODY_FONT
+    spc = p.find(_SPC_BEF)
+    space_before = int(spc.get("val")) / 100 if spc is not None else 0
+    text = "".join("\n" if child.tag == _BR else child.findtext(_T, "")
+                   for child in p if child.tag in _TEXT_TAGS)
+    return Para(text, font_name, size, bold, space_before)
+
+
+def layout_placeholders(sp_tree):
+    """Placeholder ``p:sp`` elements of a layout's (or master's) spTree.
+
+    Keyed by type (``body`` if unset) and, for those that set one, by
+    ``("idx", idx)``.
+    """
+    found = {}
+    for sp in sp_tree.iter(_SP):
+        ph = sp.find(_PH)
+        if ph is not None:
+            found[ph.get("type", "body")] = sp
+            if ph.get("idx") is not None:
+                found[("idx", ph.get("idx"))] = sp
+    return found
+
+
+def inherited_placeholder(sp, placeholders):
+    """The placeholder ``sp`` inherits position and text style from, or None.
+
+    Matched by ``idx`` first, then by type.
+    """
+    ph = sp.find(_PH)
+    if ph is None:
+        return None
+    base = placeholders.get(("idx", ph.get("idx")))
+    return base if base is not None else placeholders.get(ph.get("type", "body"))
+
+
+def shape_rect(el, base=None):
+    """``(left, top, right, bottom)`` EMU of a top-level shape, or None.
+
+    A shape without its own ``a:xfrm`` (a placeholder) takes ``base``'s.
+    """
+    path = _XFRMS.get(el.tag)
+    xfrm = el.find(path) if path is not None else None
+    if xfrm is None and base is not None:
+        xfrm = base.find(_XFRMS[_SP])
+    if xfrm is None:
+        return None
+    off, ext = xfrm.find(_OFF), xfrm.find(qn("a:ext"))
+    x, y = int(off.get("x")), int(off.get("y"))
+    return x, y, x + int(ext.get("cx")), y + int(ext.get("cy"))
+
+
+def shape_name(el):
+    return el[0][0].get("name")
+
+
+def slide_shapes(slide):
+    """``(element, rect)`` for every shape drawn on ``slide``, bottom first.
+
+    The layout's non-placeholder shapes (the accent line) come first, then the
+    slide's top-level shapes. Placeholders without their own ``a:xfrm`` are
+    placed as the layout placeholder with the same idx or type, or else the
+    master's.
+    """
+    layout_tree = slide.slide_layout.shapes._spTree
+    levels = [layout_placeholders(layout_tree),
+              layout_placeholders(slide.slide_layout.slide_master.shapes._spTree)]
+    for el in layout_tree:
+        if el.tag in _XFRMS and el.find(_PH) is None and (rect := shape_rect(el)):
+            yield el, rect
+    for el in slide.shapes._spTree:
+        if el.tag not in _XFRMS:
+            continue
+        rect = shape_rect(el) or _inherited_rect(el, levels)
+        if rect is not None:
+            yield el, rect
+
+
+def _inherited_rect(el, levels):
+    for placeholders in levels:
+        base = inherited_placeholder(el, placeholders)
+        rect = shape_rect(base) if base is not None else None
+        if rect is not None:
+            return rect
+    return None
+
+
+def grow_room(sp, rect, shapes, bottom):
+    """``(room, bound)``: how far down from its top ``sp`` can grow, and into what.
+
+    It grows until the bottom of a shape it sits on (its card), the top of the
+    nearest shape below it or ``bottom``, the slide edge.
+    """
+    left, top, right, low = rect
+    limit, bound = bottom, SLIDE_EDGE
+    for el, (l, t, r, b) in shapes:
+        if el is sp:
+            continue
+        if l <= left and r >= right and t <= top and b >= low:
+            edge, side = b, "bottom"
+        elif t >= low and l < right and r > left:
+            edge, side = t, "top"
+        else:
+            continue
+        if edge < limit:
+            limit, bound = edge, f"the {side} of {shape_name(el)!r}"
+    return limit - top, bound
+
+
+def text_boxes(prs):
+    """A ``TextBox`` for every shape in ``prs`` that holds text.
+
+    Placeholders take their size, insets and default text style from the
+    matching placeholder of their slide layout. A top-level box that grows with
+    its text gets the room down to whatever it would run into (``grow_room``)
+    as its height; one inside a group keeps its own.
+    """
+    for number, slide in enumerate(prs.slides, 1):
+        sp_tree = slide.shapes._spTree
+        placeholders = layout_placeholders(slide.slide_layout.shapes._spTree)
+        shapes = None
+        for sp in sp_tree.iter(_SP):
+            body = sp.find(_TX_BODY)
+            base = inherited_placeholder(sp, placeholders)
+            ext = sp.find(_EXT)
+            if ext is None and base is not None:
+                ext = base.find(_EXT)
+            if body is None or ext is None:
+                continue
+            inherited = sp.find(_LVL1_RPR)
+            if inherited is None and base is not None:
+                inherited = base.find(_LVL1_RPR)
+            paragraphs = [para_from_xml(p, inherited) for p in body.iter(_P)]
+            if not any(p.text.strip() for p in paragraphs):
+                continue
+            bodyPr = body.find(_BODY_PR)
+            base_pr = base.find(f"{_TX_BODY}/{_BODY_PR}") if base is not None else None
+            props = {**(base_pr.attrib if base_pr is not None else {}), **bodyPr.attrib}
+            grows = sp.getparent() is sp_tree and any(
+                pr is not None and pr.find(_SP_AUTO_FIT) is not None for pr in (bodyPr, base_pr))
+            height, bound = int(ext.get("cy")), ""
+            if grows:
+                if shapes is None:
+                    shapes = list(slide_shapes(slide))
+                height, bound = grow_room(sp, shape_rect(sp, base), shapes, prs.slide_height)
+            yield TextBox(paragraphs, int(ext.get("cx")), height,
+                          wrap=props.get("wrap") != "none", grows=grows, bound=bound,
+                          insets=tuple(int(props.get(k, d)) for k, d in _INSETS),
+                          name=sp.find(_NAME).get("name"), slide=number)
+
+
+def check_overflow(boxes, tolerance=0):
+    """Rows of (box, EMU over the bottom, EMU over the right, fit scale or None).
+
+    Only boxes whose text overflows by more than ``tolerance`` EMU are listed.
+    For boxes that grow with their text (``a:spAutoFit``, as ``add_text`` makes
+    them) the bottom is that of the room they can grow into (see ``text_boxes``).
+    """
+    report = []
+    for box in measure(boxes):
+        _, height, widest = box.layout()
+        over_y = height - box.height
+        room = box.width - box.insets[0] - box.insets[2]
+        over_x = widest - room
+        if over_y > tolerance or over_x > tolerance:
+            scale = box.fit_scale() if over_y > 0 else 1.0
+            if over_x > 0 and scale is not None:
+                scale = min(scale, room / widest)
+            report.append((box, over_y, over_x, scale))
+    return report
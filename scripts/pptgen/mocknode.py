@@ -0,0 +1,203 @@
+"""Local stand-in for a Sui full node's JSON-RPC API, serving synthetic vaults.
+
+Answers the read methods ``vaults.py`` uses, with the response shapes of a
+real node (u64 fields as strings, Move structs nested under ``fields``):
+
+    sui_getObject, sui_multiGetObjects, suix_getOwnedObjects, suix_queryEvents
+
+JSON-RPC batches are answered too. The chain is generated from the vault
+count, so runs are repeatable; every vault is owned (through an OwnerCap) by
+``MOCK_OWNER``. ``latency`` delays every HTTP response, to see the effect of
+connection pooling and concurrency without a network.
+"""
+import hashlib
+import json
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .vaults import MODULE_NAME, PACKAGE_ID
+
+MOCK_OWNER = "0x" + hashlib.sha256(b"mock-owner").hexdigest()
+MAX_OBJECTS = 50
+MAX_PAGE = 50
+_START_MS = 1_767_225_600_000
+_DAY_MS = 86_400_000
+_MIST = 1_000_000_000
+
+
+def _address(*parts):
+    return "0x" + hashlib.sha256("/".join(map(str, parts)).encode()).hexdigest()
+
+
+class MockChain:
+    """Vaults, OwnerCaps and ``AgentWithdrawal`` events for ``vaults`` synthetic vaults.
+
+    Vault ``n`` has ``n % withdrawals + 1`` withdrawals, so vault sizes vary.
+    """
+
+    def __init__(self, vaults=100, withdrawals=60, package_id=PACKAGE_ID):
+        self.package_id = package_id
+        self.objects = {}
+        self.vault_ids = []
+        self.owner_caps = []
+        events = []
+        for n in range(vaults):
+            vault_id, fields, vault_events = self._vault(n, withdrawals)
+            self.vault_ids.append(vault_id)
+            self.objects[vault_id] = self._object(vault_id, "Vault", fields, {"Shared": {
+                "initial_shared_version": 1}})
+            cap_id = _address("owner-cap", n)
+            self.objects[cap_id] = self._object(cap_id, "OwnerCap", {
+                "id": {"id": cap_id}, "vault_id": vault_id}, {"AddressOwner": MOCK_OWNER})
+            self.owner_caps.append(cap_id)
+            events.extend(vault_events)
+        events.sort(key=lambda e: (int(e["timestampMs"]), e["id"]["txDigest"]), reverse=True)
+        self.events = events  # newest first
+        self._event_index = {e["id"]["txDigest"]: i for i, e in enumerate(events)}
+
+    def _type(self, name):
+        return f"{self.package_id}::{MODULE_NAME}::{name}"
+
+    def _object(self, object_id, name, fields, owner):
+        return {
+            "objectId": object_id, "version": "1", "digest": _address("digest", object_id)[2:46],
+            "type": self._type(name), "owner": owner,
+            "content": {"dataType": "moveObject", "type": self._type(name),
+                        "hasPublicTransfer": name != "Vault", "fields": fields},
+        }
+
+    def _vault(self, n, withdrawals):
+        vault_id = _address("vault", n)
+        budget = (n % 5 + 1) * 100 * _MIST
+        per_tx = budget // 20
+        cooldown = (n % 3 + 1) * 60_000
+        caps = [_address("agent-cap", n, i) for i in range(n % 3 + 1)]
+        events, spent = [], 0
+        for k in range(1, n % withdrawals + 2):
+            amount = min(per_tx, (n * 7919 + k * 104_729) * 1_000_003 % per_tx + _MIST // 10, budget - spent)
+            if amount <= 0:
+                break
+            spent += amount
+            timestamp = _START_MS + n * 7_000 + k * cooldown
+            digest = _address("tx", n, k)[2:46]
+            events.append({
+                "id": {"txDigest": digest, "eventSeq": "0"},
+                "packageId": self.package_id,
+                "transactionModule": MODULE_NAME,
+                "sender": _address("agent", n),
+                "type": self._type("AgentWithdrawal"),
+                "parsedJson": {
+                    "vault_id": vault_id, "amount": str(amount), "action_type": k % 4,
+                    "total_spent": str(spent), "remaining_budget": str(budget - spent),
+                    "tx_count": str(k), "timestamp": str(timestamp),
+                },
+                "timestampMs": str(timestamp),
+            })
+        last = int(events[-1]["timestampMs"]) if events else 0
+        fields = {
+            "id": {"id": vault_id},
+            "owner": MOCK_OWNER,
+            "balance_sui": str(budget - spent),
+            "policy": {"type": self._type("Policy"), "fields": {
+                "max_budget": str(budget), "max_per_tx": str(per_tx),
+                "allowed_actions": list(range(n % 4 + 1)), "cooldown_ms": str(cooldown),
+                "expires_at": str(_START_MS + (n % 7 - 2) * 30 * _DAY_MS),
+            }},
+            "authorized_caps": caps,
+            "total_spent": str(spent),
+            "last_tx_time": str(last),
+            "tx_count": str(len(events)),
+        }
+        return vault_id, fields, events
+
+    # JSON-RPC methods
+    def sui_getObject(self, object_id, options=None):
+        obj = self.objects.get(object_id)
+        if obj is None:
+            return {"error": {"code": "notExists", "object_id": object_id}}
+        return {"data": obj}
+
+    def sui_multiGetObjects(self, object_ids, options=None):
+        if len(object_ids) > MAX_OBJECTS:
+            raise ValueError(f"Number of object ids exceeds the limit of {MAX_OBJECTS}")
+        return [self.sui_getObject(object_id) for object_id in object_ids]
+
+    def suix_getOwnedObjects(self, owner, query=None, cursor=None, limit=None):
+        struct = ((query or {}).get("filter") or {}).get("StructType")
+        caps = [c for c in self.owner_caps
+                if owner == MOCK_OWNER and struct in (None, self._type("OwnerCap"))]
+        start = caps.index(cursor) + 1 if cursor else 0
+        page = caps[start:start + min(limit or MAX_PAGE, MAX_PAGE)]
+        return {"data": [{"data": self.objects[c]} for c in page],
+                "nextCursor": page[-1] if page else cursor,
+                "hasNextPage": start + len(page) < len(caps)}
+
+    def suix_queryEvents(self, query, cursor=None, limit=None, descending_order=False):
+        if query.get("MoveEventType") != self._type("AgentWithdrawal"):
+            return {"data": [], "nextCursor": None, "hasNextPage": False}
+        events = self.events if descending_order else self.events[::-1]
+        start = 0
+        if cursor:
+            index = self._event_index[cursor["txDigest"]]
+            start = (index if descending_order else len(events) - 1 - index) + 1
+        page = events[start:start + min(limit or MAX_PAGE, MAX_PAGE)]
+        return {"data": page, "nextCursor": page[-1]["id"] if page else cursor,
+                "hasNextPage": start + len(page) < len(events)}
+
+
+class MockRpcHandler(BaseHTTPRequestHandler):
+    server_version = "mock-sui-node"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _dispatch(self, request):
+        reply = {"jsonrpc": "2.0", "id": request.get("id")}
+        method = getattr(self.server.chain, str(request.get("method")), None)
+        if not str(request.get("method", "")).startswith(("sui_", "suix_")) or method is None:
+            reply["error"] = {"code": -32601, "message": f"Method not found: {request.get('method')}"}
+            return reply
+        with self.server.lock:
+            self.server.calls[request["method"]] = self.server.calls.get(request["method"], 0) + 1
+        try:
+            reply["result"] = method(*request.get("params", []))
+        except (ValueError, TypeError, KeyError) as e:
+            reply["error"] = {"code": -32602, "message": str(e)}
+        return reply
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        try:
+            request = json.loads(body)
+        except json.JSONDecodeError as e:
+            reply = {"jsonrpc": "2.0", "id": None, "error": {"code": -32700, "message": e.msg}}
+        else:
+            reply = ([self._dispatch(r) for r in request] if isinstance(request, list)
+                     else self._dispatch(request))
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        payload = json.dumps(reply).encode()
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+def start_mock_node(chain, host="127.0.0.1", port=0, latency=0.0):
+    """Serve ``chain`` from a background thread; returns the server (``.url``, ``.calls``).
+
+    Stop it with ``server.shutdown()``.
+    """
+    server = ThreadingHTTPServer((host, port), MockRpcHandler)
+    server.daemon_threads = True
+    server.chain = chain
+    server.latency = latency
+    server.lock = threading.Lock()
+    server.calls = {}  # method -> count
+    server.url = f"http://{host}:{server.server_address[1]}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -0,0 +1,280 @@
+"""Shrink a built .pptx by dropping unused parts and markup that restates defaults.
+
+``optimize_package`` rewrites a package entry by entry and parses each part at
+most once, so it runs in time linear in the package size:
+
+- a part is kept only if it is reachable from the package relationships.
+  Layouts that no slide uses are unlinked from their master. The template's
+  thumbnail and printer settings are also dropped, since they describe
+  nothing in the deck. ``[Content_Types].xml`` is regenerated for the parts
+  that remain;
+- ``styles.py`` sets run properties per paragraph, as ``a:pPr/a:defRPr``.
+  When every paragraph of a slide text body repeats the same ones (and
+  alignment), they are written once as the body's ``a:lstStyle/a:lvl1pPr``;
+- values a shape would inherit anyway are removed: ``algn``, ``sz``, ``b``,
+  ``i`` and a latin typeface that match both the master's ``otherStyle`` and
+  the presentation's ``defaultTextStyle`` (theme fonts resolved),
+  ``rtlCol="0"``, and empty ``a:avLst`` and ``a:lstStyle`` elements.
+
+Placeholders inherit from their layout and table cells from the table style,
+so for those only empty elements are removed. Charts, workbooks and media are
+copied unchanged.
+"""
+import posixpath
+from dataclasses import dataclass
+
+from lxml import etree
+
+from .merge import _OFFICE_RELS, _Package, _rels_member
+from .writer import DEFAULT_COMPRESSION, XML_CONTENT, PackageStreamWriter, content_kind
+
+_A = "http://schemas.openxmlformats.org/drawingml/2006/main"
+_P = "http://schemas.openxmlformats.org/presentationml/2006/main"
+_NS = {"a": _A, "p": _P, "r": _OFFICE_RELS,
+       "rel": "http://schemas.openxmlformats.org/package/2006/relationships",
+       "ct": "http://schemas.openxmlformats.org/package/2006/content-types"}
+_RID = f"{{{_OFFICE_RELS}}}id"
+_LVL1_PPR, _LST_STYLE = f"{{{_A}}}lvl1pPr", f"{{{_A}}}lstStyle"
+
+RT_SLIDE = f"{_OFFICE_RELS}/slide"
+RT_SLIDE_LAYOUT = f"{_OFFICE_RELS}/slideLayout"
+RT_SLIDE_MASTER = f"{_OFFICE_RELS}/slideMaster"
+RT_THEME = f"{_OFFICE_RELS}/theme"
+RT_THUMBNAIL = "http://schemas.openxmlformats.org/package/2006/relationships/metadata/thumbnail"
+RT_PRINTER_SETTINGS = f"{_OFFICE_RELS}/printerSettings"
+DROPPED_RELS = {RT_THUMBNAIL, RT_PRINTER_SETTINGS}
+
+SLIDE_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.slide+xml"
+# ECMA-376 defaults for level-1 text that neither text style overrides.
+_TEXT_DEFAULTS = {"algn": "l", "sz": "1800", "b": "0", "i": "0", "latin": "+mn-lt"}
+_FALSE, _TRUE = ("0", "false", "off"), ("1", "true", "on")
+
+
+@dataclass(frozen=True)
+class PartSavings:
+    name: str
+    before: int  # uncompressed bytes
+    after: int  # 0 when the part was dropped
+
+    @property
+    def saved(self):
+        return self.before - self.after
+
+
+def _xml(root):
+    return etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+
+def _flag(value):
+    return "1" if value in _TRUE else "0" if value in _FALSE else value
+
+
+# ============================================================
+# Inherited text style
+# ============================================================
+def _level1(ppr, fonts):
+    """Level-1 values of a text style's ``a:lvl1pPr`` (or None), theme fonts resolved."""
+    values = dict(_TEXT_DEFAULTS)
+    if ppr is not None:
+        values["algn"] = ppr.get("algn", values["algn"])
+        rpr = ppr.find("a:defRPr", _NS)
+        if rpr is not None:
+            for key in ("sz", "b", "i"):
+                values[key] = _flag(rpr.get(key, values[key]))
+            latin = rpr.find("a:latin", _NS)
+            if latin is not None:
+                values["latin"] = latin.get("typeface")
+    values["latin"] = fonts.get(values["latin"], values["latin"])
+    return values
+
+
+def inherited_text(pkg, master, presentation):
+    """Values level-1 text in a non-placeholder shape inherits under ``master``.
+
+    Only values both ``otherStyle`` and ``defaultTextStyle`` agree on are
+    returned, so the result holds whichever of them PowerPoint applies.
+    """
+    root = etree.fromstring(pkg.zip.read(master))
+    fonts = {}
+    theme = next((t for rel, t in pkg.rels(master) if rel.get("Type") == RT_THEME), None)
+    if theme is not None:
+        scheme = etree.fromstring(pkg.zip.read(theme)).find("a:themeElements/a:fontScheme", _NS)
+        for slot, ref in (("a:majorFont", "+mj-lt"), ("a:minorFont", "+mn-lt")):
+            latin = scheme.find(f"{slot}/a:latin", _NS) if scheme is not None else None
+            if latin is not None:
+                fonts[ref] = latin.get("typeface")
+    other = _level1(root.find("p:txStyles/p:otherStyle/a:lvl1pPr", _NS), fonts)
+    default = _level1(presentation.find("p:defaultTextStyle/a:lvl1pPr", _NS), fonts)
+    return {key: value for key, value in other.items() if default[key] == value}
+
+
+# ============================================================
+# Slide XML
+# ============================================================
+def _strip_inherited(ppr, inherited):
+    """Remove from a paragraph's ``a:pPr`` what it would inherit anyway."""
+    if "algn" in ppr.attrib and ppr.get("algn") == inherited.get("algn"):
+        del ppr.attrib["algn"]
+    rpr = ppr.find("a:defRPr", _NS)
+    if rpr is not None:
+        for key in ("sz", "b", "i"):
+            if key in rpr.attrib and _flag(rpr.get(key)) == inherited.get(key):
+                del rpr.attrib[key]
+        latin = rpr.find("a:latin", _NS)
+        if (latin is not None and set(latin.attrib) == {"typeface"}
+                and latin.get("typeface") == inherited.get("latin")):
+            rpr.remove(latin)
+        if not len(rpr) and not rpr.attrib:
+            ppr.remove(rpr)
+
+
+def _hoist(body, paragraphs):
+    """Move the ``a:defRPr`` (and ``algn``) every paragraph repeats to the body's ``a:lvl1pPr``.
+
+    Spacing, bullets and tabs stay with their paragraphs.
+    """
+    pprs = [p.find("a:pPr", _NS) for p in paragraphs]
+    if any(ppr is None or ppr.get("lvl") not in (None, "0") for ppr in pprs):
+        return
+    rprs = [ppr.find("a:defRPr", _NS) for ppr in pprs]
+    if rprs[0] is None or len({etree.tostring(rpr) if rpr is not None else None
+                               for rpr in rprs}) != 1:
+        return
+    lst_style = body.find("a:lstStyle", _NS)
+    if lst_style is None:
+        lst_style = etree.Element(_LST_STYLE)
+        body.find("a:bodyPr", _NS).addnext(lst_style)
+    elif len(lst_style) or lst_style.attrib:
+        return
+    lvl1 = etree.SubElement(lst_style, _LVL1_PPR)
+    algns = {ppr.get("algn") for ppr in pprs}
+    if len(algns) == 1 and None not in algns:
+        lvl1.set("algn", algns.pop())
+        for ppr in pprs:
+            del ppr.attrib["algn"]
+    lvl1.append(rprs[0])
+    for p, ppr, rpr in zip(paragraphs, pprs, rprs):
+        if rpr.getparent() is ppr:
+            ppr.remove(rpr)
+        if not len(ppr) and not ppr.attrib:
+            p.remove(ppr)
+
+
+def optimize_slide(root, inherited):
+    """Rewrite one slide's element tree in place (see the module docstring)."""
+    for geom in root.iter(f"{{{_A}}}prstGeom"):
+        av_lst = geom.find("a:avLst", _NS)
+        if av_lst is not None and not len(av_lst):
+            geom.remove(av_lst)
+    for sp in root.iter(f"{{{_P}}}sp"):
+        body = sp.find("p:txBody", _NS)
+        if body is None or sp.find("p:nvSpPr/p:nvPr/p:ph", _NS) is not None:
+            continue
+        body_pr = body.find("a:bodyPr", _NS)
+        if body_pr is not None and _flag(body_pr.get("rtlCol")) == "0":
+            del body_pr.attrib["rtlCol"]
+        paragraphs = body.findall("a:p", _NS)
+        for p in paragraphs:
+            ppr = p.find("a:pPr", _NS)
+            if ppr is not None and ppr.get("lvl") in (None, "0"):
+                _strip_inherited(ppr, inherited)
+                if not len(ppr) and not ppr.attrib:
+                    p.remove(ppr)
+        if len(paragraphs) > 1:
+            _hoist(body, paragraphs)
+    for lst_style in root.iter(_LST_STYLE):
+        if not len(lst_style) and not lst_style.attrib:
+            lst_style.getparent().remove(lst_style)
+    return root
+
+
+# ============================================================
+# Package
+# ============================================================
+def _plan(pkg):
+    """``(parts to keep, {source part: rIds to drop}, {slide: master})``."""
+    slides = [t for rel, t in pkg.rels(pkg.main) if rel.get("Type") == RT_SLIDE]
+    slide_layout, layout_master = {}, {}
+    for slide in slides:
+        for rel, target in pkg.rels(slide):
+            if rel.get("Type") == RT_SLIDE_LAYOUT:
+                slide_layout[slide] = target
+    for layout in set(slide_layout.values()):
+        for rel, target in pkg.rels(layout):
+            if rel.get("Type") == RT_SLIDE_MASTER:
+                layout_master[layout] = target
+    used, master_parts = set(slide_layout.values()), set(layout_master.values())
+
+    keep, dropped, todo = set(), {}, [""]
+    while todo:
+        name = todo.pop()
+        for rel, target in pkg.rels(name):
+            kind = rel.get("Type")
+            if kind in DROPPED_RELS or (kind == RT_SLIDE_LAYOUT and name in master_parts
+                                        and target not in used):
+                dropped.setdefault(name, set()).add(rel.get("Id"))
+            elif target is not None and target not in keep and target in pkg.members:
+                keep.add(target)
+                todo.append(target)
+    masters = {slide: layout_master.get(layout) for slide, layout in slide_layout.items()}
+    return keep, dropped, masters
+
+
+def _content_types(pkg, keep):
+    used_ext = {posixpath.splitext(name)[1][1:].lower() for name in keep} | {"rels", "xml"}
+    defaults = "".join(f'<Default Extension="{ext}" ContentType="{ctype}"/>'
+                       for ext, ctype in pkg.defaults.items() if ext in used_ext)
+    overrides = "".join(f'<Override PartName="/{name}" ContentType="{ctype}"/>'
+                        for name, ctype in pkg.overrides.items() if name in keep)
+    return (b"<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+            + f'<Types xmlns="{_NS["ct"]}">{defaults}{overrides}</Types>'.encode())
+
+
+def optimize_package(src, sink, compression=DEFAULT_COMPRESSION, deterministic=False):
+    """Write an optimized copy of ``src`` (package bytes or a binary file) to ``sink``.
+
+    Returns ``(savings, etag)``: a ``PartSavings`` for every entry whose size
+    changed, in package order, and the SHA-256 when ``deterministic``.
+    """
+    pkg = _Package(src)
+    keep, dropped, masters = _plan(pkg)
+    presentation = etree.fromstring(pkg.zip.read(pkg.main))
+    inherited = {}  # master -> inherited level-1 values
+    master_parts = set(masters.values())
+    rels_of = {_rels_member(name): name for name in keep | {""}}
+    savings = []
+    with PackageStreamWriter(sink, compression, deterministic) as writer:
+        for info in pkg.zip.infolist():
+            name, before = info.filename, info.file_size
+            if name == "[Content_Types].xml":
+                blob = _content_types(pkg, keep)
+            elif name in rels_of:
+                blob = pkg.zip.read(name)
+                if dropped.get(rels_of[name]):
+                    root = etree.fromstring(blob)
+                    for rel in root.findall("rel:Relationship", _NS):
+                        if rel.get("Id") in dropped[rels_of[name]]:
+                            root.remove(rel)
+                    blob = _xml(root)
+            elif name not in keep:
+                savings.append(PartSavings(name, before, 0))
+                continue
+            elif pkg.content_type(name) == SLIDE_TYPE and masters.get(name):
+                master = masters[name]
+                if master not in inherited:
+                    inherited[master] = inherited_text(pkg, master, presentation)
+                blob = _xml(optimize_slide(etree.fromstring(pkg.zip.read(name)),
+                                           inherited[master]))
+            elif name in master_parts and dropped.get(name):
+                root = etree.fromstring(pkg.zip.read(name))
+                for sld_layout_id in root.iterfind("p:sldLayoutIdLst/p:sldLayoutId", _NS):
+                    if sld_layout_id.get(_RID) in dropped[name]:
+                        sld_layout_id.getparent().remove(sld_layout_id)
+                blob = _xml(root)
+            else:
+                blob = pkg.zip.read(name)
+            kind = content_kind(pkg.content_type(name)) if name in keep else XML_CONTENT
+            writer.write(name, blob, kind)
+            if len(blob) != before:
+                savings.append(PartSavings(name, before, len(blob)))
+    return savings, writer.etag
@@ -0,0 +1,345 @@
+"""PNG previews of built decks, rasterized with Pillow.
+
+Only the primitives this generator emits are drawn: slide background fills,
+rectangles, rounded rectangles, ovals and right arrows with solid fills and
+outlines, pictures, tables (cell fills and row rules) and wrapped text
+(per-paragraph font, size, weight, color and alignment, with the box's anchor
+and insets). Anything else is skipped. Text is wrapped with the same font
+metrics as ``check-text-fit``, so the previews show overflows where the
+checker reports them.
+
+The package is read straight from the ZIP, not through python-pptx. Slides
+are rendered one per worker process.
+"""
+import io
+import math
+import os
+import posixpath
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from lxml import etree
+
+from .metrics import (EMU_PER_PT, INSET_X, INSET_Y, LINE_HEIGHT, find_font, font_face,
+                      inherited_placeholder, layout_placeholders, para_from_xml)
+from .theme import ACCENT
+
+_NS = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    "rel": "http://schemas.openxmlformats.org/package/2006/relationships",
+}
+_RID = f"{{{_NS['r']}}}id"
+_EMBED = f"{{{_NS['r']}}}embed"
+# p:style fillRef on autoshapes without an explicit fill resolves to accent1
+# of the deck theme, which master.py sets to ACCENT.
+_THEME_FILL = f"#{ACCENT}"
+_LAYOUT_REL = "/slideLayout"
+_MASTER_REL = "/slideMaster"
+_ALIGN = {"l": 0, "ctr": 0.5, "r": 1, "just": 0}
+
+
+# ============================================================
+# Reading the package
+# ============================================================
+def _rels(zf, part):
+    """``{rId: (type, target partname)}`` for ``part``."""
+    folder, name = posixpath.split(part)
+    path = posixpath.join(folder, "_rels", name + ".rels")
+    if path not in zf.namelist():
+        return {}
+    root = etree.fromstring(zf.read(path))
+    return {rel.get("Id"): (rel.get("Type"),
+                            posixpath.normpath(posixpath.join(folder, rel.get("Target"))))
+            for rel in root.iterfind("rel:Relationship", _NS)}
+
+
+def _related(rels, suffix):
+    return next((target for kind, target in rels.values() if kind.endswith(suffix)), None)
+
+
+def read_slides(pptx):
+    """``(slide_size, [(slide_xml, {rId: media bytes}, layout_xml, master_xml), ...])``.
+
+    ``pptx`` is a .pptx path or file. The layout and master come along so
+    inherited backgrounds, layout shapes and placeholder positions can be drawn.
+    """
+    with zipfile.ZipFile(pptx) as zf:
+        pres = etree.fromstring(zf.read("ppt/presentation.xml"))
+        size_el = pres.find("p:sldSz", _NS)
+        size = (int(size_el.get("cx")), int(size_el.get("cy")))
+        targets = _rels(zf, "ppt/presentation.xml")
+        chrome = {}  # layout partname -> (layout_xml, master_xml)
+        slides = []
+        for sld_id in pres.iterfind("p:sldIdLst/p:sldId", _NS):
+            part = targets[sld_id.get(_RID)][1]
+            xml = zf.read(part)
+            root = etree.fromstring(xml)
+            rels = _rels(zf, part)
+            media = {rid: zf.read(rels[rid][1])
+                     for rid in {b.get(_EMBED) for b in root.iterfind(".//a:blip", _NS)}
+                     if rid in rels}
+            layout = _related(rels, _LAYOUT_REL)
+            if layout is not None and layout not in chrome:
+                master = _related(_rels(zf, layout), _MASTER_REL)
+                chrome[layout] = (zf.read(layout), zf.read(master) if master else None)
+            slides.append((xml, media, *chrome.get(layout, (None, None))))
+    return size, slides
+
+
+# ============================================================
+# Drawing
+# ============================================================
+def _color(el):
+    clr = el.find("a:solidFill/a:srgbClr", _NS) if el is not None else None
+    return "#" + clr.get("val") if clr is not None else None
+
+
+@lru_cache(maxsize=None)
+def _font(font_name, bold, px):
+    from PIL import ImageFont
+
+    return ImageFont.truetype(str(find_font(font_name, bold)), px)
+
+
+def _wrap(para, em, avail, wrap):
+    """Break ``para`` into display lines at ``em`` pixels per em."""
+    face = font_face(para.font_name, para.bold)
+    out = []
+    for hard in para.text.replace("\v", "\n").split("\n"):
+        words = hard.split(" ")
+        if not wrap:
+            out.append(hard)
+            continue
+        widths = (face.widths(words) * em).tolist()
+        space = face.space * em
+        line, width = [], -space
+        for word, w in zip(words, widths):
+            if line and width + space + w > avail:
+                out.append(" ".join(line))
+                line, width = [], -space
+            line.append(word)
+            width += space + w
+        out.append(" ".join(line))
+    return out
+
+
+def _draw_text(draw, body, box, scale, insets, anchor, wrap, default_color, inherited=None):
+    """Draw ``body``'s paragraphs; ``inherited`` is the body's or its placeholder's ``a:lvl1pPr``."""
+    inherited_rpr = inherited.find("a:defRPr", _NS) if inherited is not None else None
+    inherited_algn = inherited.get("algn", "l") if inherited is not None else "l"
+    left, top, right, bottom = (box[0] + insets[0] * scale, box[1] + insets[1] * scale,
+                                box[2] - insets[2] * scale, box[3] - insets[3] * scale)
+    blocks = []
+    height = 0.0
+    for p in body.iterfind("a:p", _NS):
+        para = para_from_xml(p, inherited_rpr)
+        if not para.text:
+            continue
+        em = para.size * EMU_PER_PT * scale
+        fill = (_color(p.find("a:pPr/a:defRPr", _NS)) or _color(p.find("a:r/a:rPr", _NS))
+                or _color(inherited_rpr) or default_color)
+        ppr = p.find("a:pPr", _NS)
+        algn = _ALIGN.get(ppr.get("algn", inherited_algn) if ppr is not None
+                          else inherited_algn, 0)
+        gap = para.space_before * EMU_PER_PT * scale if blocks else 0
+        lines = _wrap(para, em, right - left, wrap)
+        blocks.append((gap, lines, em, algn, fill, para))
+        height += gap + len(lines) * em * LINE_HEIGHT
+
+    y = top if anchor == "t" else (bottom - height if anchor == "b"
+                                   else (top + bottom - height) / 2)
+    for gap, lines, em, algn, fill, para in blocks:
+        y += gap
+        font = _font(para.font_name, para.bold, max(1, round(em)))
+        for line in lines:
+            width = font.getlength(line)
+            x = left + (right - left - width) * algn
+            draw.text((x, y + em * (LINE_HEIGHT - 1) / 2), line, font=font, fill=fill)
+            y += em * LINE_HEIGHT
+
+
+def _draw_sp_text(draw, sp, box, scale, base=None):
+    body = sp.find("p:txBody", _NS)
+    if body is None:
+        return
+    props = dict(body.find("a:bodyPr", _NS).attrib)
+    inherited = body.find("a:lstStyle/a:lvl1pPr", _NS)
+    if base is not None:
+        base_pr = base.find("p:txBody/a:bodyPr", _NS)
+        props = {**(base_pr.attrib if base_pr is not None else {}), **props}
+        if inherited is None:
+            inherited = base.find("p:txBody/a:lstStyle/a:lvl1pPr", _NS)
+    insets = [int(props.get(k, d)) for k, d in
+              (("lIns", INSET_X), ("tIns", INSET_Y), ("rIns", INSET_X), ("bIns", INSET_Y))]
+    default_color = "#FFFFFF" if sp.find("p:style/a:fontRef", _NS) is not None else "#000000"
+    _draw_text(draw, body, box, scale, insets, props.get("anchor", "t"),
+               props.get("wrap") != "none", default_color, inherited)
+
+
+def _draw_table(draw, frame, scale):
+    tbl = frame.find("a:graphic/a:graphicData/a:tbl", _NS)
+    off = frame.find("p:xfrm/a:off", _NS)
+    if tbl is None or off is None:
+        return
+    widths = [int(col.get("w")) * scale for col in tbl.iterfind("a:tblGrid/a:gridCol", _NS)]
+    y = int(off.get("y")) * scale
+    for tr in tbl.iterfind("a:tr", _NS):
+        height = int(tr.get("h")) * scale
+        x = int(off.get("x")) * scale
+        for tc, width in zip(tr.iterfind("a:tc", _NS), widths):
+            box = (x, y, x + width, y + height)
+            tc_pr = tc.find("a:tcPr", _NS)
+            props = tc_pr.attrib if tc_pr is not None else {}
+            fill = _color(tc_pr)
+            if fill:
+                draw.rectangle(box, fill=fill)
+            rule = tc_pr.find("a:lnB", _NS) if tc_pr is not None else None
+            if _color(rule):
+                draw.line((box[0], box[3], box[2], box[3]), fill=_color(rule),
+                          width=max(1, round(int(rule.get("w", 12700)) * scale)))
+            insets = [int(props.get(k, d)) for k, d in
+                      (("marL", INSET_X), ("marT", INSET_Y), ("marR", INSET_X), ("marB", INSET_Y))]
+            _draw_text(draw, tc.find("a:txBody", _NS), box, scale, insets,
+                       props.get("anchor", "t"), True, "#000000")
+            x += width
+        y += height
+
+
+def _draw_shape(draw, sp, scale, base=None):
+    xfrm = sp.find("p:spPr/a:xfrm", _NS)
+    if xfrm is None and base is not None:
+        xfrm = base.find("p:spPr/a:xfrm", _NS)
+    if xfrm is None:
+        return None
+    off, ext = xfrm.find("a:off", _NS), xfrm.find("a:ext", _NS)
+    x0, y0 = int(off.get("x")) * scale, int(off.get("y")) * scale
+    w, h = int(ext.get("cx")) * scale, int(ext.get("cy")) * scale
+    box = (x0, y0, x0 + w, y0 + h)
+
+    sp_pr = sp.find("p:spPr", _NS)
+    fill = _color(sp_pr)
+    if fill is None and sp_pr.find("a:noFill", _NS) is None:
+        ref = sp.find("p:style/a:fillRef", _NS)
+        if ref is not None and ref.get("idx") != "0":
+            fill = _THEME_FILL
+    ln = sp_pr.find("a:ln", _NS)
+    outline = _color(ln)
+    width = max(1, round(int(ln.get("w", 12700)) * scale)) if outline else 0
+
+    geom = sp_pr.find("a:prstGeom", _NS)
+    prst = geom.get("prst") if geom is not None else "rect"
+    if fill or outline:
+        if prst == "roundRect":
+            draw.rounded_rectangle(box, radius=min(w, h) * 0.16667, fill=fill,
+                                   outline=outline, width=width)
+        elif prst == "ellipse":
+            draw.ellipse(box, fill=fill, outline=outline, width=width)
+        elif prst == "rightArrow":
+            shaft, head = h / 4, x0 + w - min(w, h) / 2
+            cy = y0 + h / 2
+            points = [(x0, cy - shaft), (head, cy - shaft), (head, y0), (x0 + w, cy),
+                      (head, y0 + h), (head, cy + shaft), (x0, cy + shaft)]
+            draw.polygon(points, fill=fill, outline=outline, width=width)
+        else:
+            draw.rectangle(box, fill=fill, outline=outline, width=width)
+    return box
+
+
+@lru_cache(maxsize=64)
+def _picture(blob, size):
+    from PIL import Image
+
+    with Image.open(io.BytesIO(blob)) as pic:
+        return pic.convert("RGBA").resize(size, Image.LANCZOS)
+
+
+def render_slide(xml, media, slide_size, width=1280, layout=None, master=None):
+    """One slide as a PIL image, ``width`` pixels wide.
+
+    ``layout`` and ``master`` are the XML of the slide's layout and master:
+    they supply the background when the slide has none, their non-placeholder
+    shapes are drawn under the slide's, and placeholders take their position
+    and text style from the layout.
+    """
+    from PIL import Image, ImageDraw
+
+    scale = width / slide_size[0]
+    height = round(slide_size[1] * scale)
+    root = etree.fromstring(xml)
+    layers = [etree.fromstring(x) for x in (master, layout) if x is not None]
+    bg = next(filter(None, (_color(el.find("p:cSld/p:bg/p:bgPr", _NS))
+                            for el in [root, *reversed(layers)])), "#FFFFFF")
+    image = Image.new("RGB", (width, height), bg)
+    draw = ImageDraw.Draw(image)
+    placeholders = (layout_placeholders(layers[-1].find("p:cSld/p:spTree", _NS))
+                    if layout is not None else {})
+
+    for layer in layers:
+        for sp in layer.iterfind("p:cSld/p:spTree/p:sp", _NS):
+            if sp.find("p:nvSpPr/p:nvPr/p:ph", _NS) is None:
+                _draw_shape(draw, sp, scale)
+
+    for el in root.find("p:cSld/p:spTree", _NS):
+        tag = etree.QName(el).localname
+        if tag == "sp":
+            base = inherited_placeholder(el, placeholders)
+            box = _draw_shape(draw, el, scale, base)
+            if box is not None:
+                _draw_sp_text(draw, el, box, scale, base)
+        elif tag == "graphicFrame":
+            _draw_table(draw, el, scale)
+        elif tag == "pic":
+            blip = el.find(".//a:blip", _NS)
+            off, ext = el.find("p:spPr/a:xfrm/a:off", _NS), el.find("p:spPr/a:xfrm/a:ext", _NS)
+            blob = media.get(blip.get(_EMBED)) if blip is not None else None
+            if blob is None or off is None:
+                continue
+            size = (max(1, round(int(ext.get("cx")) * scale)),
+                    max(1, round(int(ext.get("cy")) * scale)))
+            pic = _picture(blob, size)
+            image.paste(pic, (round(int(off.get("x")) * scale),
+                              round(int(off.get("y")) * scale)), pic)
+    return image
+
+
+def _render_job(job):
+    return render_slide(*job)
+
+
+def render_previews(pptx, width=1280, workers=None):
+    """Every slide of ``pptx`` as a PIL image, rendered across a process pool."""
+    size, slides = read_slides(pptx)
+    jobs = [(xml, media, size, width, layout, master)
+            for xml, media, layout, master in slides]
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        return [_render_job(job) for job in jobs]
+    with ProcessPoolExecutor(workers) as pool:
+        return list(pool.map(_render_job, jobs))
+
+
+def contact_sheet(images, columns=4, thumb_width=320, gap=12, background="#111827"):
+    """One image with every slide as a numbered thumbnail, row by row.
+
+    Render the previews at ``thumb_width`` when only the sheet is needed; larger
+    previews are scaled down.
+    """
+    from PIL import Image, ImageDraw
+
+    thumbs = [im if im.width == thumb_width else
+              im.resize((thumb_width, round(im.height * thumb_width / im.width)), Image.BILINEAR)
+              for im in images]
+    if not thumbs:
+        raise ValueError("No slides to put on a contact sheet")
+    cell_w, cell_h = thumb_width + gap, thumbs[0].height + gap + 16
+    rows = math.ceil(len(thumbs) / columns)
+    sheet = Image.new("RGB", (gap + columns * cell_w, gap + rows * cell_h), background)
+    draw = ImageDraw.Draw(sheet)
+    for i, thumb in enumerate(thumbs):
+        x, y = gap + (i % columns) * cell_w, gap + (i // columns) * cell_h
+        sheet.paste(thumb, (x, y + 16))
+        draw.text((x, y), str(i + 1), fill="#9CA3AF")
+    return sheet
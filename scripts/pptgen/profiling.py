@@ -0,0 +1,127 @@
+"""Opt-in profiling of deck builds.
+
+Helpers decorated with ``@traced`` and the ``span`` blocks around slide
+builders and package writes cost one global lookup while no profiler is
+active. Inside ``with Profiler() as prof:`` every span records wall time and,
+with ``memory=True``, the tracemalloc delta of traced memory across it.
+One-time costs (imports, ``render.warm_up``) land in whichever span first
+hits them; run them before or in their own span (``create-ppt.py --profile``
+records a ``warm_up`` span) so they do not inflate the first slide.
+
+Results come out as a Chrome trace-event file (load in chrome://tracing or
+Perfetto) and as a per-name summary table.
+"""
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+
+_active = None
+
+
+def traced(cat):
+    """Record each call of the decorated function as a span in category ``cat``."""
+    def wrap(fn):
+        name = fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            prof = _active
+            if prof is None:
+                return fn(*args, **kwargs)
+            with prof.span(name, cat):
+                return fn(*args, **kwargs)
+        return wrapper
+    return wrap
+
+
+def span(name, cat, **args):
+    """Span on the active profiler, or a no-op context when none is active."""
+    prof = _active
+    if prof is None:
+        return nullcontext()
+    return prof.span(name, cat, **args)
+
+
+class Profiler:
+    def __init__(self, memory=True):
+        self.memory = memory
+        self.events = []
+        self._started_tracemalloc = False
+        self._t0 = 0
+
+    def __enter__(self):
+        global _active
+        if _active is not None:
+            raise RuntimeError("a Profiler is already active")
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._t0 = time.perf_counter_ns()
+        _active = self
+        return self
+
+    def __exit__(self, *exc):
+        global _active
+        _active = None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    @contextmanager
+    def span(self, name, cat, **args):
+        mem_before = tracemalloc.get_traced_memory()[0] if self.memory else 0
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            alloc = tracemalloc.get_traced_memory()[0] - mem_before if self.memory else 0
+            self.events.append((name, cat, start, end - start, alloc, args))
+
+    # ============================================================
+    # Output
+    # ============================================================
+    def trace_events(self):
+        pid, tid = os.getpid(), threading.get_ident()
+        events = []
+        for name, cat, start, dur, alloc, args in self.events:
+            event_args = dict(args)
+            if self.memory:
+                event_args["alloc_bytes"] = alloc
+            events.append({
+                "name": name, "cat": cat, "ph": "X",
+                "ts": (start - self._t0) / 1000, "dur": dur / 1000,
+                "pid": pid, "tid": tid, "args": event_args,
+            })
+        return events
+
+    def write_trace(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": self.trace_events(), "displayTimeUnit": "ms"}, f)
+
+    def summary(self):
+        """Rows of (cat, name, calls, total_ms, mean_us, alloc_kb), slowest first."""
+        totals = defaultdict(lambda: [0, 0, 0])
+        for name, cat, _, dur, alloc, _ in self.events:
+            row = totals[(cat, name)]
+            row[0] += 1
+            row[1] += dur
+            row[2] += alloc
+        rows = [
+            (cat, name, calls, dur / 1e6, dur / 1e3 / calls, alloc / 1024)
+            for (cat, name), (calls, dur, alloc) in totals.items()
+        ]
+        return sorted(rows, key=lambda r: r[3], reverse=True)
+
+    def format_summary(self):
+        lines = [f"{'category':10s} {'name':24s} {'calls':>7s} {'total ms':>10s} "
+                 f"{'mean us':>10s} {'alloc KB':>10s}"]
+        for cat, name, calls, total_ms, mean_us, alloc_kb in self.summary():
+            lines.append(f"{cat:10s} {name:24s} {calls:7d} {total_ms:10.2f} "
+                         f"{mean_us:10.1f} {alloc_kb:10.1f}")
+        return "\n".join(lines)
@@ -0,0 +1,174 @@
+"""Prototype cache for recurring slide fragments.
+
+Each fragment (accent bar, styled text box, bordered card, numbered step
+circle and its arrow) is built once per process with the regular helpers on a
+scratch slide. Slide background, accent line and title come from the master
+and layouts instead (see ``master.py``). After that, slides get a deep copy of
+the cached XML with the id, offsets, colors and text patched in place, which
+skips the python-pptx proxy round trips that dominate render time on large
+decks.
+"""
+from copy import deepcopy
+
+from pptx.enum.shapes import MSO_SHAPE
+from pptx.enum.text import PP_ALIGN
+from pptx.oxml.ns import qn
+from pptx.util import Inches, Pt
+
+from .helpers import add_accent_line, add_shape_rect, add_text
+from .master import BLANK_LAYOUT, CONTENT_LAYOUT, get_layout
+from .profiling import traced
+from .styles import apply_style
+from .theme import DARK_BORDER, DEEP, VOID, WHITE
+
+_PROTOTYPES = {}
+
+
+def _scratch_slide():
+    from .render import new_presentation
+    prs = new_presentation()
+    return prs.slides.add_slide(get_layout(prs, BLANK_LAYOUT))
+
+
+def _build_prototypes():
+    slide = _scratch_slide()
+    sp_tree = slide.shapes._spTree
+    add_accent_line(slide, Inches(0.8))
+    add_text(slide, Inches(0.8), Inches(0.9), Inches(11), Inches(0.8),
+             "TITLE", 40, WHITE, True)
+    add_shape_rect(slide, 0, 0, 0, 0, DEEP, DEEP)
+    add_shape_rect(slide, 0, 0, 0, 0, DEEP)
+
+    circle = slide.shapes.add_shape(MSO_SHAPE.OVAL, 0, Inches(2.5),
+                                     Inches(0.8), Inches(0.8))
+    circle.fill.solid()
+    circle.fill.fore_color.rgb = DEEP
+    circle.line.fill.background()
+    tf_c = circle.text_frame
+    tf_c.paragraphs[0].text = "0"
+    tf_c.paragraphs[0].font.size = Pt(28)
+    tf_c.paragraphs[0].font.color.rgb = VOID
+    tf_c.paragraphs[0].font.bold = True
+    tf_c.paragraphs[0].alignment = PP_ALIGN.CENTER
+    tf_c.word_wrap = False
+
+    arrow = slide.shapes.add_shape(MSO_SHAPE.RIGHT_ARROW, 0, Inches(2.7),
+                                    Inches(0.4), Inches(0.4))
+    arrow.fill.solid()
+    arrow.fill.fore_color.rgb = DARK_BORDER
+    arrow.line.fill.background()
+
+    accent, title, card, plain_card, circle, arrow = sp_tree.iter_shape_elms()
+    return {
+        "accent": accent,
+        "title": title,
+        "card": card,
+        "plain_card": plain_card,
+        "circle": circle,
+        "arrow": arrow,
+    }
+
+
+def prototype(name):
+    if not _PROTOTYPES:
+        _PROTOTYPES.update(_build_prototypes())
+    return _PROTOTYPES[name]
+
+
+# ============================================================
+# Stamping
+# ============================================================
+def _is_plain(text):
+    # Line breaks and control characters need python-pptx's run splitting.
+    return all(ch >= " " for ch in text)
+
+
+def clone(name, shape_id, left=None, top=None, width=None, height=None):
+    """Detached copy of prototype ``name`` with its id and geometry patched."""
+    sp = deepcopy(prototype(name))
+    c_nv_pr = sp.find(qn("p:nvSpPr")).find(qn("p:cNvPr"))
+    c_nv_pr.set("id", str(shape_id))
+    c_nv_pr.set("name", "%s %d" % (c_nv_pr.get("name").rsplit(" ", 1)[0], shape_id - 1))
+
+    xfrm = sp.find(qn("p:spPr")).find(qn("a:xfrm"))
+    off, ext = xfrm.find(qn("a:off")), xfrm.find(qn("a:ext"))
+    if left is not None:
+        off.set("x", str(int(left)))
+    if top is not None:
+        off.set("y", str(int(top)))
+    if width is not None:
+        ext.set("cx", str(int(width)))
+    if height is not None:
+        ext.set("cy", str(int(height)))
+    return sp
+
+
+def _stamp(slide, name, left=None, top=None, width=None, height=None):
+    shapes = slide.shapes
+    sp = clone(name, shapes._next_shape_id, left, top, width, height)
+    shapes._spTree.append(sp)
+    return sp
+
+
+def set_fill(sp, color):
+    fill = sp.find(qn("p:spPr")).find(qn("a:solidFill"))
+    fill.find(qn("a:srgbClr")).set("val", str(color))
+
+
+def set_line(sp, color):
+    ln = sp.find(qn("p:spPr")).find(qn("a:ln"))
+    ln.find(qn("a:solidFill")).find(qn("a:srgbClr")).set("val", str(color))
+
+
+def set_text(sp, text, style=None):
+    """Replace the text (and optionally the ``a:pPr`` style) of the first paragraph."""
+    p = sp.find(qn("p:txBody")).find(qn("a:p"))
+    if style is not None:
+        apply_style(p, style)
+    if _is_plain(text):
+        r = p.find(qn("a:r"))
+        if r is not None:
+            r.find(qn("a:t")).text = text
+            return
+    for elm in p.content_children:
+        p.remove(elm)
+    p.append_text(text)
+
+
+def new_slide(prs):
+    """Add a slide on the blank layout; the background comes from the master."""
+    return prs.slides.add_slide(get_layout(prs, BLANK_LAYOUT))
+
+
+@traced("helper")
+def new_content_slide(prs, title):
+    """Add a slide on the content layout (accent line, 40pt title) titled ``title``."""
+    slide = prs.slides.add_slide(get_layout(prs, CONTENT_LAYOUT))
+    set_text(slide.shapes._spTree.find(qn("p:sp")), title)
+    return slide
+
+
+@traced("helper")
+def add_card(slide, left, top, width, height, fill_color, border_color=None):
+    """Stamped equivalent of ``add_shape_rect``."""
+    if border_color:
+        sp = _stamp(slide, "card", left, top, width, height)
+        set_line(sp, border_color)
+    else:
+        sp = _stamp(slide, "plain_card", left, top, width, height)
+    set_fill(sp, fill_color)
+    return sp
+
+
+@traced("helper")
+def add_step(slide, left, num, color):
+    """Numbered circle for the pipeline step whose column starts at ``left``."""
+    circle = _stamp(slide, "circle", left + Inches(0.45))
+    set_fill(circle, color)
+    set_text(circle, num)
+    return circle
+
+
+def add_step_arrow(slide, left):
+    """Arrow from the step at ``left`` to the next one."""
+    return _stamp(slide, "arrow", left + Inches(1.35))
@@ -0,0 +1,78 @@
+"""Render a ``DeckSpec`` into a python-pptx ``Presentation``, or stream it."""
+import io
+
+from pptx import Presentation
+
+from . import images
+from .cache import slide_key
+from .master import themed_template
+from .profiling import span
+from .slides import build_slide, image_requests
+from .writer import DEFAULT_COMPRESSION, SlideStreamWriter, open_sink, write_package
+
+
+def new_presentation():
+    """Empty deck on the themed template (see ``master.py``)."""
+    return Presentation(io.BytesIO(themed_template()))
+
+
+def warm_up():
+    """Load the template and build the prototype cache ahead of the first deck."""
+    from .prototypes import prototype
+    new_presentation()
+    prototype("title")
+
+
+def render_deck(spec, cache=None):
+    """Build every slide of ``spec``, reusing unchanged slides from ``cache``."""
+    prs = new_presentation()
+    size = (prs.slide_width, prs.slide_height)
+    images.prepare(image_requests(spec.slides))
+    for index, slide_spec in enumerate(spec.slides, 1):
+        with span(slide_spec.layout, "slide", index=index):
+            _render_slide(prs, slide_spec, size, cache)
+    return prs
+
+
+def _render_slide(prs, slide_spec, size, cache):
+    """Build (or restore) ``slide_spec`` and return the slides it added."""
+    if cache is None:
+        return build_slide(prs, slide_spec)
+    key = slide_key(slide_spec, size)
+    slide = cache.restore(prs, key)
+    if slide is not None:
+        return [slide]
+    slides = build_slide(prs, slide_spec)
+    if len(slides) == 1:  # continued tables are rebuilt every time
+        cache.store(slides[0], key)
+    return slides
+
+
+def build_deck(spec, output, cache=None, compression=DEFAULT_COMPRESSION, deterministic=False):
+    """Render ``spec`` and stream it to ``output`` (a path, ``-``, socket URL or file object).
+
+    With ``deterministic`` the package bytes depend only on the spec, and the
+    SHA-256 of the package is returned for use as an ETag; otherwise None.
+    """
+    prs = render_deck(spec, cache)
+    with open_sink(output) as sink:
+        return write_package(prs, sink, compression, deterministic)
+
+
+def stream_deck(slides, output, cache=None, compression=DEFAULT_COMPRESSION,
+                deterministic=False):
+    """Render ``SlideSpec``s from any iterable straight into ``output``.
+
+    Each slide is written to the package and released as soon as it is built,
+    so memory stays flat however long the deck is; use it with a generator for
+    decks too large to hold. Returns the number of slides written.
+    """
+    prs = new_presentation()
+    size = (prs.slide_width, prs.slide_height)
+    with open_sink(output) as sink, \
+            SlideStreamWriter(prs, sink, compression, deterministic) as deck:
+        for index, slide_spec in enumerate(slides, 1):
+            with span(slide_spec.layout, "slide", index=index):
+                for slide in _render_slide(prs, slide_spec, size, cache):
+                    deck.add(slide)
+    return deck.count
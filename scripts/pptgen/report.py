@@ -0,0 +1,105 @@
+"""Per-vault report decks built from live vault state (see ``vaults.py``).
+
+``report_deck`` takes a ``VaultData`` dict and its recent ``VaultEvent``
+withdrawals and lays them out with the same builders as the pitch deck: a
+title slide, the five policy dimensions, budget figures and the withdrawal
+log. Nothing on these slides is a literal; every figure comes from the vault.
+
+The slides carry no report time, only vault state, so with a slide cache a
+vault's report is rebuilt only after the vault changes (or its policy expires).
+"""
+import time
+from datetime import datetime, timezone
+
+from .audit import ACTION_LABELS, MIST_PER_SUI, audit_log, truncate_digest
+from .spec import DeckSpec, SlideSpec
+
+
+def _date(ms):
+    return datetime.fromtimestamp(ms / 1000, timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+
+
+def _day(ms):
+    return datetime.fromtimestamp(ms / 1000, timezone.utc).strftime("%Y-%m-%d")
+
+
+def _amount(mist):
+    """SUI amount short enough for a stat card: ``0.25``, ``12.5``, ``3.4K``, ``1.2M``."""
+    sui = int(mist) / MIST_PER_SUI
+    for limit, divisor, suffix in ((1e9, 1e9, "B"), (1e6, 1e6, "M"), (1e3, 1e3, "K")):
+        if sui >= limit:
+            return f"{sui / divisor:.1f}{suffix}"
+    return f"{sui:.2f}" if sui < 10 else f"{sui:.1f}"
+
+
+def _share(part, whole):
+    if not whole:
+        return "--"
+    return "<1%" if 0 < part < whole / 100 else f"{part / whole:.0%}"
+
+
+def _duration(ms):
+    for unit, size in (("d", 86_400_000), ("h", 3_600_000), ("min", 60_000)):
+        if ms >= size and ms % size == 0:
+            return f"{ms // size} {unit}"
+    return f"{ms / 1000:g}s"
+
+
+def _actions(codes):
+    if set(codes) >= set(ACTION_LABELS):
+        return "All actions"
+    return ", ".join(ACTION_LABELS.get(code, f"Action {code}") for code in codes) or "None"
+
+
+def report_deck(vault, withdrawals, network="testnet", now_ms=None):
+    """``DeckSpec`` reporting on ``vault``; ``now_ms`` only decides whether it has expired."""
+    now_ms = int(time.time() * 1000) if now_ms is None else now_ms
+    policy = vault["policy"]
+    budget, spent = policy["maxBudget"], vault["totalSpent"]
+    expired = now_ms >= policy["expiresAt"]
+    caps = vault["authorizedCaps"]
+
+    slides = [
+        SlideSpec(
+            layout="hero",
+            title="VAULT REPORT",
+            subtitle=truncate_digest(vault["id"]),
+            note=(f"Vault state as of withdrawal {vault['txCount']}" if vault["txCount"]
+                  else "Vault state before any withdrawal"),
+            options={"tagline": f"Owner {truncate_digest(vault['owner'] or '--')}",
+                     "badge": f"Sui {network}  |  {vault['txCount']} withdrawals"},
+        ),
+        SlideSpec(
+            layout="policy_row",
+            title="POLICY",
+            subtitle="Every withdrawal is checked against all five dimensions on-chain.",
+            items=[
+                ["Max Budget", f"{_amount(budget)} SUI", "ACCENT"],
+                ["Max Per TX", f"{_amount(policy['maxPerTx'])} SUI", "ACCENT"],
+                ["Allowed Actions", _actions(policy["allowedActions"]), "GREEN"],
+                ["Cooldown", _duration(policy["cooldownMs"]), "AMBER"],
+                ["Expiration", ("Expired " if expired else "") + _day(policy["expiresAt"]),
+                 "RED" if expired else "GREEN"],
+            ],
+            note=(f"{len(caps)} authorized AgentCap{'s' if len(caps) != 1 else ''}: "
+                  + ", ".join(truncate_digest(cap) for cap in caps[:4])
+                  + (f" and {len(caps) - 4} more" if len(caps) > 4 else "")
+                  if caps else "No authorized AgentCaps"),
+        ),
+        SlideSpec(
+            layout="stats",
+            title="BUDGET",
+            items=[
+                [_amount(vault["balance"]), "SUI\nBalance", "ACCENT"],
+                [_amount(spent), f"SUI Spent\nof {_amount(budget)} SUI", "AMBER"],
+                [_share(spent, budget), "Budget\nUsed",
+                 "RED" if budget and spent >= budget else "GREEN"],
+                [str(vault["txCount"]), "Withdrawals\nAll Time", "WHITE"],
+            ],
+            note=(f"Last withdrawal {_date(vault['lastTxTime'])}" if vault["lastTxTime"]
+                  else "No withdrawals yet"),
+        ),
+    ]
+    if withdrawals:
+        slides.append(audit_log(withdrawals, network, "RECENT WITHDRAWALS"))
+    return DeckSpec(name=f"vault_{vault['id']}", slides=slides)
@@ -0,0 +1,119 @@
+"""Minimal asyncio JSON-RPC 2.0 client over pooled HTTP/1.1 keep-alive connections.
+
+Only the standard library is used: requests are ``POST`` with a JSON body,
+responses are read by ``Content-Length`` or chunked encoding. At most
+``connections`` requests are in flight at once, each on its own connection;
+finished connections go back to an idle pool and are reused, so a burst of
+calls pays for the TCP (and TLS) handshake once per connection rather than
+once per call. A pooled connection the server has since closed is retried
+once on a fresh one.
+"""
+import asyncio
+import itertools
+import json
+import ssl
+from urllib.parse import urlsplit
+
+
+class RpcError(Exception):
+    """The node answered with a JSON-RPC error or a non-200 status."""
+
+
+class JsonRpcClient:
+    def __init__(self, url, connections=8, timeout=30.0):
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Unsupported RPC URL: {url!r}")
+        self.url = url
+        self.timeout = timeout
+        self._host = parts.hostname
+        self._port = parts.port or (443 if parts.scheme == "https" else 80)
+        self._ssl = ssl.create_default_context() if parts.scheme == "https" else None
+        self._path = parts.path or "/"
+        self._head = (f"POST {self._path} HTTP/1.1\r\nHost: {parts.netloc}\r\n"
+                      "Content-Type: application/json\r\nAccept: application/json\r\n"
+                      "Connection: keep-alive\r\n")
+        self._slots = asyncio.Semaphore(connections)
+        self._idle = []  # (reader, writer) pairs ready for reuse
+        self._ids = itertools.count(1)
+        self.requests = 0
+        self.connects = 0
+
+    async def call(self, method, params=()):
+        """Call ``method`` with positional ``params`` and return its ``result``."""
+        body = json.dumps({"jsonrpc": "2.0", "id": next(self._ids), "method": method,
+                           "params": list(params)}, separators=(",", ":")).encode()
+        async with self._slots:
+            reply = await asyncio.wait_for(self._post(body), self.timeout)
+        if "error" in reply:
+            error = reply["error"]
+            raise RpcError(f"{method}: {error.get('message', error)} (code {error.get('code')})")
+        return reply["result"]
+
+    async def _post(self, body):
+        request = (self._head + f"Content-Length: {len(body)}\r\n\r\n").encode() + body
+        for attempt in (0, 1):
+            reused = bool(self._idle)
+            reader, writer = self._idle.pop() if reused else await self._connect()
+            try:
+                writer.write(request)
+                await writer.drain()
+                status, headers, payload = await _read_response(reader)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                writer.close()
+                if reused and not attempt:
+                    continue  # the server closed an idle keep-alive connection
+                raise
+            except BaseException:
+                writer.close()
+                raise
+            self.requests += 1
+            if headers.get("connection", "").lower() == "close":
+                writer.close()
+            else:
+                self._idle.append((reader, writer))
+            if status != 200:
+                raise RpcError(f"HTTP {status} from {self.url}")
+            return json.loads(payload)
+
+    async def _connect(self):
+        self.connects += 1
+        return await asyncio.open_connection(self._host, self._port, ssl=self._ssl)
+
+    async def close(self):
+        idle, self._idle = self._idle, []
+        for _, writer in idle:
+            writer.close()
+        for _, writer in idle:
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+
+async def _read_response(reader):
+    """``(status, {lowercase header: value}, body bytes)`` of one HTTP/1.1 response."""
+    status_line = await reader.readline()
+    if not status_line:
+        raise asyncio.IncompleteReadError(b"", None)
+    status = int(status_line.split(None, 2)[1])
+    headers = {}
+    while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        chunks = []
+        while size := int((await reader.readline()).split(b";")[0], 16):
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)  # CRLF after each chunk
+        while await reader.readline() not in (b"\r\n", b"\n", b""):
+            pass  # trailers
+        return status, headers, b"".join(chunks)
+    return status, headers, await reader.readexactly(int(headers.get("content-length", 0)))
@@ -0,0 +1,245 @@
+"""Warm render server.
+
+Accepts a JSON deck spec over HTTP (localhost TCP or a Unix socket) and
+answers with the .pptx bytes. Renders run in a pool of long-lived worker
+processes that keep python-pptx, the default template, and the prototype and
+style caches loaded between requests, so a request only pays for building
+and writing its own slides.
+
+    POST /render[?slides=3,5&compression=fast]   body: deck spec JSON
+    GET  /healthz
+
+Renders are deterministic, so the same spec always gives the same bytes. The
+response carries the package's SHA-256 as its ``ETag``; a request whose
+``If-None-Match`` lists it gets ``304 Not Modified`` without a body.
+
+Admission is bounded: at most ``concurrency`` renders run at once and at
+most ``queue_depth`` more wait; anything beyond that gets a 503.
+
+Image paths in a spec are relative to the service's ``asset_root`` and may
+not leave it; without an asset root, specs with images are rejected. Spec
+errors, whether found on admission or while rendering, get a 400. So does a
+malformed ``Content-Length``; a missing one gets a 411 and one over
+``MAX_SPEC_BYTES`` a 413.
+"""
+import io
+import json
+import os
+import socketserver
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from .cache import SlideCache
+from .spec import DeckSpec
+from .writer import COMPRESSION_PRESETS, DEFAULT_COMPRESSION
+
+PPTX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+MAX_SPEC_BYTES = 8 * 1024 * 1024
+SPEC_ERRORS = (ValueError, KeyError, TypeError)
+
+
+def _warm_up():
+    from .render import warm_up
+    warm_up()
+
+
+def _render_bytes(spec_dict, slides, compression, cache_dir):
+    from .render import build_deck
+
+    spec = DeckSpec.from_dict(spec_dict)
+    if slides:
+        spec = spec.subset(slides)
+    cache = SlideCache(cache_dir) if cache_dir else None
+    out = io.BytesIO()
+    etag = build_deck(spec, out, cache, compression, deterministic=True)
+    return spec.name, out.getvalue(), f'"{etag}"'
+
+
+def _asset_path(root, src):
+    """``src`` resolved inside ``root``; ``ValueError`` if it would leave it."""
+    if root is None:
+        raise ValueError("images are disabled (no asset root configured)")
+    path = Path(src)
+    full = (root / path).resolve()
+    if path.is_absolute() or ".." in path.parts or not full.is_relative_to(root):
+        raise ValueError(f"image path outside the asset root: {src!r}")
+    if not full.is_file():
+        raise ValueError(f"no such image: {src!r}")
+    return str(full)
+
+
+def _etags(header):
+    """Entity tags listed in an ``If-None-Match`` header, weak ones included."""
+    return {tag.strip().removeprefix("W/") for tag in header.split(",") if tag.strip()}
+
+
+class RenderService:
+    """Process pool plus the admission counter shared by all handler threads."""
+
+    def __init__(self, concurrency=None, queue_depth=16, cache_dir=None, asset_root=None):
+        self.concurrency = concurrency or os.cpu_count() or 1
+        self.queue_depth = queue_depth
+        self.cache_dir = cache_dir
+        self.asset_root = Path(asset_root).resolve() if asset_root else None
+        self._pool = ProcessPoolExecutor(max_workers=self.concurrency, initializer=_warm_up)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.rendered = 0
+        self.rejected = 0
+
+    def start(self):
+        # Spin every worker up now rather than on the first requests.
+        for f in [self._pool.submit(_warm_up) for _ in range(self.concurrency)]:
+            f.result()
+
+    def checked_spec(self, spec_dict):
+        """``spec_dict`` validated, with image paths resolved under ``asset_root``."""
+        if not isinstance(spec_dict, dict):
+            raise ValueError("spec must be a JSON object")
+        spec = DeckSpec.from_dict(spec_dict)
+        for slide in spec.slides:
+            slide.images = {slot: _asset_path(self.asset_root, src)
+                            for slot, src in slide.images.items()}
+        return spec.to_dict()
+
+    def try_admit(self):
+        with self._lock:
+            if self._in_flight >= self.concurrency + self.queue_depth:
+                self.rejected += 1
+                return False
+            self._in_flight += 1
+            return True
+
+    def release(self):
+        with self._lock:
+            self._in_flight -= 1
+
+    def render(self, spec_dict, slides=None, compression=DEFAULT_COMPRESSION):
+        future = self._pool.submit(_render_bytes, spec_dict, slides, compression,
+                                   self.cache_dir)
+        result = future.result()
+        with self._lock:
+            self.rendered += 1
+        return result
+
+    def stats(self):
+        with self._lock:
+            return {
+                "concurrency": self.concurrency,
+                "queue_depth": self.queue_depth,
+                "in_flight": self._in_flight,
+                "rendered": self.rendered,
+                "rejected": self.rejected,
+            }
+
+    def shutdown(self):
+        self._pool.shutdown(cancel_futures=True)
+
+
+class RenderHandler(BaseHTTPRequestHandler):
+    server_version = "pptgen"
+    protocol_version = "HTTP/1.1"
+
+    def address_string(self):
+        # Unix-socket peers have no (host, port) address.
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status, body, content_type="application/json", headers=()):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _not_modified(self, etag):
+        self.send_response(HTTPStatus.NOT_MODIFIED)
+        self.send_header("ETag", etag)
+        self.end_headers()
+
+    def _error(self, status, message, headers=()):
+        self._send(status, json.dumps({"error": message}).encode(), headers=headers)
+
+    def do_GET(self):
+        if urlsplit(self.path).path != "/healthz":
+            return self._error(HTTPStatus.NOT_FOUND, "not found")
+        self._send(HTTPStatus.OK, json.dumps(self.server.service.stats()).encode())
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path != "/render":
+            return self._error(HTTPStatus.NOT_FOUND, "not found")
+
+        length = self.headers.get("Content-Length")
+        if length is None:
+            self.close_connection = True
+            return self._error(HTTPStatus.LENGTH_REQUIRED, "Content-Length required")
+        try:
+            length = int(length)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.close_connection = True
+            return self._error(HTTPStatus.BAD_REQUEST,
+                               f"bad Content-Length: {self.headers['Content-Length']!r}")
+        if length > MAX_SPEC_BYTES:
+            self.close_connection = True
+            return self._error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "spec too large")
+        try:
+            spec_dict = self.server.service.checked_spec(json.loads(self.rfile.read(length)))
+            query = parse_qs(url.query)
+            slides = [int(n) for n in query.get("slides", [""])[0].split(",") if n]
+            compression = query.get("compression", [DEFAULT_COMPRESSION])[0]
+            if compression not in COMPRESSION_PRESETS:
+                raise ValueError(f"unknown compression {compression!r}")
+        except SPEC_ERRORS as e:
+            return self._error(HTTPStatus.BAD_REQUEST, f"bad spec: {e}")
+
+        service = self.server.service
+        if not service.try_admit():
+            return self._error(HTTPStatus.SERVICE_UNAVAILABLE, "render queue full",
+                               headers=[("Retry-After", "1")])
+        try:
+            name, blob, etag = service.render(spec_dict, slides, compression)
+        except SPEC_ERRORS as e:  # e.g. a layout option the builder needs
+            return self._error(HTTPStatus.BAD_REQUEST, f"bad spec: {e}")
+        except Exception as e:  # report it and keep serving
+            return self._error(HTTPStatus.INTERNAL_SERVER_ERROR, f"render failed: {e}")
+        finally:
+            service.release()
+
+        if _etags(self.headers.get("If-None-Match", "")) & {etag, "*"}:
+            return self._not_modified(etag)
+        self._send(HTTPStatus.OK, blob, PPTX_CONTENT_TYPE, headers=[
+            ("Content-Disposition", f'attachment; filename="{name}.pptx"'),
+            ("ETag", etag),
+        ])
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def make_server(service, address, verbose=False):
+    """Bind ``address``: ``unix:/path`` or ``host:port``."""
+    if address.startswith("unix:"):
+        path = address[len("unix:"):]
+        if os.path.exists(path):
+            os.unlink(path)
+        server = _UnixHTTPServer(path, RenderHandler)
+    else:
+        host, _, port = address.rpartition(":")
+        server = ThreadingHTTPServer((host or "127.0.0.1", int(port)), RenderHandler)
+        server.daemon_threads = True
+    server.service = service
+    server.verbose = verbose
+    return server
@@ -0,0 +1,471 @@
+"""Slide builders, one per layout.
+
+Each builder takes ``(prs, spec)`` and adds one slide, or a list of slides when
+a table runs onto continuation slides (see ``tables.py``). Geometry lives
+here; all text, lists and colors come from the ``SlideSpec``. Images named in
+``spec.images`` are placed in the matching ``IMAGE_SLOTS`` frame on top of
+whatever the layout drew.
+"""
+from pptx.dml.color import RGBColor
+from pptx.enum.shapes import MSO_SHAPE
+from pptx.enum.text import PP_ALIGN
+from pptx.util import Inches, Pt
+
+from .charts import POINT_BUDGET, add_column_chart, add_line_chart
+from .grid import BoxSlot, GridLayout, RuleSlot, TextSlot, add_card_grid
+from .helpers import add_image, add_para, add_text
+from .prototypes import (add_card, add_step, add_step_arrow, new_content_slide,
+                         new_slide)
+from .tables import Column, TableStyle, add_table_pages
+from .theme import (ACCENT, BODY_FONT, DARK_BORDER, DEEP, GRAY, LIGHT_GRAY, MONO_FONT,
+                    RED, WHITE, color)
+
+LAYOUTS = {}
+
+# slot name -> (left, top, width, height)
+IMAGE_SLOTS = {
+    "logo": (Inches(12.2), Inches(0.25), Inches(0.8), Inches(0.8)),
+    "qr": (Inches(11.4), Inches(5.3), Inches(1.5), Inches(1.5)),
+}
+
+
+def layout(name):
+    def register(fn):
+        LAYOUTS[name] = fn
+        return fn
+    return register
+
+
+def build_slide(prs, spec):
+    """Add the slide(s) for ``spec`` to ``prs`` and return them as a list."""
+    try:
+        builder = LAYOUTS[spec.layout]
+    except KeyError:
+        raise ValueError(f"Unknown slide layout: {spec.layout!r}") from None
+    slides = builder(prs, spec)
+    if not isinstance(slides, list):
+        slides = [slides]
+    for slide in slides:
+        for slot, src in spec.images.items():
+            add_image(slide, src, *image_slot(slot))
+    return slides
+
+
+def image_slot(name):
+    try:
+        return IMAGE_SLOTS[name]
+    except KeyError:
+        raise ValueError(f"Unknown image slot: {name!r}") from None
+
+
+def image_requests(specs):
+    """``(src, width, height)`` for every image the given slide specs place."""
+    for spec in specs:
+        for slot, src in spec.images.items():
+            yield (src, *image_slot(slot)[2:])
+
+
+# ============================================================
+# Title / closing
+# ============================================================
+@layout("hero")
+def build_hero(prs, spec):
+    slide = new_slide(prs)
+    opts = spec.options
+
+    add_text(slide, Inches(1), Inches(1.5), Inches(11), Inches(1.5),
+             spec.title, 72, ACCENT, True, PP_ALIGN.CENTER)
+
+    add_text(slide, Inches(1), Inches(3.0), Inches(11), Inches(1),
+             opts["tagline"], 28, LIGHT_GRAY, False, PP_ALIGN.CENTER)
+
+    add_text(slide, Inches(1), Inches(4.2), Inches(11), Inches(0.8),
+             spec.subtitle, 24, WHITE, True, PP_ALIGN.CENTER)
+
+    # Hackathon badge
+    add_card(slide, Inches(4.2), Inches(5.5), Inches(5), Inches(0.7),
+             DEEP, ACCENT)
+    add_text(slide, Inches(4.2), Inches(5.55), Inches(5), Inches(0.6),
+             opts["badge"], 16, ACCENT, True, PP_ALIGN.CENTER)
+
+    add_text(slide, Inches(1), Inches(6.5), Inches(11), Inches(0.5),
+             spec.note, 14, GRAY, False, PP_ALIGN.CENTER)
+    return slide
+
+
+@layout("demo")
+def build_demo(prs, spec):
+    slide = new_slide(prs)
+
+    add_text(slide, Inches(1), Inches(1.2), Inches(11), Inches(1),
+             spec.title, 56, ACCENT, True, PP_ALIGN.CENTER)
+
+    add_text(slide, Inches(1), Inches(2.5), Inches(11), Inches(0.8),
+             spec.subtitle, 32, WHITE, True, PP_ALIGN.CENTER)
+
+    add_card(slide, Inches(3), Inches(3.8), Inches(7.3), Inches(2.5), DEEP, ACCENT)
+    tf = add_text(slide, Inches(3.5), Inches(4.0), Inches(6.3), Inches(2),
+                  spec.items[0], 20, LIGHT_GRAY)
+    for step in spec.items[1:]:
+        add_para(tf, step, 20, LIGHT_GRAY)
+
+    # Footer
+    add_text(slide, Inches(1), Inches(6.5), Inches(11), Inches(0.5),
+             spec.note, 16, GRAY, False, PP_ALIGN.CENTER)
+    return slide
+
+
+# ============================================================
+# Card rows
+# ============================================================
+@layout("card_row")
+def build_card_row(prs, spec):
+    slide = new_content_slide(prs, spec.title)
+
+    add_text(slide, Inches(0.8), Inches(2.0), Inches(11), Inches(1),
+             spec.subtitle, 22, LIGHT_GRAY, False)
+
+    add_card_grid(slide, spec.items, GridLayout(
+        len(spec.items), Inches(3.5), Inches(2.5), left=Inches(0.8), top=Inches(3.5),
+        col_gap=Inches(0.5),
+    ), [
+        TextSlot("{0}", Inches(0.3), Inches(0.2), Inches(2.9), Inches(0.6), 22, bold=True),
+        TextSlot("{1}", Inches(0.3), Inches(0.9), Inches(2.9), Inches(1.4), 18, LIGHT_GRAY),
+    ])
+    return slide
+
+
+@layout("policy_row")
+def build_policy_row(prs, spec):
+    slide = new_content_slide(prs, spec.title)
+
+    add_text(slide, Inches(0.8), Inches(2.0), Inches(11), Inches(0.8),
+             spec.subtitle, 22, LIGHT_GRAY)
+
+    add_card_grid(slide, spec.items, GridLayout(
+        len(spec.items), Inches(2.2), Inches(1.8), left=Inches(0.5), top=Inches(3.3),
+        col_gap=Inches(0.3),
+    ), [
+        TextSlot("{0}", Inches(0.2), Inches(0.15), Inches(1.8), Inches(0.5), 18,
+                 bold=True, alignment=PP_ALIGN.CENTER),
+        TextSlot("{1}", Inches(0.2), Inches(0.95), Inches(1.8), Inches(0.75), 15,
+                 LIGHT_GRAY, alignment=PP_ALIGN.CENTER),
+    ])
+
+    add_text(slide, Inches(0.8), Inches(5.5), Inches(11), Inches(1.2),
+             spec.note, 18, GRAY)
+    return slide
+
+
+@layout("layers")
+def build_layers(prs, spec):
+    slide = new_content_slide(prs, spec.title)
+
+    add_card_grid(slide, spec.items, GridLayout(
+        len(spec.items), Inches(3), Inches(4), left=Inches(0.5), top=Inches(2.2),
+    ), [
+        TextSlot("{0}", Inches(0.25), Inches(0.2), Inches(2.5), Inches(0.5), 18,
+                 bold=True, alignment=PP_ALIGN.CENTER),
+        # separator line
+        RuleSlot(Inches(0.5), Inches(0.8), Inches(2), Pt(1.5)),
+        TextSlot("{1}", Inches(0.25), Inches(1.0), Inches(2.5), Inches(2.5), 16,
+                 LIGHT_GRAY, alignment=PP_ALIGN.CENTER),
+    ])
+    return slide
+
+
+@layout("stats")
+def build_stats(prs, spec):
+    slide = new_content_slide(prs, spec.title)
+
+    add_card_grid(slide, spec.items, GridLayout(
+        len(spec.items), Inches(2.6), Inches(2.5), left=Inches(0.8), top=Inches(2.5),
+        col_gap=Inches(0.5),
+    ), [
+        TextSlot("{0}", 0, Inches(0.3), Inches(2.6), Inches(1), 48,
+                 bold=True, alignment=PP_ALIGN.CENTER),
+        TextSlot("{1}", 0, Inches(1.4), Inches(2.6), Inches(0.8), 18,
+                 LIGHT_GRAY, alignment=PP_ALIGN.CENTER),
+    ])
+
+    add_text(slide, Inches(0.8), Inches(5.5), Inches(11.5), Inches(1.5),
+             spec.note, 16, GRAY)
+    return slide
+
+
+@layout("vision_grid")
+def build_vision_grid(prs, spec):
+    slide = new_content_slide(prs, spec.title)
+
+    add_text(slide, Inches(0.8), Inches(1.9), Inches(11), Inches(0.7),
+             spec.subtitle, 22, LIGHT_GRAY)
+
+    # Vision statement
+    add_card(slide, Inches(0.5), Inches(2.8), Inches(12.3), Inches(0.9), DEEP, ACCENT)
+    add_text(slide, Inches(0.8), Inches(2.9), Inches(11.7), Inches(0.7),
+             spec.options["quote"], 20, ACCENT, True, PP_ALIGN.CENTER)
+
+    # Use cases, 3 per row
+    add_card_grid(slide, spec.items, GridLayout(
+        3, Inches(3.8), Inches(1.5), left=Inches(0.5), top=Inches(4.0),
+        col_gap=Inches(0.35), row_gap=Inches(0.2),
+    ), [
+        TextSlot("{0}", Inches(0.2), Inches(0.1), Inches(3.4), Inches(0.4), 16, bold=True),
+        TextSlot("{1}", Inches(0.2), Inches(0.5), Inches(3.4), Inches(0.9), 14, LIGHT_GRAY),
+    ])
+    return slide
+
+
+@layout("data_grid")
+def build_data_grid(prs, spec):
+    """Dense grid of (label, value, color) cells sized to fill the content area."""
+    slide = new_content_slide(prs, spec.title)
+    opts = spec.options
+    columns = opts.get("columns", 10)
+    rows = max(1, -(-len(spec.items) // columns))
+    gap = Inches(opts.get("gap", 0.05))
+    card_width = (Inches(12.3) - gap * (columns - 1)) // columns
+    card_height = (Inches(5.3) - gap * (rows - 1)) // rows
+    size = opts.get("font_size", 9)
+
+    add_card_grid(slide, spec.items, GridLayout(
+        columns, card_width, card_height, left=Inches(0.5), top=Inches(1.9),
+        col_gap=gap, row_gap=gap,
+    ), [
+        TextSlot("{0}", 0, 0, card_width, card_height // 2, size, bold=True),
+        TextSlot("{1}", 0, card_height // 2, card_width, card_height // 2, size, LIGHT_GRAY),
+    ])
+    return slide
+
+
+# ============================================================
+# Pipeline
+# ============================================================
+@layout("pipeline")
+def build_pipeline(prs, spec):
+    slide = new_content_slide(prs, spec.title)
+
+    for i, (num, desc, c) in enumerate(spec.items):
+        c = color(c)
+        x = Inches(0.3 + i * 1.8)
+        add_step(slide, x, num, c)
+        add_text(slide, x, Inches(3.6), Inches(1.7), Inches(1),
+                 desc, 16, LIGHT_GRAY, False, PP_ALIGN.CENTER)
+
+        # Arrow between steps
+        if i < len(spec.items) - 1:
+            add_step_arrow(slide, x)
+
+    # Bottom note
+    add_text(slide, Inches(0.8), Inches(5.2), Inches(11.5), Inches(1.5),
+             spec.note, 17, GRAY)
+    return slide
+
+
+# ============================================================
+# Two side-by-side panels with monospace lists
+# ============================================================
+@layout("panels")
+def build_panels(prs, spec):
+    slide = new_content_slide(prs, spec.title)
+    opts = spec.options
+    top = opts.get("top", 2.2)
+    height = opts.get("height", 4.5)
+    heading_size = opts.get("heading_size", 24)
+    list_offset = opts.get("list_offset", 1.0)
+
+    if spec.subtitle:
+        add_text(slide, Inches(0.8), Inches(1.8), Inches(11), Inches(0.5),
+                 spec.subtitle, 20, LIGHT_GRAY)
+
+    for i, panel in enumerate(spec.items):
+        c = color(panel["color"])
+        x = 0.5 + i * 6.5
+        lines = panel["lines"]
+        add_card(slide, Inches(x), Inches(top), Inches(5.8), Inches(height), DEEP, c)
+        add_text(slide, Inches(x + 0.3), Inches(top + 0.2), Inches(5.2), Inches(0.5),
+                 panel["heading"], heading_size, c, True)
+        tf = add_text(slide, Inches(x + 0.5), Inches(top + list_offset), Inches(5), Inches(3),
+                      lines[0], 16, LIGHT_GRAY, False, font_name=MONO_FONT)
+        for line in lines[1:]:
+            add_para(tf, line, panel.get("line_size", 16), LIGHT_GRAY,
+                     font_name=MONO_FONT, space_before=Pt(panel.get("line_spacing", 6)))
+    return slide
+
+
+# ============================================================
+# Rows
+# ============================================================
+@layout("features")
+def build_features(prs, spec):
+    slide = new_content_slide(prs, spec.title)
+
+    for i, (title, desc, c) in enumerate(spec.items):
+        c = color(c)
+        y = Inches(2.0 + i * 1.05)
+        # Color dot
+        dot = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(0.8), y + Inches(0.1),
+                                      Inches(0.3), Inches(0.3))
+        dot.fill.solid()
+        dot.fill.fore_color.rgb = c
+        dot.line.fill.background()
+        add_text(slide, Inches(1.3), y, Inches(3.5), Inches(0.4),
+                 title, 22, c, True)
+        add_text(slide, Inches(5), y, Inches(7.5), Inches(0.9),
+                 desc, 17, LIGHT_GRAY)
+    return slide
+
+
+@layout("blocked_rows")
+def build_blocked_rows(prs, spec):
+    slide = new_content_slide(prs, spec.title)
+
+    add_text(slide, Inches(0.8), Inches(1.8), Inches(11), Inches(0.5),
+             spec.subtitle, 20, LIGHT_GRAY)
+
+    add_card_grid(slide, spec.items, GridLayout(
+        1, Inches(11), Inches(0.8), left=Inches(1), top=Inches(2.7), row_gap=Inches(0.15),
+    ), [
+        # BLOCKED badge
+        BoxSlot(Inches(0.3), Inches(0.15), Inches(1.5), Inches(0.5),
+                RGBColor(0x30, 0x10, 0x10), RED),
+        TextSlot("BLOCKED", Inches(0.3), Inches(0.15), Inches(1.5), Inches(0.5), 14,
+                 RED, True, PP_ALIGN.CENTER, MONO_FONT),
+        TextSlot("{0}. {1}", Inches(2.2), Inches(0.1), Inches(3.6), Inches(0.6), 19,
+                 WHITE, True),
+        TextSlot("{2}", Inches(6), Inches(0.15), Inches(4.5), Inches(0.5), 16, GRAY),
+    ], border_color=DARK_BORDER, color_field=None)
+    return slide
+
+
+@layout("label_rows")
+def build_label_rows(prs, spec):
+    """Headerless two-column table of (label, description, color) rows."""
+    slide = new_content_slide(prs, spec.title)
+
+    return add_table_pages(prs, slide, spec.title, spec.items, [
+        Column("{0}", Inches(3), font_size=18, bold=True),
+        Column("{1}", Inches(8.5), font_size=17, color=LIGHT_GRAY),
+    ], Inches(1), Inches(2.0), Inches(7.3), TableStyle(Inches(0.58), header=False))
+
+
+@layout("audit")
+def build_audit(prs, spec):
+    """One withdrawal: (label, value, color) rows and the explorer link."""
+    slide = new_content_slide(prs, spec.title)
+
+    add_text(slide, Inches(0.8), Inches(1.8), Inches(11), Inches(0.5),
+             spec.subtitle, 20, LIGHT_GRAY)
+
+    add_card_grid(slide, spec.items, GridLayout(
+        1, Inches(11), Inches(0.6), left=Inches(1), top=Inches(2.6), row_gap=Inches(0.12),
+    ), [
+        TextSlot("{0}", Inches(0.3), Inches(0.08), Inches(3), Inches(0.45), 16, GRAY, True),
+        TextSlot("{1}", Inches(3.5), Inches(0.08), Inches(7.2), Inches(0.45), 18,
+                 font_name=MONO_FONT),
+    ], border_color=DARK_BORDER)
+
+    add_text(slide, Inches(1), Inches(6.4), Inches(11), Inches(0.5),
+             spec.note, 14, ACCENT, font_name=MONO_FONT)
+    return slide
+
+
+@layout("disclosure")
+def build_disclosure(prs, spec):
+    slide = new_content_slide(prs, spec.title)
+    label_color = color(spec.options.get("label_color", "AMBER"))
+
+    add_text(slide, Inches(0.8), Inches(2.0), Inches(11), Inches(0.5),
+             spec.subtitle, 20, LIGHT_GRAY)
+
+    return add_table_pages(prs, slide, spec.title, spec.items, [
+        Column("{0}", Inches(3), font_size=20, color=label_color, bold=True),
+        Column("{1}", Inches(8.5), font_size=18),
+    ], Inches(1), Inches(3.0), Inches(7.3), TableStyle(Inches(0.85), header=False))
+
+
+# ============================================================
+# Tables
+# ============================================================
+_ALIGNMENTS = {"left": PP_ALIGN.LEFT, "center": PP_ALIGN.CENTER, "right": PP_ALIGN.RIGHT}
+
+
+def _table_column(index, opts, size):
+    try:
+        alignment = _ALIGNMENTS[opts.get("align", "left")]
+    except KeyError:
+        raise ValueError(f"Unknown column alignment: {opts['align']!r}") from None
+    return Column(
+        opts.get("text", f"{{{index}}}"), Inches(opts["width"]), opts.get("header", ""),
+        opts.get("size", size), color(opts["color"]) if "color" in opts else None,
+        opts.get("bold", False), alignment, opts.get("font", BODY_FONT),
+    )
+
+
+@layout("table")
+def build_table(prs, spec):
+    """Native table of ``spec.items`` rows, continued on further slides as needed.
+
+    ``options["columns"]`` describes each column: ``width`` (inches) and
+    optionally ``header``, ``text`` (format string, default the column's own
+    field), ``size``, ``color`` (default the row's last field), ``bold``,
+    ``font`` and ``align``. ``size`` (default 14) applies to the header and
+    every column without its own; ``row_height`` is in inches.
+    """
+    slide = new_content_slide(prs, spec.title)
+    opts = spec.options
+    top = 1.9
+    if spec.subtitle:
+        add_text(slide, Inches(0.8), Inches(1.8), Inches(11), Inches(0.5),
+                 spec.subtitle, 20, LIGHT_GRAY)
+        top = 2.5
+
+    size = opts.get("size", 14)
+    columns = [_table_column(i, c, size) for i, c in enumerate(opts["columns"])]
+    style = TableStyle(
+        Inches(opts.get("row_height", 0.4)), header=opts.get("header", True), header_size=size,
+        border_color=color(opts.get("border_color", "DARK_BORDER")),
+    )
+    return add_table_pages(prs, slide, spec.title, spec.items, columns, Inches(0.5),
+                           Inches(top), Inches(7.1), style)
+
+
+# ============================================================
+# Charts
+# ============================================================
+@layout("chart")
+def build_chart(prs, spec):
+    """Native chart whose data comes in ``spec.options``.
+
+    ``type`` is ``"line"`` (default) with ``series`` of ``{"name", "x", "y",
+    "color"}``, each downsampled to ``points``, or ``"column"`` with
+    ``categories`` and ``series`` of ``{"name", "values", "color"}``. Axis
+    number formats come from ``x_format`` and ``y_format``.
+    """
+    slide = new_content_slide(prs, spec.title)
+    opts = spec.options
+    top = 1.9
+    if spec.subtitle:
+        add_text(slide, Inches(0.8), Inches(1.8), Inches(11), Inches(0.5),
+                 spec.subtitle, 20, LIGHT_GRAY)
+        top = 2.4
+    bottom = 6.3 if spec.note else 7.1
+    frame = (Inches(0.5), Inches(top), Inches(12.3), Inches(bottom - top))
+
+    kind = opts.get("type", "line")
+    y_format = opts.get("y_format", "#,##0")
+    if kind == "line":
+        add_line_chart(slide, [(s["name"], s["x"], s["y"], s["color"]) for s in opts["series"]],
+                       *frame, points=opts.get("points", POINT_BUDGET),
+                       x_format=opts.get("x_format", "General"), y_format=y_format)
+    elif kind == "column":
+        add_column_chart(slide, opts["categories"],
+                         [(s["name"], s["values"], s["color"]) for s in opts["series"]],
+                         *frame, y_format=y_format)
+    else:
+        raise ValueError(f"Unknown chart type: {kind!r}")
+
+    if spec.note:
+        add_text(slide, Inches(0.8), Inches(6.5), Inches(11.5), Inches(0.6),
+                 spec.note, 14, GRAY)
+    return slide
@@ -0,0 +1,64 @@
+"""Declarative deck specs.
+
+A deck is a list of slides; each slide names a ``layout`` (a builder in
+``slides.py``) and carries only content. Colors are theme names such as
+``"ACCENT"`` or ``"#RRGGBB"`` strings, so a spec round-trips through JSON.
+
+``images`` maps image slot names (``"logo"``, ``"qr"``; see ``IMAGE_SLOTS``)
+to image files. A deck-level ``images`` object applies to every slide, with a
+slide's own entries taking precedence; ``load_spec`` resolves relative paths
+against the spec file's directory.
+"""
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+DECKS_DIR = Path(__file__).resolve().parent / "decks"
+DEFAULT_SPEC = DECKS_DIR / "suistody.json"
+
+
+@dataclass
+class SlideSpec:
+    layout: str
+    title: str = ""
+    subtitle: str = ""
+    items: list = field(default_factory=list)
+    note: str = ""
+    options: dict = field(default_factory=dict)
+    images: dict = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+
+@dataclass
+class DeckSpec:
+    name: str
+    slides: list = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data, base_dir=None):
+        shared = data.get("images", {})
+        slides = [SlideSpec.from_dict(s) for s in data.get("slides", [])]
+        for slide in slides:
+            slide.images = {**shared, **slide.images}
+            if base_dir is not None:
+                slide.images = {k: str(Path(base_dir, v)) for k, v in slide.images.items()}
+        return cls(name=data["name"], slides=slides)
+
+    def to_dict(self):
+        return asdict(self)
+
+    def subset(self, numbers):
+        """Copy of this deck with only the given 1-based slide numbers, in order."""
+        for n in numbers:
+            if not 1 <= n <= len(self.slides):
+                raise ValueError(f"{self.name}: no slide {n} (deck has {len(self.slides)})")
+        return DeckSpec(name=self.name, slides=[self.slides[n - 1] for n in numbers])
+
+
+def load_spec(path):
+    """Load a ``DeckSpec`` from a JSON file."""
+    with open(path, encoding="utf-8") as f:
+        return DeckSpec.from_dict(json.load(f), base_dir=Path(path).parent)
@@ -0,0 +1,43 @@
+"""Compiled paragraph styles.
+
+python-pptx applies paragraph formatting one property at a time, and every
+setter walks (and often grows) the ``a:pPr``/``a:defRPr`` tree. Decks reuse a
+handful of (size, color, bold, font, alignment, spacing) combinations, so each
+one is compiled once into a finished ``a:pPr`` element and paragraphs receive a
+deep copy of it.
+"""
+from copy import deepcopy
+from functools import lru_cache
+
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from pptx.text.text import _Paragraph
+from pptx.util import Pt
+
+_EMPTY_P = parse_xml(f"<a:p {nsdecls('a')}/>")
+
+
+@lru_cache(maxsize=None)
+def paragraph_style(font_size, color, bold, alignment, font_name, space_before=None):
+    """Return the cached ``a:pPr`` element for one style combination.
+
+    Built with the regular python-pptx setters, so the XML is identical to
+    what ``add_text``/``add_para`` used to produce property by property.
+    """
+    p = _Paragraph(deepcopy(_EMPTY_P), None)
+    p.font.size = Pt(font_size)
+    p.font.color.rgb = color
+    p.font.bold = bold
+    p.font.name = font_name
+    p.alignment = alignment
+    if space_before is not None:
+        p.space_before = space_before
+    return p._p.pPr
+
+
+def apply_style(p, style):
+    """Replace the ``a:pPr`` of paragraph element ``p`` with a copy of ``style``."""
+    pPr = p.find(qn("a:pPr"))
+    if pPr is not None:
+        p.remove(pPr)
+    p.insert(0, deepcopy(style))
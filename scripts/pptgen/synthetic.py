@@ -0,0 +1,50 @@
+"""Synthetic deck specs for benchmarks and stress tests."""
+import hashlib
+import itertools
+
+from .spec import DEFAULT_SPEC, DeckSpec, SlideSpec, load_spec
+
+_CELL_COLORS = ["ACCENT", "GREEN", "AMBER", "PURPLE", "RED", "LIGHT_GRAY"]
+
+
+def scaled_deck(slides, base=DEFAULT_SPEC):
+    """The ``base`` deck's slides repeated in order until there are ``slides``."""
+    spec = load_spec(base)
+    return DeckSpec(
+        name=f"{spec.name}_x{slides}",
+        slides=list(itertools.islice(itertools.cycle(spec.slides), slides)),
+    )
+
+
+def grid_deck(shapes, cells_per_slide=340, columns=20):
+    """``data_grid`` slides totalling roughly ``shapes`` shapes (3 per cell)."""
+    cells = max(1, shapes // 3)
+    slides = []
+    for start in range(0, cells, cells_per_slide):
+        count = min(cells_per_slide, cells - start)
+        items = [[f"cell {start + i}", f"{(start + i) * 1.75:,.2f} SUI",
+                  _CELL_COLORS[(start + i) % len(_CELL_COLORS)]] for i in range(count)]
+        slides.append(SlideSpec(
+            layout="data_grid",
+            title=f"DATA {len(slides) + 1}",
+            items=items,
+            options={"columns": columns, "font_size": 6},
+        ))
+    return DeckSpec(name=f"grid_{shapes}", slides=slides)
+
+
+def audit_events(count, budget_sui=1_000_000):
+    """``count`` fake ``VaultEvent`` dicts, generated lazily."""
+    spent = 0
+    for n in range(1, count + 1):
+        amount = (n * 7919 % 5000 + 1) * 1_000_000
+        spent += amount
+        yield {
+            "txDigest": hashlib.sha256(str(n).encode()).hexdigest()[:44],
+            "amount": amount,
+            "actionType": n % 4,
+            "totalSpent": spent,
+            "remainingBudget": budget_sui * 1_000_000_000 - spent,
+            "txCount": n,
+            "timestamp": 1_767_225_600_000 + n * 60_000,
+        }
@@ -0,0 +1,200 @@
+"""Native PowerPoint tables, filled in bulk and continued across slides.
+
+``add_table`` writes a whole ``p:graphicFrame`` / ``a:tbl`` as one XML string
+and parses it once. python-pptx's ``shapes.add_table`` plus ``cell.text`` per
+cell goes through several proxy objects and tree walks per cell, which is what
+makes long tables (a 5,000-row transaction log) slow to build. Cell paragraphs
+carry the same compiled ``a:pPr`` styles as text boxes (see ``styles.py``).
+
+``add_table_pages`` splits rows that do not fit above ``bottom`` onto
+continuation slides titled ``"<title> (cont.)"`` and repeats the header row on
+each. Row heights are estimated, not measured: every ``\\n`` (paragraph) or
+``\\v`` (line break) in a cell starts a new line and cell text is assumed not
+to wrap, so size columns to fit their content. Other control characters are
+written as ``_xHHHH_``, as python-pptx does. All geometry is in EMU (use
+``Inches``/``Pt``), like the python-pptx API.
+"""
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from xml.sax.saxutils import escape
+
+from lxml import etree
+from pptx.enum.text import PP_ALIGN
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.util import Inches
+
+from .metrics import EMU_PER_PT, INSET_Y, LINE_HEIGHT
+from .profiling import traced
+from .prototypes import new_content_slide
+from .styles import paragraph_style
+from .theme import BODY_FONT, DEEP, GRAY, color
+
+TABLE_URI = "http://schemas.openxmlformats.org/drawingml/2006/table"
+# Built-in "No Style, No Grid". Without a style id PowerPoint applies the
+# template's default table style (banded Medium Style 2 - Accent 1).
+NO_STYLE_ID = "{2D5ABB26-0587-4C30-8999-92F81FD0307C}"
+CONTINUED_TOP = Inches(1.9)
+_CONTROL = re.compile(r"[\x00-\x08\x0B-\x1F]")  # invalid in XML; \t and \n are fine
+
+
+@dataclass(frozen=True)
+class Column:
+    """Table column; ``text`` is formatted with the row's fields (``"{0}"``)."""
+    text: str
+    width: int
+    header: str = ""
+    font_size: int = 16
+    color: object = None  # None: the row's color
+    bold: bool = False
+    alignment: PP_ALIGN = PP_ALIGN.LEFT
+    font_name: str = BODY_FONT
+
+
+@dataclass(frozen=True)
+class TableStyle:
+    row_height: int  # minimum; rows grow with the lines of their tallest cell
+    header: bool = True
+    header_size: int = 14
+    header_color: object = GRAY
+    header_fill: object = DEEP
+    fill: object = None  # body cell fill, None for transparent
+    border_color: object = None  # rule under every row
+    color_field: int = -1
+
+
+@lru_cache(maxsize=None)
+def _ppr(font_size, font_color, bold, alignment, font_name):
+    xml = etree.tostring(paragraph_style(font_size, font_color, bold, alignment, font_name),
+                         encoding=str)
+    return xml.replace(f" {nsdecls('a')}", "", 1)
+
+
+@lru_cache(maxsize=None)
+def _tc_pr(fill, border):
+    rule = (f'<a:lnB w="12700"><a:solidFill><a:srgbClr val="{border}"/></a:solidFill></a:lnB>'
+            if border else "")
+    fill = f'<a:solidFill><a:srgbClr val="{fill}"/></a:solidFill>' if fill else "<a:noFill/>"
+    return f'<a:tcPr anchor="ctr">{rule}{fill}</a:tcPr>'
+
+
+def _runs(line):
+    return "<a:br/>".join(
+        f"<a:r><a:t>{escape(_CONTROL.sub(lambda m: f'_x{ord(m[0]):04X}_', part))}</a:t></a:r>"
+        if part else "" for part in line.split("\v"))
+
+
+def _cell(text, ppr, tc_pr):
+    paras = "".join(f"<a:p>{ppr}{_runs(line)}</a:p>" for line in text.split("\n"))
+    return f"<a:tc><a:txBody><a:bodyPr/><a:lstStyle/>{paras}</a:txBody>{tc_pr}</a:tc>"
+
+
+def _line_height(font_size):
+    return round(font_size * LINE_HEIGHT * EMU_PER_PT)
+
+
+def row_heights(texts, columns, row_height):
+    """Estimated height of each row of cell ``texts``."""
+    line_heights = [_line_height(col.font_size) for col in columns]
+    return [max(row_height, 2 * INSET_Y + max(
+        (text.count("\n") + text.count("\v") + 1) * lh for text, lh in zip(row, line_heights)))
+        for row in texts]
+
+
+def paginate(heights, first, rest=None, header=0):
+    """Split rows of the given heights into ``(start, stop)`` pages.
+
+    The first page has ``first`` EMU of room and every later page ``rest``
+    (default: the same); ``header`` is taken off each page for the repeated
+    header row. A row taller than a whole page gets a page to itself.
+    """
+    pages, start, used, room = [], 0, 0, first - header
+    for i, height in enumerate(heights):
+        if i > start and used + height > room:
+            pages.append((start, i))
+            start, used, room = i, 0, (rest or first) - header
+        used += height
+    pages.append((start, len(heights)))
+    return pages
+
+
+def _cell_texts(rows, columns):
+    return [[col.text.format(*row) for col in columns] for row in rows]
+
+
+def table_xml(shape_id, texts, colors, heights, columns, left, top, style):
+    """``p:graphicFrame`` XML for one page of a table."""
+    rows = []
+    if style.header:
+        tc_pr = _tc_pr(style.header_fill, style.border_color)
+        rows.append(f'<a:tr h="{style.row_height}">' + "".join(
+            _cell(col.header, _ppr(style.header_size, style.header_color, True,
+                                   col.alignment, col.font_name), tc_pr)
+            for col in columns) + "</a:tr>")
+    tc_pr = _tc_pr(style.fill, style.border_color)
+    for row, row_color, height in zip(texts, colors, heights):
+        rows.append(f'<a:tr h="{height}">' + "".join(
+            _cell(text, _ppr(col.font_size, col.color or row_color, col.bold,
+                             col.alignment, col.font_name), tc_pr)
+            for text, col in zip(row, columns)) + "</a:tr>")
+
+    width = sum(col.width for col in columns)
+    height = sum(heights) + (style.row_height if style.header else 0)
+    grid = "".join(f'<a:gridCol w="{int(col.width)}"/>' for col in columns)
+    return (
+        f"<p:graphicFrame {nsdecls('a', 'p')}>"
+        f"<p:nvGraphicFramePr><p:cNvPr id=\"{shape_id}\" name=\"Table {shape_id - 1}\"/>"
+        "<p:cNvGraphicFramePr><a:graphicFrameLocks noGrp=\"1\"/></p:cNvGraphicFramePr>"
+        "<p:nvPr/></p:nvGraphicFramePr>"
+        f'<p:xfrm><a:off x="{int(left)}" y="{int(top)}"/><a:ext cx="{int(width)}" cy="{height}"/>'
+        f'</p:xfrm><a:graphic><a:graphicData uri="{TABLE_URI}"><a:tbl>'
+        f'<a:tblPr firstRow="{int(style.header)}"><a:tableStyleId>{NO_STYLE_ID}'
+        f"</a:tableStyleId></a:tblPr><a:tblGrid>{grid}</a:tblGrid>{''.join(rows)}"
+        "</a:tbl></a:graphicData></a:graphic></p:graphicFrame>"
+    )
+
+
+def _row_colors(rows, columns, style):
+    if all(col.color is not None for col in columns):
+        return [None] * len(rows)
+    return [color(row[style.color_field]) for row in rows]
+
+
+@traced("helper")
+def add_table(slide, rows, columns, left, top, style):
+    """Add all of ``rows`` as one table and return its ``p:graphicFrame``."""
+    texts = _cell_texts(rows, columns)
+    heights = row_heights(texts, columns, style.row_height)
+    return _add_frame(slide, texts, _row_colors(rows, columns, style), heights,
+                      columns, left, top, style)
+
+
+def _add_frame(slide, texts, colors, heights, columns, left, top, style):
+    sp_tree = slide.shapes._spTree
+    frame = parse_xml(table_xml(sp_tree.max_shape_id + 1, texts, colors, heights,
+                                columns, left, top, style))
+    sp_tree.append(frame)
+    return frame
+
+
+@traced("helper")
+def add_table_pages(prs, slide, title, rows, columns, left, top, bottom, style,
+                    continued_top=CONTINUED_TOP):
+    """Add ``rows`` to ``slide`` from ``top``, continuing on new slides as needed.
+
+    Rows that do not fit above ``bottom`` go on continuation slides, where the
+    table starts at ``continued_top``. Returns every slide used, ``slide`` first.
+    """
+    texts = _cell_texts(rows, columns)
+    colors = _row_colors(rows, columns, style)
+    heights = row_heights(texts, columns, style.row_height)
+    header = style.row_height if style.header else 0
+    slides = []
+    for start, stop in paginate(heights, bottom - top, bottom - continued_top, header):
+        if slides:
+            slide, top = new_content_slide(prs, f"{title} (cont.)"), continued_top
+        _add_frame(slide, texts[start:stop], colors[start:stop], heights[start:stop],
+                   columns, left, top, style)
+        slides.append(slide)
+    return slides
@@ -0,0 +1,49 @@
+"""Suistody deck theme: slide size, colors and fonts."""
+from pptx.dml.color import RGBColor
+from pptx.util import Inches
+
+SLIDE_WIDTH = Inches(13.333)
+SLIDE_HEIGHT = Inches(7.5)
+
+# -- Theme colors --
+VOID = RGBColor(0x06, 0x0A, 0x13)
+DEEP = RGBColor(0x0A, 0x0E, 0x1A)
+ACCENT = RGBColor(0x00, 0xD4, 0xFF)
+AMBER = RGBColor(0xF5, 0x9E, 0x0B)
+GREEN = RGBColor(0x22, 0xC5, 0x5E)
+RED = RGBColor(0xDC, 0x26, 0x26)
+WHITE = RGBColor(0xFF, 0xFF, 0xFF)
+GRAY = RGBColor(0x9C, 0xA3, 0xAF)
+LIGHT_GRAY = RGBColor(0xD1, 0xD5, 0xDB)
+DARK_BORDER = RGBColor(0x1F, 0x29, 0x37)
+PURPLE = RGBColor(0xA8, 0x55, 0xF7)
+
+COLORS = {
+    "VOID": VOID,
+    "DEEP": DEEP,
+    "ACCENT": ACCENT,
+    "AMBER": AMBER,
+    "GREEN": GREEN,
+    "RED": RED,
+    "WHITE": WHITE,
+    "GRAY": GRAY,
+    "LIGHT_GRAY": LIGHT_GRAY,
+    "DARK_BORDER": DARK_BORDER,
+    "PURPLE": PURPLE,
+}
+
+# -- Fonts --
+BODY_FONT = "Segoe UI"
+MONO_FONT = "Consolas"
+
+
+def color(value):
+    """Resolve a theme color name (``"ACCENT"``) or ``"#RRGGBB"`` string."""
+    if isinstance(value, RGBColor):
+        return value
+    if value.startswith("#"):
+        return RGBColor.from_string(value[1:].upper())
+    try:
+        return COLORS[value]
+    except KeyError:
+        raise ValueError(f"Unknown theme color: {value!r}") from None
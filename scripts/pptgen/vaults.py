@@ -0,0 +1,312 @@
+"""Live vault state from a Sui full node, fetched concurrently for many vaults.
+
+The parsing mirrors ``lib/vault/service.ts``: vaults come back in the
+``VaultData`` shape and withdrawals in the ``VaultEvent`` shape of
+``lib/vault/types.ts`` (camelCase, amounts in MIST, times in milliseconds),
+as plain dicts like the rest of ``pptgen``.
+
+``VaultSource`` sits on a pooled ``JsonRpcClient`` (see ``rpc.py``):
+
+- vault objects are read with ``sui_multiGetObjects`` in batches of up to
+  ``OBJECT_BATCH`` ids, the batches running concurrently within the client's
+  connection limit;
+- withdrawals are ``AgentWithdrawal`` events, which the node can only filter
+  by type. Like ``getVaultEvents``, they are scanned newest first and grouped
+  by ``vault_id``, but one scan is shared by every vault in the request;
+- vaults and event pages are kept in a ``TTLCache`` for ``ttl`` seconds.
+  Concurrent requests for the same vault share one fetch.
+
+``reports`` yields each vault with its recent withdrawals as soon as both are
+known, so rendering (``render_reports``) starts while the rest is fetched. A
+vault that cannot be read or rendered is yielded with its error and the others
+carry on; only a failed event scan, which every vault shares, ends the run.
+"""
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+
+from .writer import DEFAULT_COMPRESSION
+
+# lib/constants.ts
+PACKAGE_ID = os.environ.get(
+    "NEXT_PUBLIC_PACKAGE_ID",
+    "0xf01673d606536731ca79fe85324026cdf9c7b2471bbf61a29b03ce911fe5c7d1")
+MODULE_NAME = "agent_vault"
+
+OBJECT_BATCH = 50  # sui_multiGetObjects limit
+EVENT_PAGE = 50  # suix_queryEvents limit
+RECENT_EVENTS = 50  # withdrawals per vault, as on the dashboard
+MAX_EVENT_PAGES = 40
+DEFAULT_TTL = 30.0
+
+_OBJECT_OPTIONS = {"showContent": True, "showOwner": True}
+
+
+# ============================================================
+# Parsing (lib/vault/service.ts)
+# ============================================================
+def _unwrap(value):
+    """A Move struct's fields, whether nested as ``{"fields": {...}}`` or not."""
+    if isinstance(value, dict):
+        inner = value.get("fields")
+        return inner if isinstance(inner, dict) else value
+    return {"value": value}
+
+
+def move_fields(content):
+    if not content or content.get("dataType") != "moveObject":
+        raise ValueError("Expected moveObject content")
+    if not content.get("fields"):
+        raise ValueError("Missing fields in moveObject")
+    return _unwrap(content["fields"])
+
+
+def parse_policy(raw):
+    f = _unwrap(raw)
+    return {
+        "maxBudget": int(f.get("max_budget") or 0),
+        "maxPerTx": int(f.get("max_per_tx") or 0),
+        "allowedActions": [int(a) for a in f.get("allowed_actions") or []],
+        "cooldownMs": int(f.get("cooldown_ms") or 0),
+        "expiresAt": int(f.get("expires_at") or 0),
+    }
+
+
+def parse_vault(object_id, fields):
+    return {
+        "id": object_id,
+        "owner": fields.get("owner"),
+        "balance": int(_unwrap(fields.get("balance_sui")).get("value") or 0),
+        "policy": parse_policy(fields.get("policy")),
+        "authorizedCaps": list(fields.get("authorized_caps") or []),
+        "totalSpent": int(fields.get("total_spent") or 0),
+        "lastTxTime": int(fields.get("last_tx_time") or 0),
+        "txCount": int(fields.get("tx_count") or 0),
+    }
+
+
+def parse_withdrawal(event):
+    p = event["parsedJson"]
+    return {
+        "txDigest": event["id"]["txDigest"],
+        "amount": int(p["amount"]),
+        "actionType": int(p["action_type"]),
+        "totalSpent": int(p["total_spent"]),
+        "remainingBudget": int(p["remaining_budget"]),
+        "txCount": int(p["tx_count"]),
+        "timestamp": int(p["timestamp"]),
+    }
+
+
+def _cap_vault_id(fields):
+    vault_id = fields.get("vault_id")
+    return vault_id.get("id", str(vault_id)) if isinstance(vault_id, dict) else str(vault_id)
+
+
+# ============================================================
+# Fetching
+# ============================================================
+def _observe(future):
+    if not future.cancelled():
+        future.exception()
+
+
+async def _settled(awaitable):
+    """``(result, None)``, or ``(None, exception)`` when ``awaitable`` fails."""
+    try:
+        return await awaitable, None
+    except Exception as e:
+        return None, e
+
+
+class TTLCache:
+    """Values (or futures of values) that expire ``ttl`` seconds after they are put."""
+
+    def __init__(self, ttl=DEFAULT_TTL, clock=time.monotonic):
+        self.ttl = ttl
+        self._clock = clock
+        self._items = {}
+
+    def get(self, key):
+        item = self._items.get(key)
+        if item is None:
+            return None
+        expires, value = item
+        if expires <= self._clock():
+            del self._items[key]
+            return None
+        return value
+
+    def put(self, key, value):
+        self._items[key] = (self._clock() + self.ttl, value)
+
+    def discard(self, key):
+        self._items.pop(key, None)
+
+
+class VaultSource:
+    def __init__(self, client, package_id=PACKAGE_ID, ttl=DEFAULT_TTL):
+        self.client = client
+        self.package_id = package_id
+        self._objects = TTLCache(ttl)  # vault id -> future of the vault dict (None: not a vault)
+        self._pages = TTLCache(ttl)  # event cursor -> suix_queryEvents page
+        self._tasks = set()
+
+    @property
+    def vault_type(self):
+        return f"{self.package_id}::{MODULE_NAME}::Vault"
+
+    def vaults(self, ids):
+        """``{id: future}`` for ``ids``; uncached ids are fetched in concurrent batches."""
+        loop = asyncio.get_running_loop()
+        futures, missing = {}, []
+        for vault_id in dict.fromkeys(ids):
+            future = self._objects.get(vault_id)
+            if future is None:
+                future = loop.create_future()
+                future.add_done_callback(_observe)  # a failed scan may never await it
+                self._objects.put(vault_id, future)
+                missing.append(vault_id)
+            futures[vault_id] = future
+        for start in range(0, len(missing), OBJECT_BATCH):
+            batch = {i: futures[i] for i in missing[start:start + OBJECT_BATCH]}
+            task = asyncio.ensure_future(self._fetch_objects(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return futures
+
+    async def _fetch_objects(self, futures):
+        try:
+            responses = await self.client.call("sui_multiGetObjects",
+                                               [list(futures), _OBJECT_OPTIONS])
+        except Exception as e:
+            for vault_id, future in futures.items():
+                self._objects.discard(vault_id)
+                future.set_exception(e)
+            return
+        for vault_id, response in zip(futures, responses):
+            data = response.get("data") or {}
+            content = data.get("content")
+            try:
+                vault = (parse_vault(data.get("objectId", vault_id), move_fields(content))
+                         if content and str(content.get("type", "")).startswith(self.vault_type)
+                         else None)
+            except (ValueError, TypeError) as e:
+                self._objects.discard(vault_id)
+                futures[vault_id].set_exception(ValueError(f"{vault_id}: {e}"))
+                continue
+            futures[vault_id].set_result(vault)
+
+    async def get_vault(self, vault_id):
+        """One vault dict, or None when ``vault_id`` is not a vault of this package."""
+        return await self.vaults([vault_id])[vault_id]
+
+    async def owned_vault_ids(self, owner):
+        """Ids of the vaults ``owner`` holds an OwnerCap for (``getOwnedVaults``)."""
+        query = {"filter": {"StructType": f"{self.package_id}::{MODULE_NAME}::OwnerCap"},
+                 "options": {"showContent": True}}
+        ids, cursor = [], None
+        while True:
+            page = await self.client.call("suix_getOwnedObjects", [owner, query, cursor, None])
+            for item in page["data"]:
+                content = (item.get("data") or {}).get("content")
+                if content:
+                    ids.append(_cap_vault_id(move_fields(content)))
+            if not page.get("hasNextPage"):
+                return ids
+            cursor = page["nextCursor"]
+
+    async def _withdrawal_pages(self, max_pages):
+        query = {"MoveEventType": f"{self.package_id}::{MODULE_NAME}::AgentWithdrawal"}
+        cursor = None
+        for _ in range(max_pages):
+            key = repr(cursor)
+            page = self._pages.get(key)
+            if page is None:
+                page = await self.client.call("suix_queryEvents", [query, cursor, EVENT_PAGE, True])
+                self._pages.put(key, page)
+            yield page["data"]
+            if not page.get("hasNextPage"):
+                return
+            cursor = page["nextCursor"]
+
+    async def reports(self, ids, limit=RECENT_EVENTS, max_pages=MAX_EVENT_PAGES):
+        """Yield ``(vault_id, vault or None, withdrawals, error)`` as each vault becomes complete.
+
+        Withdrawals are the vault's ``limit`` most recent, newest first, from
+        at most ``max_pages`` pages of events across all vaults. A vault is
+        complete once it has ``limit`` of them or the scan has ended. ``error``
+        is the exception that fetching the vault raised (``vault`` is then
+        None), else None.
+        """
+        futures = self.vaults(ids)
+        events = {vault_id: [] for vault_id in futures}
+        waiting = dict.fromkeys(futures)
+        if not waiting:
+            return
+        async for page in self._withdrawal_pages(max_pages):
+            for event in page:
+                found = events.get(event["parsedJson"].get("vault_id"))
+                if found is not None and len(found) < limit:
+                    found.append(parse_withdrawal(event))
+            for vault_id in [i for i in waiting if len(events[i]) >= limit]:
+                del waiting[vault_id]
+                vault, error = await _settled(futures[vault_id])
+                yield vault_id, vault, events[vault_id], error
+            if not waiting:
+                return
+        for vault_id in waiting:
+            vault, error = await _settled(futures[vault_id])
+            yield vault_id, vault, events[vault_id], error
+
+
+# ============================================================
+# Rendering
+# ============================================================
+async def _tagged(key, future):
+    return key, *await _settled(future)
+
+
+async def render_reports(source, ids, out_dir, workers=None, network="testnet",
+                         limit=RECENT_EVENTS, compression=DEFAULT_COMPRESSION, cache_dir=None):
+    """Render one report deck per vault while the remaining vaults are fetched.
+
+    Each deck is submitted as soon as its vault is complete. Yields
+    ``(vault_id, path or None, seconds, error)``: ids that are not vaults
+    (path and error None) and vaults that failed to fetch or lay out first,
+    then decks as they finish or fail. Decks render in a process pool of
+    ``workers`` (a thread when 1, which still overlaps with the network).
+    """
+    from .batch import _init_worker, _render_job
+    from .report import report_deck
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    render = partial(_render_job, cache_dir=cache_dir, compression=compression)
+    pool = (ThreadPoolExecutor(1, initializer=_init_worker) if workers == 1
+            else ProcessPoolExecutor(workers, initializer=_init_worker))
+    loop = asyncio.get_running_loop()
+    with pool:
+        pending = []
+        async for vault_id, vault, withdrawals, error in source.reports(ids, limit):
+            if vault is None:
+                yield vault_id, None, 0.0, error
+                continue
+            try:
+                spec = report_deck(vault, withdrawals, network)
+            except (KeyError, TypeError, ValueError) as e:
+                yield vault_id, None, 0.0, e
+                continue
+            job = (spec, out_dir / f"vault_{vault_id}.pptx")
+            pending.append(_tagged(vault_id, loop.run_in_executor(pool, render, job)))
+        for done in asyncio.as_completed(pending):
+            vault_id, result, error = await done
+            if error is not None:
+                yield vault_id, None, 0.0, error
+                continue
+            path, seconds, _ = result
+            yield vault_id, path, seconds, None
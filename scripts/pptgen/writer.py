@@ -0,0 +1,398 @@
+"""Streaming .pptx package writer.
+
+Serializes each part straight into a ZIP entry on the sink, so the deck is
+never assembled in memory first, and picks the compression per part: media
+that is already compressed is stored, XML gets a fast deflate by default.
+
+Sinks are anything with a binary ``write``: a file, ``sys.stdout.buffer``, a
+socket's ``makefile("wb")`` or a web framework's response stream. ZipFile
+handles unseekable sinks by writing sizes after each entry.
+
+With ``deterministic=True`` the same parts always give the same bytes, so
+packages can be cached and deduplicated by content:
+
+- every entry is dated ``SOURCE_DATE_EPOCH`` (1980-01-01 if unset) instead of
+  the current time;
+- the core properties' created/modified dates are set to that time and the
+  revision to 1; so are the properties of embedded chart workbooks;
+- the sink is written front to back without seeking, through ``HashingSink``,
+  so a file, stdout and a socket receive identical bytes and the writer's
+  ``etag`` (SHA-256 of the package) is known as soon as it is closed.
+
+Part order and relationship and shape ids already follow from the build
+order, which depends only on the spec. Output is identical for the same
+Python and zlib versions.
+"""
+import hashlib
+import io
+import os
+import re
+import sys
+import time
+import zipfile
+from contextlib import contextmanager
+from pathlib import Path
+
+from .profiling import traced
+
+XML_CONTENT = "xml"
+MEDIA_CONTENT = "media"
+OTHER_CONTENT = "other"
+
+# Already-compressed payloads; deflating them again costs CPU and saves nothing.
+_MEDIA_TYPES = {
+    "image/png", "image/jpeg", "image/gif", "image/webp",
+    "video/mp4", "video/quicktime", "audio/mpeg",
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",  # chart workbooks
+}
+
+# kind -> (compress_type, compresslevel)
+COMPRESSION_PRESETS = {
+    "fast": {
+        XML_CONTENT: (zipfile.ZIP_DEFLATED, 1),
+        MEDIA_CONTENT: (zipfile.ZIP_STORED, None),
+        OTHER_CONTENT: (zipfile.ZIP_DEFLATED, 1),
+    },
+    # What Presentation.save() does.
+    "default": {
+        XML_CONTENT: (zipfile.ZIP_DEFLATED, 6),
+        MEDIA_CONTENT: (zipfile.ZIP_DEFLATED, 6),
+        OTHER_CONTENT: (zipfile.ZIP_DEFLATED, 6),
+    },
+    "small": {
+        XML_CONTENT: (zipfile.ZIP_DEFLATED, 9),
+        MEDIA_CONTENT: (zipfile.ZIP_DEFLATED, 9),
+        OTHER_CONTENT: (zipfile.ZIP_DEFLATED, 9),
+    },
+    "store": {
+        XML_CONTENT: (zipfile.ZIP_STORED, None),
+        MEDIA_CONTENT: (zipfile.ZIP_STORED, None),
+        OTHER_CONTENT: (zipfile.ZIP_STORED, None),
+    },
+}
+DEFAULT_COMPRESSION = "fast"
+
+EPOCH_DATE_TIME = (1980, 1, 1, 0, 0, 0)  # earliest date a ZIP entry can carry
+CORE_PROPERTIES = "docProps/core.xml"
+_CORE_DATES = re.compile(rb"(<dcterms:(created|modified)\b[^>]*>)[^<]*(</dcterms:\2>)")
+_REVISION = re.compile(rb"<cp:revision>[^<]*</cp:revision>")
+
+
+def content_kind(content_type):
+    if content_type in _MEDIA_TYPES:
+        return MEDIA_CONTENT
+    if content_type.endswith("xml"):
+        return XML_CONTENT
+    return OTHER_CONTENT
+
+
+# ============================================================
+# Deterministic output
+# ============================================================
+def fixed_date_time():
+    """Entry date for deterministic packages: ``SOURCE_DATE_EPOCH`` (UTC) or 1980-01-01."""
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if not epoch:
+        return EPOCH_DATE_TIME
+    return max(time.gmtime(int(epoch))[:6], EPOCH_DATE_TIME)
+
+
+def normalize_core_properties(blob, date_time):
+    stamp = ("%04d-%02d-%02dT%02d:%02d:%02dZ" % date_time).encode()
+    blob = _CORE_DATES.sub(lambda m: m.group(1) + stamp + m.group(3), blob)
+    return _REVISION.sub(b"<cp:revision>1</cp:revision>", blob)
+
+
+def normalize_workbook(blob, date_time):
+    """Re-zip an embedded .xlsx with fixed entry dates and core properties."""
+    out = io.BytesIO()
+    with zipfile.ZipFile(io.BytesIO(blob)) as src, zipfile.ZipFile(out, "w") as dst:
+        for item in src.infolist():
+            data = src.read(item)
+            if item.filename == CORE_PROPERTIES:
+                data = normalize_core_properties(data, date_time)
+            info = zipfile.ZipInfo(item.filename, date_time)
+            info.compress_type = item.compress_type
+            info.external_attr = item.external_attr
+            dst.writestr(info, data)
+    return out.getvalue()
+
+
+class HashingSink:
+    """Pass writes through to ``sink`` while hashing them with SHA-256.
+
+    It has no ``seek``/``tell`` on purpose: ZipFile then writes every entry
+    once, front to back, and the hash covers exactly the bytes sent.
+    """
+
+    def __init__(self, sink):
+        self._sink = sink
+        self._hash = hashlib.sha256()
+
+    def write(self, data):
+        self._hash.update(data)
+        return self._sink.write(data)
+
+    def flush(self):
+        self._sink.flush()
+
+    def hexdigest(self):
+        return self._hash.hexdigest()
+
+
+class PackageStreamWriter:
+    """Write ZIP entries to an open binary sink with per-kind compression."""
+
+    def __init__(self, sink, compression=DEFAULT_COMPRESSION, deterministic=False):
+        if isinstance(compression, str):
+            try:
+                compression = COMPRESSION_PRESETS[compression]
+            except KeyError:
+                raise ValueError(f"Unknown compression preset: {compression!r}") from None
+        self._policy = compression
+        self.deterministic = deterministic
+        if deterministic:
+            sink = self._hashing = HashingSink(sink)
+            self._date_time = fixed_date_time()
+        else:
+            self._hashing = None
+            self._date_time = time.localtime(time.time())[:6]
+        self._zipf = zipfile.ZipFile(sink, "w", strict_timestamps=False)
+
+    @property
+    def etag(self):
+        """SHA-256 hex digest of the package once closed; None unless deterministic."""
+        return self._hashing.hexdigest() if self._hashing else None
+
+    def _info(self, membername, kind):
+        compress_type, level = self._policy[kind]
+        info = zipfile.ZipInfo(membername, self._date_time)
+        info.compress_type = compress_type
+        info.external_attr = 0o600 << 16
+        if self.deterministic:
+            info.create_system = 3  # ZipInfo defaults to 0 on Windows
+        info._compresslevel = level  # what writestr() does with its compresslevel
+        return info
+
+    def write(self, membername, blob, kind=XML_CONTENT):
+        if self.deterministic:
+            if membername == CORE_PROPERTIES:
+                blob = normalize_core_properties(blob, self._date_time)
+            elif membername.endswith(".xlsx"):
+                blob = normalize_workbook(blob, self._date_time)
+        self._zipf.writestr(self._info(membername, kind), blob)
+
+    def write_chunks(self, membername, chunks, kind=XML_CONTENT):
+        """Write one entry from an iterable of byte strings, holding one at a time."""
+        with self._zipf.open(self._info(membername, kind), "w") as entry:
+            for chunk in chunks:
+                entry.write(chunk)
+
+    def close(self):
+        self._zipf.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+@traced("save")
+def write_package(prs, sink, compression=DEFAULT_COMPRESSION, deterministic=False):
+    """Stream ``prs`` as a .pptx package to the binary file-like ``sink``.
+
+    Entry order and content match ``Presentation.save``. Returns the
+    package's SHA-256 when ``deterministic``, else None.
+    """
+    from pptx.opc.oxml import serialize_part_xml
+    from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+    from pptx.opc.serialized import _ContentTypesItem
+
+    package = prs.part.package
+    parts = tuple(package.iter_parts())
+    with PackageStreamWriter(sink, compression, deterministic) as writer:
+        writer.write(CONTENT_TYPES_URI.membername,
+                     serialize_part_xml(_ContentTypesItem.xml_for(parts)))
+        writer.write(PACKAGE_URI.rels_uri.membername, package._rels.xml)
+        for part in parts:
+            writer.write(part.partname.membername, part.blob, content_kind(part.content_type))
+            if part._rels:
+                writer.write(part.partname.rels_uri.membername, part.rels.xml)
+    return writer.etag
+
+
+class SlideStreamWriter:
+    """Write each slide of ``prs`` into the package as soon as it is finished.
+
+    ``add(slide)`` serializes the slide and any media it introduces, then
+    detaches the slide from ``prs`` so its XML can be freed; ``close()`` writes
+    the remaining parts. The entries that list every slide (the presentation's
+    ``sldIdLst`` and rels, and ``[Content_Types].xml``) are generated in chunks
+    at the end, so memory does not grow with the slide count. Media is
+    deduplicated by SHA-1, like python-pptx does within a package. Charts are
+    written with their embedded workbooks and numbered in the order they arrive.
+    """
+
+    def __init__(self, prs, sink, compression=DEFAULT_COMPRESSION, deterministic=False):
+        self._prs = prs
+        self._writer = PackageStreamWriter(sink, compression, deterministic)
+        self._media = {}  # sha1 -> the image part written for that content
+        self.count = 0
+        self.charts = 0
+
+    @property
+    def etag(self):
+        return self._writer.etag
+
+    def add(self, slide):
+        from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+        from pptx.opc.packuri import PackURI
+
+        self.count += 1
+        part = slide.part
+        part.partname = PackURI(f"/ppt/slides/slide{self.count}.xml")
+        for rel in part.rels.values():
+            if not rel.is_external and rel.reltype == RT.CHART:
+                self._add_chart(rel.target_part)
+            if rel.is_external or rel.reltype != RT.IMAGE:
+                continue
+            image = rel.target_part
+            written = self._media.get(image.sha1)
+            if written is None:
+                image.partname = PackURI(
+                    f"/ppt/media/image{len(self._media) + 1}.{image.partname.ext}")
+                self._writer.write(image.partname.membername, image.blob,
+                                   content_kind(image.content_type))
+                self._media[image.sha1] = image
+            elif written is not image:
+                image.partname = written.partname  # point the slide at the stored copy
+        self._writer.write(part.partname.membername, part.blob)
+        self._writer.write(part.partname.rels_uri.membername, part.rels.xml)
+
+        sld_id_lst = self._prs.slides._sldIdLst
+        sld_id = next(i for i in sld_id_lst if self._prs.part.related_part(i.rId) is part)
+        sld_id_lst.remove(sld_id)
+        self._prs.part.drop_rel(sld_id.rId)
+
+    def _add_chart(self, chart):
+        from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+        from pptx.opc.packuri import PackURI
+
+        self.charts += 1
+        chart.partname = PackURI(f"/ppt/charts/chart{self.charts}.xml")
+        for rel in chart.rels.values():
+            if not rel.is_external and rel.reltype == RT.PACKAGE:
+                workbook = rel.target_part
+                workbook.partname = PackURI(
+                    f"/ppt/embeddings/Microsoft_Excel_Sheet{self.charts}.xlsx")
+                self._writer.write(workbook.partname.membername, workbook.blob,
+                                   content_kind(workbook.content_type))
+        self._writer.write(chart.partname.membername, chart.blob)
+        self._writer.write(chart.partname.rels_uri.membername, chart.rels.xml)
+
+    def close(self):
+        from itertools import chain
+
+        from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+        from pptx.opc.oxml import serialize_part_xml
+        from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+        from pptx.opc.serialized import _ContentTypesItem
+
+        package = self._prs.part.package
+        pres = self._prs.part
+        parts = tuple(package.iter_parts())
+        numbers = range(1, self.count + 1)
+        first_rid = 1 + max(int(rId[3:]) for rId in pres.rels if rId[3:].isdigit())
+
+        types = _ContentTypesItem.xml_for(parts + tuple(self._media.values()))
+        self._write_split(CONTENT_TYPES_URI.membername, serialize_part_xml(types), b"</Types>", chain(
+            (f'<Override PartName="/ppt/slides/slide{n}.xml" ContentType="{CT.PML_SLIDE}"/>'
+             for n in numbers),
+            (f'<Override PartName="/ppt/charts/chart{n}.xml" ContentType="{CT.DML_CHART}"/>'
+             f'<Override PartName="/ppt/embeddings/Microsoft_Excel_Sheet{n}.xlsx" '
+             f'ContentType="{CT.SML_SHEET}"/>' for n in range(1, self.charts + 1))))
+        self._writer.write(PACKAGE_URI.rels_uri.membername, package._rels.xml)
+        for part in parts:
+            if part is pres and self.count:
+                self._write_split(part.partname.membername, part.blob, b"<p:sldIdLst/>", (
+                    f'<p:sldId id="{255 + n}" r:id="rId{first_rid + n - 1}"/>'
+                    for n in numbers), opening=b"<p:sldIdLst>", closing=b"</p:sldIdLst>")
+                self._write_split(part.partname.rels_uri.membername, part.rels.xml,
+                                  b"</Relationships>", (
+                    f'<Relationship Id="rId{first_rid + n - 1}" Type="{RT.SLIDE}" '
+                    f'Target="slides/slide{n}.xml"/>' for n in numbers))
+                continue
+            self._writer.write(part.partname.membername, part.blob, content_kind(part.content_type))
+            if part._rels:
+                self._writer.write(part.partname.rels_uri.membername, part.rels.xml)
+        self._writer.close()
+
+    def _write_split(self, membername, blob, marker, items, opening=b"", closing=None):
+        """Write ``blob`` with ``marker`` replaced by ``opening + items + closing``.
+
+        ``closing`` defaults to ``marker`` itself, for inserting before a closing tag.
+        """
+        head, found, tail = blob.partition(marker)
+        if not found:
+            raise ValueError(f"{membername}: no {marker.decode()} to insert slides at")
+
+        def chunks(batch=1024):
+            yield head + opening
+            buf = []
+            for item in items:
+                buf.append(item)
+                if len(buf) == batch:
+                    yield "".join(buf).encode()
+                    buf = []
+            yield "".join(buf).encode() + (marker if closing is None else closing) + tail
+
+        self._writer.write_chunks(membername, chunks())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.close()
+        else:  # leave an obviously broken package rather than a silently short one
+            self._writer.close()
+
+
+# ============================================================
+# Sinks
+# ============================================================
+def is_file_target(target):
+    return not (str(target) == "-" or str(target).startswith(("tcp://", "unix:")))
+
+
+@contextmanager
+def open_sink(target):
+    """Open an output target for binary writing.
+
+    ``-`` is stdout, ``tcp://host:port`` and ``unix:/path`` connect a socket,
+    anything else is a file path. File-like objects are passed through.
+    """
+    if hasattr(target, "write"):
+        yield target
+        return
+
+    target = str(target)
+    if target == "-":
+        out = sys.stdout.buffer
+        yield out
+        out.flush()
+    elif target.startswith(("tcp://", "unix:")):
+        import socket
+
+        if target.startswith("tcp://"):
+            host, _, port = target[len("tcp://"):].rpartition(":")
+            sock = socket.create_connection((host, int(port)))
+        else:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.connect(target[len("unix:"):])
+        with sock, sock.makefile("wb") as out:
+            yield out
+    else:
+        with open(Path(target), "wb") as out:
+            yield out
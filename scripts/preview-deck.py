@@ -0,0 +1,120 @@
+"""Render PNG previews and a contact sheet of a deck without an office suite.
+
+Usage:
+    python scripts/preview-deck.py                          # default deck -> contact sheet
+    python scripts/preview-deck.py deck.pptx --sheet sheet.png
+    python scripts/preview-deck.py deck.pptx --out-dir previews/ --width 1920
+    python scripts/preview-deck.py deck.json --compare previews/   # visual regression
+
+Input is a built .pptx or a deck spec (rendered in memory, without the slide
+cache). Slides are rasterized by ``pptgen/preview.py``, one per worker process.
+``--out-dir`` writes ``slide-NN.png`` files; ``--compare`` renders at the size
+of the reference ``slide-NN.png`` files in a directory and exits 1 if any
+slide differs by more than ``--tolerance`` (mean absolute pixel difference,
+0-1) or is missing.
+"""
+import argparse
+import io
+import sys
+import time
+from pathlib import Path
+
+from pptgen import DEFAULT_SPEC
+
+
+def load_pptx(path):
+    if path.suffix == ".pptx":
+        return path
+    from pptgen import build_deck, load_spec
+
+    buf = io.BytesIO()
+    build_deck(load_spec(path), buf, compression="store")
+    buf.seek(0)
+    return buf
+
+
+def compare(images, ref_dir, tolerance):
+    import numpy as np
+    from PIL import Image
+
+    failures = []
+    for number, image in enumerate(images, 1):
+        ref_path = ref_dir / f"slide-{number:02d}.png"
+        if not ref_path.exists():
+            failures.append(f"slide {number}: no reference {ref_path}")
+            continue
+        with Image.open(ref_path) as ref:
+            ref = np.asarray(ref.convert("RGB"), dtype=np.int16)
+        if ref.shape[:2] != (image.height, image.width):
+            failures.append(f"slide {number}: size {image.size} != reference "
+                            f"{ref.shape[1::-1]}")
+            continue
+        diff = np.abs(np.asarray(image, dtype=np.int16) - ref).mean() / 255
+        if diff > tolerance:
+            failures.append(f"slide {number}: differs by {diff:.4f} (tolerance {tolerance})")
+    extra = len(list(ref_dir.glob("slide-*.png"))) - len(images)
+    if extra > 0:
+        failures.append(f"{extra} reference slide(s) beyond the deck's {len(images)}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input", nargs="?", type=Path, default=DEFAULT_SPEC,
+                        help="deck spec JSON or .pptx (default: the Suistody deck)")
+    parser.add_argument("--sheet", type=Path,
+                        help="contact sheet PNG (default: <name>-sheet.png unless "
+                             "--out-dir or --compare is given)")
+    parser.add_argument("--out-dir", type=Path, help="write slide-NN.png files here")
+    parser.add_argument("--width", type=int, default=1280,
+                        help="slide preview width in pixels (default: 1280)")
+    parser.add_argument("--columns", type=int, default=4, help="contact sheet columns")
+    parser.add_argument("--compare", type=Path, metavar="REF_DIR",
+                        help="compare against reference slide-NN.png files")
+    parser.add_argument("--tolerance", type=float, default=0.01,
+                        help="allowed mean pixel difference for --compare (default: 0.01)")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    from pptgen.preview import contact_sheet, render_previews
+
+    if not (args.sheet or args.out_dir or args.compare):
+        args.sheet = Path(f"{args.input.stem}-sheet.png")
+    width = args.width
+    if args.compare:
+        refs = sorted(args.compare.glob("slide-*.png"))
+        if not refs:
+            print(f"[ERROR] No slide-NN.png references in {args.compare}", file=sys.stderr)
+            return 2
+        from PIL import Image
+
+        with Image.open(refs[0]) as ref:
+            width = ref.width
+    elif not args.out_dir:
+        width = 320  # only the contact sheet is needed
+
+    start = time.perf_counter()
+    images = render_previews(load_pptx(args.input), width, args.jobs)
+    if args.out_dir:
+        args.out_dir.mkdir(parents=True, exist_ok=True)
+        for number, image in enumerate(images, 1):
+            image.save(args.out_dir / f"slide-{number:02d}.png")
+        print(f"[OK] {len(images)} previews written to {args.out_dir}")
+    if args.sheet:
+        contact_sheet(images, args.columns).save(args.sheet)
+        print(f"[OK] Contact sheet saved to {args.sheet}")
+    print(f"[OK] {len(images)} slides rendered in {time.perf_counter() - start:.2f}s")
+
+    if args.compare:
+        failures = compare(images, args.compare, args.tolerance)
+        for line in failures:
+            print(f"[FAIL] {line}")
+        if failures:
+            return 1
+        print(f"[OK] All slides match {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+import io
+import re
+import zipfile
+
+from pptgen import DEFAULT_SPEC, load_spec
+from pptgen.diff import _moved, diff_decks, read_deck
+from pptgen.optimize import optimize_package
+from pptgen.render import build_deck
+
+_INCH = 914400
+
+
+def test_unchanged_axis_is_left_out():
+    assert _moved((0, 0, 10, 10, ""), (_INCH, 0, 10, 10, "")) == "x +1.00in"
+    assert _moved((0, 0, 10, 10, ""), (0, -_INCH // 2, 10, 10, "")) == "y -0.50in"
+
+
+def test_both_axes_and_size():
+    assert (_moved((0, 0, _INCH, _INCH, ""), (_INCH, 100, 2 * _INCH, _INCH, ""))
+            == "x +1.00in, y +100 EMU; size 1.00x1.00in -> 2.00x1.00in")
+
+
+def _rewrite(blob, edit):
+    """``blob`` with ``edit`` applied to the first slide it changes, and that slide's name."""
+    src, out = zipfile.ZipFile(io.BytesIO(blob)), io.BytesIO()
+    changed = None
+    with zipfile.ZipFile(out, "w") as dst:
+        for info in src.infolist():
+            data = src.read(info)
+            if changed is None and info.filename.startswith("ppt/slides/slide"):
+                new = edit(data)
+                if new != data:
+                    changed, data = info.filename, new
+            dst.writestr(info, data)
+    return out.getvalue(), changed
+
+
+def test_optimized_copy_is_unchanged():
+    before, after = io.BytesIO(), io.BytesIO()
+    build_deck(load_spec(DEFAULT_SPEC), before)
+    optimize_package(before.getvalue(), after)
+    old = read_deck(before.getvalue())
+    assert diff_decks(old, read_deck(after.getvalue())) == []
+
+    # A hoisted size still counts: changing it is a restyle.
+    lvl1_sz = re.compile(rb'(<a:lvl1pPr[^>]*><a:defRPr[^>]*? sz=")(\d+)"')
+    edited, name = _rewrite(after.getvalue(),
+                            lambda xml: lvl1_sz.sub(lambda m: m[1] + b'999"', xml, 1))
+    assert name
+    changes = diff_decks(old, read_deck(edited))
+    assert len(changes) == 1 and "text style" in str(changes[0])
@@ -0,0 +1,38 @@
+import io
+
+from PIL import Image
+
+from pptgen.images import LRUCache, process_image
+
+
+def _jpeg(size, orientation=None):
+    im = Image.new("RGB", size, "red")
+    exif = Image.Exif()
+    if orientation:
+        exif[0x0112] = orientation
+    out = io.BytesIO()
+    im.save(out, "JPEG", exif=exif)
+    return out.getvalue()
+
+
+def test_exif_orientation_is_applied():
+    blob = process_image(_jpeg((40, 20), orientation=6), (100, 100))
+    with Image.open(io.BytesIO(blob)) as im:
+        assert im.size == (20, 40)
+        assert im.getexif().get(0x0112, 1) == 1
+
+
+def test_upright_image_is_resized():
+    blob = process_image(_jpeg((400, 200)), (100, 100))
+    with Image.open(io.BytesIO(blob)) as im:
+        assert im.size == (100, 50)
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(10, len)
+    cache.put("a", b"1234")
+    cache.put("b", b"1234")
+    cache.get("a")
+    cache.put("c", b"1234")
+    assert "a" in cache and "c" in cache and "b" not in cache
+    assert cache.total == 8
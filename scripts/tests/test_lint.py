@@ -0,0 +1,23 @@
+from pptgen import render_deck
+from pptgen.lint import lint, shape_boxes
+from pptgen.spec import DeckSpec
+
+_PANELS = {"layout": "panels", "title": "PANELS", "items": [
+    {"heading": "Left", "color": "AMBER", "lines": ["one"]},
+    {"heading": "Right", "color": "GREEN", "lines": ["two"]}]}
+
+
+def _deck(**options):
+    return render_deck(DeckSpec.from_dict({"name": "t", "slides": [{**_PANELS, "options": options}]}))
+
+
+def test_title_placeholder_and_layout_shapes_are_linted():
+    names, boxes, has_text = shape_boxes(_deck().slides[0])
+    assert names[:2] == ["Accent Line", "Title 1"]
+    assert has_text[1] and not has_text[0]
+
+
+def test_card_over_the_title_is_reported():
+    assert lint(_deck()) == []
+    issues = lint(_deck(top=1.0))
+    assert any("Title 1" in issue.shapes for issue in issues)
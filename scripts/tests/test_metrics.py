@@ -0,0 +1,64 @@
+from pptx import Presentation
+from pptx.enum.text import MSO_AUTO_SIZE
+from pptx.util import Inches, Pt
+
+from pptgen import render_deck
+from pptgen.metrics import SLIDE_EDGE, check_overflow, text_boxes
+from pptgen.spec import DeckSpec
+
+_LONG = "a paragraph far too long to fit on one line of a two inch box"
+
+
+def _boxes(auto_size, below=None):
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    frame = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(2), Inches(0.3)).text_frame
+    frame.word_wrap = True
+    frame.auto_size = auto_size
+    frame.text = _LONG
+    frame.paragraphs[0].runs[0].font.size = Pt(18)
+    if below is not None:
+        slide.shapes.add_textbox(Inches(1), below, Inches(2), Inches(0.3)).text_frame.text = "x"
+    return list(text_boxes(prs))
+
+
+def test_fixed_box_overflows():
+    (box, over_y, over_x, _), = check_overflow(_boxes(MSO_AUTO_SIZE.NONE))
+    assert not box.grows
+    assert over_y > 0 and over_x <= 0
+
+
+def test_growing_box_can_grow_down_to_the_slide_edge():
+    boxes = _boxes(MSO_AUTO_SIZE.SHAPE_TO_FIT_TEXT)
+    assert boxes[0].grows and boxes[0].bound == SLIDE_EDGE
+    assert check_overflow(boxes) == []
+
+
+def test_growing_box_overflows_into_the_shape_below():
+    (box, over_y, _, scale), = check_overflow(_boxes(MSO_AUTO_SIZE.SHAPE_TO_FIT_TEXT,
+                                                     below=Inches(1.4)))
+    assert box.bound == "the top of 'TextBox 2'" and box.height == Inches(0.4)
+    assert over_y > 0 and scale < 1
+
+
+def test_tolerance():
+    boxes = _boxes(MSO_AUTO_SIZE.NONE)
+    (_, over_y, _, _), = check_overflow(boxes)
+    assert check_overflow(boxes, tolerance=over_y) == []
+
+
+def test_overlong_add_text_is_reported():
+    desc = " ".join(["word"] * 200)
+    spec = DeckSpec.from_dict({"name": "t", "slides": [{
+        "layout": "features", "title": "FEATURES",
+        "items": [["One", desc, "ACCENT"], ["Two", "short", "GREEN"]]}]})
+    report = check_overflow(list(text_boxes(render_deck(spec))))
+    assert [(box.paragraphs[0].text, box.bound) for box, *_ in report] == [(desc, "the top of 'TextBox 7'")]
+
+
+def test_overlong_quote_is_reported_against_its_card():
+    spec = DeckSpec.from_dict({"name": "t", "slides": [{
+        "layout": "vision_grid", "title": "VISION", "subtitle": "s",
+        "options": {"quote": " ".join(["unlimited"] * 40)}}]})
+    (box, over_y, _, _), = check_overflow(list(text_boxes(render_deck(spec))))
+    assert box.bound == "the bottom of 'Rounded Rectangle 3'" and over_y > 0
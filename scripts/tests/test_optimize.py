@@ -0,0 +1,78 @@
+import io
+import re
+import zipfile
+
+from lxml import etree
+from pptx import Presentation
+
+from pptgen import DEFAULT_SPEC, load_spec
+from pptgen.metrics import text_boxes
+from pptgen.optimize import _strip_inherited, optimize_package
+from pptgen.render import build_deck
+from pptgen.spec import DeckSpec
+
+_A = "http://schemas.openxmlformats.org/drawingml/2006/main"
+
+
+def _ppr(attrs=""):
+    return etree.fromstring(f'<a:pPr xmlns:a="{_A}" {attrs}><a:defRPr sz="1800"/></a:pPr>')
+
+
+def test_strip_without_algn_on_either_side():
+    ppr = _ppr()
+    _strip_inherited(ppr, {"sz": "1800"})
+    assert "algn" not in ppr.attrib
+    assert ppr.find(f"{{{_A}}}defRPr") is None
+
+
+def test_strip_keeps_algn_that_differs():
+    ppr = _ppr('algn="ctr"')
+    _strip_inherited(ppr, {})
+    assert ppr.get("algn") == "ctr"
+
+
+def test_strip_drops_inherited_algn():
+    ppr = _ppr('algn="l"')
+    _strip_inherited(ppr, {"algn": "l"})
+    assert "algn" not in ppr.attrib
+
+
+def _optimized_pair(spec):
+    before, after = io.BytesIO(), io.BytesIO()
+    build_deck(spec, before)
+    optimize_package(before.getvalue(), after)
+    return before.getvalue(), after.getvalue()
+
+
+def _paragraphs(blob):
+    return [(box.slide, box.name, para) for box in text_boxes(Presentation(io.BytesIO(blob)))
+            for para in box.paragraphs]
+
+
+def _slides_with_lvl1(blob):
+    with zipfile.ZipFile(io.BytesIO(blob)) as zf:
+        return [n for n in zf.namelist()
+                if n.startswith("ppt/slides/slide") and b"<a:lvl1pPr" in zf.read(n)]
+
+
+def test_unused_parts_are_dropped():
+    spec = DeckSpec.from_dict({"name": "t", "slides": [
+        {"layout": "features", "title": "ONE", "items": [["A", "a", "ACCENT"]]}]})
+    before, after = (zipfile.ZipFile(io.BytesIO(b)) for b in _optimized_pair(spec))
+    layout = re.compile(r"ppt/slideLayouts/[^/]+\.xml")
+    assert len(list(filter(layout.fullmatch, before.namelist()))) == 2
+    assert len(list(filter(layout.fullmatch, after.namelist()))) == 1
+    assert not [n for n in after.namelist() if "thumbnail" in n or "printerSettings" in n]
+
+    names = set(after.namelist())
+    types = etree.fromstring(after.read("[Content_Types].xml"))
+    overrides = [el.get("PartName")[1:] for el in types if el.tag.endswith("Override")]
+    assert overrides and all(name in names for name in overrides)
+    extensions = {name.rsplit(".", 1)[-1].lower() for name in names}
+    assert all(el.get("Extension") in extensions for el in types if el.tag.endswith("Default"))
+
+
+def test_effective_text_properties_survive():
+    before, after = _optimized_pair(load_spec(DEFAULT_SPEC))
+    assert not _slides_with_lvl1(before) and _slides_with_lvl1(after)  # _hoist ran
+    assert _paragraphs(after) == _paragraphs(before)
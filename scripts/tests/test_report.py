@@ -0,0 +1,18 @@
+from pptgen.report import report_deck
+
+_VAULT = {
+    "id": "0x" + "a" * 64, "owner": "0x" + "b" * 64, "balance": 10**9,
+    "policy": {"maxBudget": 5 * 10**9, "maxPerTx": 10**9, "allowedActions": [0, 1],
+               "cooldownMs": 60_000, "expiresAt": 1_800_000_000_000},
+    "authorizedCaps": [], "totalSpent": 10**8, "lastTxTime": 1_700_000_000_000, "txCount": 3,
+}
+
+
+def test_spec_does_not_change_with_the_clock():
+    now = 1_700_000_000_000
+    assert report_deck(_VAULT, [], now_ms=now) == report_deck(_VAULT, [], now_ms=now + 3_600_000)
+
+
+def test_expiry_still_follows_the_clock():
+    expired = report_deck(_VAULT, [], now_ms=1_900_000_000_000).slides[1].items[4]
+    assert expired[0] == "Expiration" and expired[1].startswith("Expired ")
@@ -0,0 +1,44 @@
+import http.client
+import json
+import threading
+
+import pytest
+
+from pptgen.server import RenderService, make_server
+
+
+@pytest.fixture(scope="module")
+def server():
+    service = RenderService(concurrency=1)
+    server = make_server(service, "127.0.0.1:0")
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    service.shutdown()
+
+
+def _post(server, length=None):
+    conn = http.client.HTTPConnection(*server.server_address, timeout=10)
+    conn.putrequest("POST", "/render")
+    if length is not None:
+        conn.putheader("Content-Length", length)
+    conn.endheaders()
+    response = conn.getresponse()
+    status, body = response.status, json.loads(response.read())
+    conn.close()
+    return status, body["error"]
+
+
+def test_missing_content_length(server):
+    assert _post(server) == (411, "Content-Length required")
+
+
+@pytest.mark.parametrize("length", ["abc", "-5"])
+def test_bad_content_length(server, length):
+    status, error = _post(server, length)
+    assert status == 400 and length in error
+
+
+def test_oversized_content_length(server):
+    assert _post(server, str(1 << 40)) == (413, "spec too large")
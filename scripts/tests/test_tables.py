@@ -0,0 +1,29 @@
+from pptx import Presentation
+from pptx.util import Inches
+
+from pptgen.tables import Column, TableStyle, add_table, row_heights
+
+_COLUMNS = [Column("{0}", Inches(4))]
+
+
+def _table(text):
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    add_table(slide, [(text, "ACCENT")], _COLUMNS, Inches(1), Inches(1), TableStyle(Inches(0.4)))
+    return next(shape for shape in slide.shapes if shape.has_table).table
+
+
+def test_vertical_tab_is_a_line_break():
+    cell = _table("first\vsecond").cell(1, 0)
+    assert cell.text == "first\vsecond"
+    assert len(cell.text_frame.paragraphs) == 1
+
+
+def test_control_characters_are_escaped():
+    cell = _table("a\x01b\x1fc & <d>").cell(1, 0)
+    assert cell.text == "a_x0001_b_x001F_c & <d>"
+
+
+def test_line_breaks_grow_the_row():
+    one, two = row_heights([("a",), ("a\vb",)], _COLUMNS, 0)
+    assert two > one
@@ -0,0 +1,27 @@
+import asyncio
+
+from pptgen.mocknode import MockChain, start_mock_node
+from pptgen.rpc import JsonRpcClient
+from pptgen.vaults import VaultSource, render_reports
+
+
+async def _render(url, ids, out_dir):
+    async with JsonRpcClient(url, 2) as client:
+        return [row async for row in render_reports(VaultSource(client), ids, out_dir, workers=1)]
+
+
+def test_one_bad_vault_does_not_stop_the_others(tmp_path):
+    chain = MockChain(3, withdrawals=2)
+    bad = chain.vault_ids[1]
+    chain.objects[bad]["content"]["fields"]["total_spent"] = "not a number"
+    node = start_mock_node(chain)
+    try:
+        rows = asyncio.run(_render(node.url, chain.vault_ids, tmp_path))
+    finally:
+        node.shutdown()
+    results = {vault_id: (path, error) for vault_id, path, _, error in rows}
+    assert set(results) == set(chain.vault_ids)
+    assert results[bad][0] is None and isinstance(results[bad][1], ValueError)
+    for vault_id in set(chain.vault_ids) - {bad}:
+        path, error = results[vault_id]
+        assert error is None and path.endswith(f"vault_{vault_id}.pptx")
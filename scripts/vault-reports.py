@@ -0,0 +1,119 @@
+"""Render one report deck per vault from live on-chain vault state.
+
+Usage:
+    python scripts/vault-reports.py 0xVAULT1 0xVAULT2 --out-dir reports/
+    python scripts/vault-reports.py --owner 0xADDRESS --network mainnet -j 4
+    python scripts/vault-reports.py --mock 200 --out-dir /tmp/reports
+    python scripts/vault-reports.py --mock 50 --mock-latency 0.05 --connections 4
+
+Vaults are read from a Sui full node's JSON-RPC API (``--rpc``, default the
+public fullnode of ``--network``) over a pool of ``--connections`` keep-alive
+connections, in batches of up to 50 objects; withdrawals come from one shared
+newest-first scan of ``AgentWithdrawal`` events. Each deck is rendered as soon
+as its vault and its ``--events`` most recent withdrawals are known, while the
+remaining vaults are still being fetched. A vault that cannot be read or
+rendered is listed as an error and the rest are still reported; the exit
+status is then 1.
+
+``--mock N`` serves N synthetic vaults from a local stand-in node instead
+(see ``pptgen/mocknode.py``); without ids or ``--owner`` every one of them is
+reported.
+"""
+import argparse
+import asyncio
+import sys
+import time
+
+from pptgen.writer import COMPRESSION_PRESETS, DEFAULT_COMPRESSION
+
+OUT_DIR = "vault-reports"
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("ids", nargs="*", help="vault object ids")
+    parser.add_argument("--owner", help="report every vault this address holds an OwnerCap for")
+    parser.add_argument("--network", default="testnet",
+                        help="Sui network for the default RPC URL and SuiScan links "
+                             "(default: testnet)")
+    parser.add_argument("--rpc", help="JSON-RPC URL (default: https://fullnode.<network>.sui.io:443)")
+    parser.add_argument("--package-id", help="agent_vault package id (default: NEXT_PUBLIC_PACKAGE_ID "
+                                             "or the deployed testnet package)")
+    parser.add_argument("--out-dir", default=OUT_DIR,
+                        help=f"directory for vault_<id>.pptx outputs (default: {OUT_DIR}/)")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="render worker processes (default: CPU count)")
+    parser.add_argument("--connections", type=int, default=8,
+                        help="RPC connections / requests in flight (default: 8)")
+    parser.add_argument("--ttl", type=float, default=30.0,
+                        help="seconds fetched vaults and event pages stay cached (default: 30)")
+    parser.add_argument("--events", type=int, default=50,
+                        help="recent withdrawals per vault (default: 50)")
+    parser.add_argument("--compression", choices=sorted(COMPRESSION_PRESETS),
+                        default=DEFAULT_COMPRESSION, help="ZIP compression preset")
+    parser.add_argument("--cache-dir", help="slide cache directory (default: no cache)")
+    parser.add_argument("--mock", type=int, metavar="N",
+                        help="serve N synthetic vaults from a local mock node instead")
+    parser.add_argument("--mock-latency", type=float, default=0.0,
+                        help="seconds the mock node waits before each response")
+    args = parser.parse_args(argv)
+    if args.mock is None and not args.ids and not args.owner:
+        parser.error("give vault ids, --owner or --mock N")
+    return args
+
+
+async def run(args, url, package_id, mock_ids):
+    from pptgen.rpc import JsonRpcClient, RpcError
+    from pptgen.vaults import VaultSource, render_reports
+
+    start = time.perf_counter()
+    async with JsonRpcClient(url, args.connections) as client:
+        source = VaultSource(client, package_id, args.ttl)
+        try:
+            ids = list(args.ids) if args.ids or args.owner else list(mock_ids)
+            if args.owner:
+                ids += await source.owned_vault_ids(args.owner)
+            done = failed = 0
+            async for vault_id, path, seconds, error in render_reports(
+                    source, ids, args.out_dir, args.jobs, args.network, args.events,
+                    args.compression, args.cache_dir):
+                if error is not None:
+                    failed += 1
+                    print(f"[ERROR] {vault_id}: {error or type(error).__name__}", file=sys.stderr)
+                    continue
+                if path is None:
+                    print(f"[WARN] {vault_id} is not an agent_vault Vault")
+                    continue
+                done += 1
+                print(f"[OK] Saved to {path} ({seconds * 1000:.0f} ms)")
+        except (OSError, asyncio.TimeoutError, RpcError, ValueError) as e:
+            print(f"[ERROR] {e or type(e).__name__}", file=sys.stderr)
+            return 1
+        print(f"[OK] {done} of {len(ids)} vaults reported in {time.perf_counter() - start:.2f}s "
+              f"({client.requests} RPC requests over {client.connects} connections)")
+        return 1 if failed else 0
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    from pptgen.vaults import PACKAGE_ID
+
+    url = args.rpc or f"https://fullnode.{args.network}.sui.io:443"
+    package_id = args.package_id or PACKAGE_ID
+    node, mock_ids = None, []
+    if args.mock is not None:
+        from pptgen.mocknode import MockChain, start_mock_node
+
+        chain = MockChain(args.mock, package_id=package_id)
+        node = start_mock_node(chain, latency=args.mock_latency)
+        url, mock_ids = node.url, chain.vault_ids
+
+    try:
+        return asyncio.run(run(args, url, package_id, mock_ids))
+    finally:
+        if node is not None:
+            node.shutdown()
+
+
+if __name__ == "__main__":
+    sys.exit(main())